@@ -56,6 +56,14 @@ locals {
       job_short_name     = "crp"
       job_container_args = "create_reports"
     }
+    archive_status_partitions = {
+      cron_expression = "0 2 * * *"
+      environment_variables = {
+        BLOB_CONTAINER_NAME = "notifications-status-archive"
+      }
+      job_short_name     = "asp"
+      job_container_args = "archive_status_partitions"
+    }
   }
 }
 
@@ -70,8 +78,8 @@ module "db_setup" {
 
   container_args = [
     var.seed_demo_data
-    ? "python manage.py migrate && python manage.py seed_demo_data --noinput && python manage.py create_personas"
-    : "python manage.py migrate"
+    ? "python manage.py migrate && python manage.py createcachetable && python manage.py seed_demo_data --noinput && python manage.py create_personas"
+    : "python manage.py migrate && python manage.py createcachetable"
   ]
   docker_image = var.docker_image
   user_assigned_identity_ids = flatten([
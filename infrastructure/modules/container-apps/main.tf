@@ -38,7 +38,8 @@ module "webapp" {
   environment_variables = merge(
     local.common_env,
     {
-      ALLOWED_HOSTS = "${var.app_short_name}-web-${var.environment}.${var.default_domain}"
+      ALLOWED_HOSTS         = "${var.app_short_name}-web-${var.environment}.${var.default_domain}"
+      DATABASE_POOL_ENABLED = "1"
     },
     var.deploy_database_as_container ? local.container_db_env : local.azure_db_env
   )
@@ -11,22 +11,12 @@ from .models import Permission, Role
 
 @rules.predicate
 def is_clinical(user):
-    if not user.current_provider:
-        return False
-
-    return user.assignments.filter(
-        provider=user.current_provider, roles__contains=[Role.CLINICAL.value]
-    ).exists()
+    return Role.CLINICAL.value in user.current_roles
 
 
 @rules.predicate
 def is_administrative(user):
-    if not user.current_provider:
-        return False
-
-    return user.assignments.filter(
-        provider=user.current_provider, roles__contains=[Role.ADMINISTRATIVE.value]
-    ).exists()
+    return Role.ADMINISTRATIVE.value in user.current_roles
 
 
 rules.add_perm(Permission.VIEW_PARTICIPANT_DATA, is_clinical | is_administrative)
@@ -1,6 +1,6 @@
 import pytest
 
-from manage_breast_screening.auth.models import Permission
+from manage_breast_screening.auth.models import Permission, Role
 from manage_breast_screening.auth.rules import is_administrative, is_clinical
 from manage_breast_screening.clinics.tests.factories import UserAssignmentFactory
 
@@ -81,3 +81,31 @@ class TestViewParticipantDataPermission:
         user_assignment = UserAssignmentFactory.create()
 
         assert not user_assignment.user.has_perm(Permission.VIEW_PARTICIPANT_DATA)
+
+
+@pytest.mark.django_db
+class TestRolesAreLoadedOnce:
+    def test_repeated_permission_checks_query_roles_once(
+        self, django_assert_num_queries
+    ):
+        user_assignment = UserAssignmentFactory.create(clinical=True)
+        user_assignment.make_current()
+        user = user_assignment.user
+
+        with django_assert_num_queries(1):
+            for _ in range(5):
+                assert user.has_perm(Permission.VIEW_PARTICIPANT_DATA)
+                assert is_clinical(user)
+                assert not is_administrative(user)
+
+    def test_changing_the_assignment_reloads_roles(self):
+        user_assignment = UserAssignmentFactory.create(clinical=True)
+        user_assignment.make_current()
+        user = user_assignment.user
+        assert not is_administrative(user)
+
+        user_assignment.roles = [Role.ADMINISTRATIVE.value]
+        user_assignment.save()
+
+        assert is_administrative(user)
+        assert not is_clinical(user)
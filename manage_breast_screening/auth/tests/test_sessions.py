@@ -0,0 +1,39 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+
+@pytest.fixture
+def cached_sessions(settings):
+    settings.SESSION_ENGINE = "qsessions.backends.cached_db"
+
+
+@pytest.mark.django_db
+class TestCachedSessions:
+    def test_pages_do_not_read_the_session_from_the_database(
+        self, cached_sessions, clinical_user_client
+    ):
+        clinical_user_client.http.get(reverse("clinics:index"))
+
+        with CaptureQueriesContext(connection) as queries:
+            response = clinical_user_client.http.get(reverse("clinics:index"))
+
+        assert response.status_code == 200
+        assert not [
+            query
+            for query in queries.captured_queries
+            if '"qsessions_session"' in query["sql"]
+        ]
+
+    def test_deleting_a_users_sessions_logs_them_out(
+        self, cached_sessions, clinical_user_client
+    ):
+        clinical_user_client.http.get(reverse("clinics:index"))
+
+        # As on CIS2 back-channel logout
+        clinical_user_client.user.session_set.all().delete()
+
+        response = clinical_user_client.http.get(reverse("clinics:index"))
+        assert response.status_code == 302
+        assert "login" in response.headers["location"]
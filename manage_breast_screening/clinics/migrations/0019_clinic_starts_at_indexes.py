@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-19 11:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clinics', '0018_userassignment_roles'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='clinic',
+            index=models.Index(fields=['starts_at', 'id'], name='clinics_cli_starts__4066be_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clinicslot',
+            index=models.Index(fields=['starts_at', 'id'], name='clinics_cli_starts__e60fbc_idx'),
+        ),
+    ]
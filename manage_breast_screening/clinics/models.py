@@ -1,3 +1,6 @@
+import copy
+import threading
+import time
 import uuid
 from datetime import date
 from enum import StrEnum
@@ -6,19 +9,65 @@ from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
 from django.core.validators import MinLengthValidator
 from django.db import models
-from django.db.models import OuterRef, Subquery
+from django.db.models import Count, OuterRef, Q, Subquery
 
 from ..auth.models import Role
+from ..core.fragment_cache import expire_fragments
 from ..core.models import BaseModel
+from ..core.utils.pagination import KeysetPage, keyset_page
 from ..participants.models import Appointment, Participant
 
 
 class Provider(BaseModel):
     name = models.TextField()
 
+    # Providers cached in this process, by primary key: (expires at, provider)
+    _cache = {}
+    _cache_lock = threading.Lock()
+
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.invalidate_cached(self.pk)
+
+    def delete(self, *args, **kwargs):
+        pk = self.pk
+        result = super().delete(*args, **kwargs)
+        self.invalidate_cached(pk)
+        return result
+
+    @classmethod
+    def cached(cls, pk) -> "Provider":
+        """
+        Get a provider, served from memory for PROVIDER_CACHE_SECONDS after it
+        is first loaded. Saving or deleting a provider invalidates it in this
+        process; other processes see the change once their copy expires.
+        Each call returns a separate copy, so callers can't affect each other.
+        """
+        key = str(pk)
+        now = time.monotonic()
+
+        with cls._cache_lock:
+            expires_at, provider = cls._cache.get(key, (0, None))
+
+        if provider is None or expires_at <= now:
+            provider = cls.objects.get(pk=pk)
+            with cls._cache_lock:
+                cls._cache[key] = (now + settings.PROVIDER_CACHE_SECONDS, provider)
+
+        return copy.copy(provider)
+
+    @classmethod
+    def invalidate_cached(cls, pk=None):
+        """Remove a provider, or every provider, from this process's cache"""
+        with cls._cache_lock:
+            if pk is None:
+                cls._cache.clear()
+            else:
+                cls._cache.pop(str(pk), None)
+
     @property
     def appointments(self):
         return Appointment.objects.filter(clinic_slot__clinic__setting__provider=self)
@@ -75,28 +124,78 @@ class ClinicQuerySet(models.QuerySet):
         """
         return self.filter(starts_at__date__gt=date.today())
 
-    def completed(self):
+    def with_latest_status(self):
         """
-        Completed clinics that started in the past
+        Annotate each clinic with the state of its most recent status
         """
-        from .models import ClinicStatus
-
         latest_status = (
             ClinicStatus.objects.filter(clinic=OuterRef("pk"))
             .order_by("-created_at")
             .values("state")[:1]
         )
+        return self.annotate(latest_status=Subquery(latest_status))
+
+    @staticmethod
+    def completed_condition() -> Q:
+        """
+        Clinics which started in the past and are closed or cancelled, to be
+        applied over with_latest_status()
+        """
+        return Q(
+            starts_at__date__lt=date.today(),
+            latest_status__in=["CLOSED", "CANCELLED"],
+        )
 
+    def completed(self):
+        """
+        Completed clinics that started in the past
+        """
         return (
-            self.filter(starts_at__date__lt=date.today())
-            .annotate(latest_status=Subquery(latest_status))
-            .filter(latest_status__in=["CLOSED", "CANCELLED"])
+            self.with_latest_status()
+            .filter(self.completed_condition())
             .order_by("-ends_at")
         )
 
+    def filter_counts(self) -> dict[ClinicFilter, int]:
+        """
+        The number of clinics matching each filter, counted in one query
+        """
+        today = date.today()
+        counts = self.with_latest_status().aggregate(
+            **{
+                ClinicFilter.ALL: Count("pk"),
+                ClinicFilter.TODAY: Count("pk", filter=Q(starts_at__date=today)),
+                ClinicFilter.UPCOMING: Count("pk", filter=Q(starts_at__date__gt=today)),
+                ClinicFilter.COMPLETED: Count("pk", filter=self.completed_condition()),
+            }
+        )
+        return {ClinicFilter(filter): count for filter, count in counts.items()}
+
     def with_statuses(self):
         return self.prefetch_related("statuses")
 
+    def page(self, after=None, before=None, size=None, desc=False) -> KeysetPage:
+        """
+        A page of clinics ordered by start time, after or before a cursor
+        """
+        return keyset_page(
+            self, "starts_at", after=after, before=before, size=size, desc=desc
+        )
+
+    def for_list(self):
+        """
+        Annotate clinics with the number of slots and latest status, and
+        fetch their setting, so that a list of clinics is presented without
+        a query per clinic
+        """
+        queryset = self
+        if "latest_status" not in self.query.annotations:
+            queryset = queryset.with_latest_status()
+
+        return queryset.select_related("setting").annotate(
+            number_of_slots=Count("clinic_slots")
+        )
+
 
 class Clinic(BaseModel):
     class RiskType:
@@ -129,6 +228,13 @@ class Clinic(BaseModel):
 
     objects = ClinicQuerySet.as_manager()
 
+    class Meta:
+        indexes = [models.Index(fields=["starts_at", "id"])]
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        expire_fragments("clinic", self.pk)
+
     @property
     def appointments(self):
         return Appointment.objects.filter(clinic_slot__clinic=self)
@@ -157,14 +263,7 @@ class Clinic(BaseModel):
 
     @classmethod
     def filter_counts(cls, provider_id):
-        queryset = cls.objects.filter(setting__provider_id=provider_id)
-
-        return {
-            ClinicFilter.ALL: queryset.count(),
-            ClinicFilter.TODAY: queryset.today().count(),
-            ClinicFilter.UPCOMING: queryset.upcoming().count(),
-            ClinicFilter.COMPLETED: queryset.completed().count(),
-        }
+        return cls.objects.filter(setting__provider_id=provider_id).filter_counts()
 
     def __str__(self):
         return self.setting.name + " " + self.starts_at.strftime("%Y-%m-%d %H:%M")
@@ -177,6 +276,9 @@ class ClinicSlot(BaseModel):
     starts_at = models.DateTimeField()
     duration_in_minutes = models.IntegerField()
 
+    class Meta:
+        indexes = [models.Index(fields=["starts_at", "id"])]
+
     @property
     def provider(self):
         return self.clinic.provider
@@ -210,6 +312,10 @@ class ClinicStatus(models.Model):
         "clinics.Clinic", on_delete=models.PROTECT, related_name="statuses"
     )
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        expire_fragments("clinic", self.clinic_id)
+
 
 class UserAssignment(BaseModel):
     """
@@ -240,6 +346,18 @@ class UserAssignment(BaseModel):
             # Remove duplicates and sort
             self.roles = sorted(list(set(self.roles)))
         super().save(*args, **kwargs)
+        self.roles_changed()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self.roles_changed()
+        return result
+
+    def roles_changed(self):
+        # Touching the user also expires the header text cached in their
+        # sessions, see core.template_helpers.header_account_items
+        self.user.save(update_fields=["updated_at"])
+        self.user.invalidate_roles()
 
     def make_current(self):
         self.user.current_provider = self.provider
@@ -1,4 +1,5 @@
 from functools import cached_property
+from urllib.parse import urlencode
 
 from django.urls import reverse
 
@@ -8,11 +9,30 @@ from ..mammograms.presenters import AppointmentPresenter
 from .models import ClinicStatus
 
 
+def pagination_data(page):
+    """
+    Links to the pages either side of a KeysetPage, for the pagination
+    component, or None if everything fits on one page
+    """
+    previous_cursor = getattr(page, "previous_cursor", None)
+    next_cursor = getattr(page, "next_cursor", None)
+    if not previous_cursor and not next_cursor:
+        return None
+
+    return {
+        "previousUrl": f"?{urlencode({'before': previous_cursor})}"
+        if previous_cursor
+        else None,
+        "nextUrl": f"?{urlencode({'after': next_cursor})}" if next_cursor else None,
+    }
+
+
 class ClinicsPresenter:
     def __init__(self, filtered_clinics, filter, counts_by_filter):
         self.clinics = [ClinicPresenter(clinic) for clinic in filtered_clinics]
         self.counts_by_filter = counts_by_filter
         self.filter = filter
+        self.pagination = pagination_data(filtered_clinics)
 
     @cached_property
     def heading(self):
@@ -38,15 +58,27 @@ class ClinicPresenter:
         self.pk = clinic.pk
         self.starts_at = format_date(clinic.starts_at)
         self.session_type = clinic.session_type().capitalize()
-        self.number_of_slots = clinic.clinic_slots.count()
         self.location_name = sentence_case(clinic.setting.name)
         self.time_range = format_time_range(clinic.time_range())
         self.type = clinic.get_type_display()
         self.risk_type = clinic.get_risk_type_display()
 
+    @cached_property
+    def number_of_slots(self):
+        # Clinics from ClinicQuerySet.for_list() are annotated with their
+        # number of slots and latest status
+        number_of_slots = getattr(self._clinic, "number_of_slots", None)
+        if number_of_slots is None:
+            number_of_slots = self._clinic.clinic_slots.count()
+        return number_of_slots
+
     @cached_property
     def state(self):
-        status = self._clinic.current_status
+        latest_status = getattr(self._clinic, "latest_status", None)
+        if latest_status is None:
+            status = self._clinic.current_status
+        else:
+            status = ClinicStatus(state=latest_status)
         value = status.state
         text = status.get_state_display()
 
@@ -72,6 +104,7 @@ class AppointmentListPresenter:
         self.filter = filter
         self.counts_by_filter = counts_by_filter
         self.clinic_pk = clinic_pk
+        self.pagination = pagination_data(appointments)
 
     @cached_property
     def secondary_nav_data(self):
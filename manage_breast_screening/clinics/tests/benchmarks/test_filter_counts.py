@@ -0,0 +1,128 @@
+"""
+Query count and latency benchmarks for the tab counts on the clinic pages.
+
+Seeds a provider with a busy clinic, whose appointments have moved through
+several statuses, and checks that each page's counts are fetched in a single
+query within a latency budget.
+
+Run with `make test-benchmark`. The number of appointments can be tuned with
+CLINICS_BENCHMARK_APPOINTMENTS, and every budget scaled with
+CLINICS_BENCHMARK_LATENCY_FACTOR on slower machines. Set
+CLINICS_BENCHMARK_OUTPUT to a file path to record query counts and timings
+as JSON.
+"""
+
+import json
+import os
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from manage_breast_screening.clinics.models import Clinic, ClinicStatus
+from manage_breast_screening.clinics.tests.factories import (
+    ClinicFactory,
+    ClinicSlotFactory,
+    ProviderFactory,
+)
+from manage_breast_screening.participants.models import Appointment, AppointmentStatus
+from manage_breast_screening.participants.tests.factories import AppointmentFactory
+
+APPOINTMENTS = int(os.getenv("CLINICS_BENCHMARK_APPOINTMENTS", "150"))
+CLINICS = 60
+LATENCY_FACTOR = float(os.getenv("CLINICS_BENCHMARK_LATENCY_FACTOR", "1"))
+OUTPUT = os.getenv("CLINICS_BENCHMARK_OUTPUT")
+RUNS = 5
+
+# The statuses an appointment has been through, oldest first
+STATUS_HISTORIES = [
+    [AppointmentStatus.CONFIRMED],
+    [AppointmentStatus.CONFIRMED, AppointmentStatus.CHECKED_IN],
+    [
+        AppointmentStatus.CONFIRMED,
+        AppointmentStatus.CHECKED_IN,
+        AppointmentStatus.IN_PROGRESS,
+    ],
+    [
+        AppointmentStatus.CONFIRMED,
+        AppointmentStatus.CHECKED_IN,
+        AppointmentStatus.IN_PROGRESS,
+        AppointmentStatus.SCREENED,
+    ],
+    [AppointmentStatus.CONFIRMED, AppointmentStatus.CANCELLED],
+]
+
+results = {}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def write_results():
+    yield
+    if OUTPUT:
+        Path(OUTPUT).write_text(json.dumps(results, indent=2))
+
+
+@pytest.fixture
+def busy_clinic():
+    provider = ProviderFactory()
+    now = datetime.now(tz=timezone.utc)
+    for day in range(-CLINICS // 2, CLINICS // 2):
+        ClinicFactory.create(
+            setting__provider=provider,
+            starts_at=now + timedelta(days=day),
+            current_status=ClinicStatus.CLOSED if day < 0 else ClinicStatus.SCHEDULED,
+        )
+
+    clinic = ClinicFactory.create(setting__provider=provider, starts_at=now)
+    slot = ClinicSlotFactory.create(clinic=clinic)
+    for i in range(APPOINTMENTS):
+        appointment = AppointmentFactory.create(clinic_slot=slot)
+        for state in STATUS_HISTORIES[i % len(STATUS_HISTORIES)]:
+            appointment.statuses.create(state=state)
+
+    return clinic
+
+
+def measure(name: str, count):
+    with CaptureQueriesContext(connection) as context:
+        counts = count()
+
+    timings = []
+    for _ in range(RUNS):
+        started_at = time.perf_counter()
+        count()
+        timings.append((time.perf_counter() - started_at) * 1000)
+
+    results[name] = {
+        "queries": len(context.captured_queries),
+        "median_ms": statistics.median(timings),
+        "counts": {str(filter): value for filter, value in counts.items()},
+    }
+    return results[name]
+
+
+@pytest.mark.django_db
+class TestFilterCounts:
+    def test_clinic_list_counts(self, busy_clinic):
+        result = measure(
+            "clinic_list", lambda: Clinic.filter_counts(busy_clinic.provider.pk)
+        )
+
+        assert result["queries"] == 1
+        assert result["counts"]["all"] == CLINICS + 1
+        assert result["median_ms"] < 20 * LATENCY_FACTOR
+
+    def test_clinic_appointment_counts(self, busy_clinic):
+        result = measure(
+            "clinic_appointments",
+            lambda: Appointment.filter_counts_for_clinic(busy_clinic),
+        )
+
+        assert result["queries"] == 1
+        assert result["counts"]["all"] == APPOINTMENTS
+        assert result["counts"]["complete"] == 2 * APPOINTMENTS // len(STATUS_HISTORIES)
+        assert result["median_ms"] < 20 * LATENCY_FACTOR
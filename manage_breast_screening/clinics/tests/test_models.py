@@ -3,6 +3,8 @@ from datetime import timezone as tz
 
 import pytest
 import time_machine
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from pytest_django.asserts import assertQuerySetEqual
 
 from manage_breast_screening.auth.models import Role
@@ -87,6 +89,148 @@ def test_completed_ordering_by_ends_at():
     assertQuerySetEqual(completed, [clinic1, clinic2, clinic3])
 
 
+@pytest.mark.django_db
+class TestPage:
+    @pytest.fixture
+    def clinics(self):
+        # Two clinics share a start time, so they are ordered by primary key
+        clinics = [
+            ClinicFactory.create(starts_at=datetime(2025, 1, day, 9, tzinfo=tz.utc))
+            for day in (1, 2, 2, 3, 4)
+        ]
+        return sorted(clinics, key=lambda clinic: (clinic.starts_at, clinic.pk))
+
+    def test_pages_forwards_and_backwards(self, clinics, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            first = models.Clinic.objects.page(size=2)
+        assert list(first) == clinics[:2]
+        assert first.previous_cursor is None
+
+        second = models.Clinic.objects.page(after=first.next_cursor, size=2)
+        assert list(second) == clinics[2:4]
+
+        last = models.Clinic.objects.page(after=second.next_cursor, size=2)
+        assert list(last) == clinics[4:]
+        assert last.next_cursor is None
+
+        assert (
+            list(models.Clinic.objects.page(before=last.previous_cursor, size=2))
+            == clinics[2:4]
+        )
+        back_to_first = models.Clinic.objects.page(
+            before=second.previous_cursor, size=2
+        )
+        assert list(back_to_first) == clinics[:2]
+        assert back_to_first.previous_cursor is None
+        assert back_to_first.next_cursor == first.next_cursor
+
+    def test_pages_in_descending_order(self, clinics):
+        first = models.Clinic.objects.page(size=3, desc=True)
+        assert list(first) == clinics[:1:-1]
+
+        second = models.Clinic.objects.page(after=first.next_cursor, size=3, desc=True)
+        assert list(second) == clinics[1::-1]
+        assert second.next_cursor is None
+
+    def test_compares_the_cursor_as_a_row(self, clinics):
+        first = models.Clinic.objects.page(size=2)
+
+        with CaptureQueriesContext(connection) as queries:
+            models.Clinic.objects.page(after=first.next_cursor, size=2)
+
+        # A row comparison lets Postgres seek the (starts_at, id) index
+        assert (
+            'WHERE ROW("clinics_clinic"."starts_at", "clinics_clinic"."id") > (ROW('
+            in queries[0]["sql"]
+        )
+
+    def test_an_invalid_cursor_gives_the_first_page(self, clinics):
+        assert (
+            list(models.Clinic.objects.page(after="nonsense", size=2)) == (clinics[:2])
+        )
+
+
+@pytest.mark.django_db
+@time_machine.travel(datetime(2025, 1, 1, 10, tzinfo=tz.utc))
+def test_filter_counts(django_assert_num_queries):
+    provider = ProviderFactory()
+    ClinicFactory.create(
+        setting__provider=provider, starts_at=datetime(2025, 1, 1, 9, tzinfo=tz.utc)
+    )
+    ClinicFactory.create(
+        setting__provider=provider, starts_at=datetime(2025, 1, 2, 9, tzinfo=tz.utc)
+    )
+    ClinicFactory.create(
+        setting__provider=provider,
+        starts_at=datetime(2024, 12, 31, 9, tzinfo=tz.utc),
+        ends_at=datetime(2024, 12, 31, 17, tzinfo=tz.utc),
+        current_status=models.ClinicStatus.CLOSED,
+    )
+    ClinicFactory.create(
+        setting__provider=provider,
+        starts_at=datetime(2024, 12, 30, 9, tzinfo=tz.utc),
+        ends_at=datetime(2024, 12, 30, 17, tzinfo=tz.utc),
+        current_status=models.ClinicStatus.SCHEDULED,
+    )
+    # Another provider's clinic, which shouldn't be counted
+    ClinicFactory.create(starts_at=datetime(2025, 1, 1, 9, tzinfo=tz.utc))
+
+    with django_assert_num_queries(1):
+        counts = models.Clinic.filter_counts(provider.pk)
+
+    assert counts == {
+        models.ClinicFilter.ALL: 4,
+        models.ClinicFilter.TODAY: 1,
+        models.ClinicFilter.UPCOMING: 1,
+        models.ClinicFilter.COMPLETED: 1,
+    }
+
+
+@pytest.mark.django_db
+class TestProviderCached:
+    def test_serves_the_provider_from_memory_once_loaded(
+        self, django_assert_num_queries
+    ):
+        provider = ProviderFactory(name="Test Provider")
+
+        with django_assert_num_queries(1):
+            first = models.Provider.cached(provider.pk)
+            second = models.Provider.cached(str(provider.pk))
+
+        assert first == second == provider
+        assert first is not second
+        assert second.name == "Test Provider"
+
+    def test_reloads_the_provider_once_expired(
+        self, settings, django_assert_num_queries
+    ):
+        settings.PROVIDER_CACHE_SECONDS = 0
+        provider = ProviderFactory()
+
+        with django_assert_num_queries(2):
+            models.Provider.cached(provider.pk)
+            models.Provider.cached(provider.pk)
+
+    def test_saving_the_provider_invalidates_it(self):
+        provider = ProviderFactory(name="Old name")
+        models.Provider.cached(provider.pk)
+
+        provider.name = "New name"
+        provider.save()
+
+        assert models.Provider.cached(provider.pk).name == "New name"
+
+    def test_deleting_the_provider_invalidates_it(self):
+        provider = ProviderFactory()
+        pk = provider.pk
+        models.Provider.cached(pk)
+
+        provider.delete()
+
+        with pytest.raises(models.Provider.DoesNotExist):
+            models.Provider.cached(pk)
+
+
 class TestUserAssignment:
     def test_str(self):
         user = UserFactory.build(first_name="John", last_name="Doe")
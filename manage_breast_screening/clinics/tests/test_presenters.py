@@ -5,9 +5,10 @@ from unittest.mock import MagicMock
 import pytest
 from django.urls import reverse
 
+from ...core.utils.pagination import KeysetPage
 from ..models import Clinic
-from ..presenters import AppointmentListPresenter, ClinicPresenter
-from .factories import ClinicStatusFactory
+from ..presenters import AppointmentListPresenter, ClinicPresenter, pagination_data
+from .factories import ClinicFactory, ClinicSlotFactory, ClinicStatusFactory
 
 
 @pytest.fixture
@@ -45,6 +46,40 @@ def test_clinic_presenter(mock_clinic):
     }
 
 
+@pytest.mark.django_db
+def test_clinic_presenter_uses_list_annotations(django_assert_num_queries):
+    ClinicSlotFactory.create_batch(3, clinic=ClinicFactory.create())
+    clinic = Clinic.objects.for_list().get()
+
+    with django_assert_num_queries(0):
+        presenter = ClinicPresenter(clinic)
+        assert presenter.number_of_slots == 3
+        assert presenter.state["text"] == "Scheduled"
+        assert presenter.location_name
+
+
+class TestPaginationData:
+    def test_no_links_when_everything_fits_on_one_page(self):
+        assert pagination_data(KeysetPage([])) is None
+        assert pagination_data([]) is None
+
+    def test_links_to_the_pages_either_side(self):
+        page = KeysetPage([], next_cursor="bmV4dA", previous_cursor="cHJldg")
+
+        assert pagination_data(page) == {
+            "previousUrl": "?before=cHJldg",
+            "nextUrl": "?after=bmV4dA",
+        }
+
+    def test_first_page_only_links_forwards(self):
+        page = KeysetPage([], next_cursor="bmV4dA")
+
+        assert pagination_data(page) == {
+            "previousUrl": None,
+            "nextUrl": "?after=bmV4dA",
+        }
+
+
 class TestAppointmentListPresenter:
     @pytest.mark.django_db
     def test_secondary_nav_data(self):
@@ -1,7 +1,25 @@
+import html
+import re
+from datetime import datetime, timezone
+from unittest import mock
+
 import pytest
 from django.urls import reverse
 
-from .factories import ProviderFactory, UserAssignmentFactory, UserFactory
+from ...mammograms.presenters.appointment_presenters import AppointmentPresenter
+from ...participants.models import AppointmentStatus
+from ...participants.tests.factories import AppointmentFactory
+from .factories import (
+    ClinicFactory,
+    ClinicSlotFactory,
+    ProviderFactory,
+    UserAssignmentFactory,
+    UserFactory,
+)
+
+# Session, user, provider, filter counts, clinics and roles, plus four to save
+# the session once the header text is cached in it
+CLINIC_LIST_QUERIES = 10
 
 
 class TestSelectProvider:
@@ -71,3 +89,114 @@ class TestSelectProvider:
             "No providers found. Check that you've been assigned a role with at least one provider."
             in response.text
         )
+
+
+@pytest.mark.django_db
+class TestClinicList:
+    @pytest.mark.parametrize("number_of_clinics", [1, 10])
+    def test_query_count_does_not_grow_with_the_number_of_clinics(
+        self, clinical_user_client, django_assert_num_queries, number_of_clinics
+    ):
+        for _ in range(number_of_clinics):
+            clinic = ClinicFactory.create(
+                setting__provider=clinical_user_client.current_provider,
+                starts_at=datetime.now(tz=timezone.utc),
+            )
+            ClinicSlotFactory.create_batch(2, clinic=clinic)
+
+        with django_assert_num_queries(CLINIC_LIST_QUERIES):
+            response = clinical_user_client.http.get(reverse("clinics:index_all"))
+
+        assert response.status_code == 200
+        assert response.content.decode().count("nhsuk-tag--blue") == number_of_clinics
+
+    def test_pages_through_clinics(self, clinical_user_client, monkeypatch):
+        monkeypatch.setattr(
+            "manage_breast_screening.core.utils.pagination.PAGE_SIZE", 2
+        )
+        for day in range(1, 4):
+            ClinicFactory.create(
+                setting__provider=clinical_user_client.current_provider,
+                starts_at=datetime(2025, 1, day, 9, tzinfo=timezone.utc),
+            )
+
+        response = clinical_user_client.http.get(reverse("clinics:index_all"))
+        assert response.status_code == 200
+        assert response.content.decode().count("nhsuk-tag--blue") == 2
+        next_url = re.search(
+            r'href="(\?after=[^"]+)"[^>]*rel="next"', response.content.decode()
+        ).group(1)
+
+        response = clinical_user_client.http.get(
+            reverse("clinics:index_all") + html.unescape(next_url)
+        )
+        assert response.status_code == 200
+        assert response.content.decode().count("nhsuk-tag--blue") == 1
+        assert 'rel="next"' not in response.content.decode()
+        assert 'rel="prev"' in response.content.decode()
+
+
+@pytest.mark.django_db
+class TestClinic:
+    @pytest.fixture
+    def clinic(self, clinical_user_client):
+        clinic = ClinicFactory.create(
+            setting__provider=clinical_user_client.current_provider
+        )
+        for _ in range(3):
+            AppointmentFactory.create(clinic_slot__clinic=clinic)
+        return clinic
+
+    def test_reloads_render_the_rows_from_cache(self, clinical_user_client, clinic):
+        url = reverse("clinics:show_all", kwargs={"pk": clinic.pk})
+        clinical_user_client.http.get(url)
+
+        with mock.patch.object(
+            AppointmentPresenter, "status_attribution", new_callable=mock.PropertyMock
+        ) as status_attribution:
+            second = clinical_user_client.http.get(url)
+
+        status_attribution.assert_not_called()
+        assert second.text.count("View appointment") == 3
+
+    def test_a_status_change_expires_the_cached_rows(
+        self, clinical_user_client, clinic
+    ):
+        url = reverse("clinics:show_all", kwargs={"pk": clinic.pk})
+        # Only confirmed appointments can be checked in
+        response = clinical_user_client.http.get(url)
+        assert response.text.count("data-hide-on-check-in") == 3
+
+        appointment = clinic.appointments.first()
+        appointment.statuses.create(state=AppointmentStatus.CHECKED_IN)
+
+        response = clinical_user_client.http.get(url)
+        assert response.text.count("data-hide-on-check-in") == 2
+
+    def test_a_participant_change_expires_the_cached_rows(
+        self, clinical_user_client, clinic
+    ):
+        url = reverse("clinics:show_all", kwargs={"pk": clinic.pk})
+        clinical_user_client.http.get(url)
+
+        participant = clinic.appointments.first().screening_episode.participant
+        participant.extra_needs = ["Wheelchair user"]
+        participant.save()
+
+        assert "Special appointment" in clinical_user_client.http.get(url).text
+
+    def test_repeat_requests_are_not_modified_until_a_participant_changes(
+        self, clinical_user_client, clinic
+    ):
+        url = reverse("clinics:show_all", kwargs={"pk": clinic.pk})
+        etag = clinical_user_client.http.get(url)["ETag"]
+
+        response = clinical_user_client.http.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        participant = clinic.appointments.first().screening_episode.participant
+        participant.extra_needs = ["Wheelchair user"]
+        participant.save()
+
+        response = clinical_user_client.http.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
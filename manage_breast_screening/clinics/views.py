@@ -1,18 +1,31 @@
+from datetime import date
+
 from django.contrib.auth.decorators import login_required
+from django.db.models import Count, Max
 from django.http import Http404
 from django.shortcuts import redirect, render
 from django.views.decorators.http import require_http_methods
 
+from ..core.conditional_get import conditional_page
 from ..core.decorators import current_provider_exempt
+from ..core.fragment_cache import fragment_version
 from ..core.utils.urls import extract_next_path_from_params
 from ..participants.models import Appointment, AppointmentStatus
-from .models import Clinic, Provider
+from .models import Clinic, ClinicFilter, Provider
 from .presenters import AppointmentListPresenter, ClinicPresenter, ClinicsPresenter
 
 
 def clinic_list(request, filter="today"):
     provider = request.user.current_provider
-    clinics = provider.clinics.by_filter(filter).prefetch_related("setting")
+    clinics = (
+        provider.clinics.by_filter(filter)
+        .for_list()
+        .page(
+            after=request.GET.get("after"),
+            before=request.GET.get("before"),
+            desc=filter == ClinicFilter.COMPLETED,
+        )
+    )
     counts_by_filter = Clinic.filter_counts(provider.pk)
     presenter = ClinicsPresenter(clinics, filter, counts_by_filter)
     return render(
@@ -22,6 +35,24 @@ def clinic_list(request, filter="today"):
     )
 
 
+def clinic_fingerprint(request, pk, filter="remaining"):
+    appointment = "clinic_slots__appointment"
+    version = request.user.current_provider.clinics.filter(pk=pk).aggregate(
+        latest_clinic=Max("updated_at"),
+        latest_clinic_status=Max("statuses__created_at"),
+        latest_setting=Max("setting__updated_at"),
+        latest_clinic_slots=Max("clinic_slots__updated_at"),
+        latest_appointments=Max(f"{appointment}__updated_at"),
+        appointment_count=Count(appointment, distinct=True),
+        latest_appointment_statuses=Max(f"{appointment}__latest_status__created_at"),
+        latest_participants=Max(
+            f"{appointment}__screening_episode__participant__updated_at"
+        ),
+    )
+    return version if version["latest_clinic"] else None
+
+
+@conditional_page(clinic_fingerprint)
 def clinic(request, pk, filter="remaining"):
     provider = request.user.current_provider
     clinic = provider.clinics.get(pk=pk)
@@ -30,7 +61,7 @@ def clinic(request, pk, filter="remaining"):
         clinic.appointments.for_filter(filter)
         .prefetch_current_status()
         .select_related("clinic_slot__clinic", "screening_episode__participant")
-        .order_by_starts_at()
+        .page(after=request.GET.get("after"), before=request.GET.get("before"))
     )
     counts_by_filter = Appointment.filter_counts_for_clinic(clinic)
     presented_appointment_list = AppointmentListPresenter(
@@ -43,6 +74,8 @@ def clinic(request, pk, filter="remaining"):
             "presented_clinic": presented_clinic,
             "presented_appointment_list": presented_appointment_list,
             "page_title": presented_clinic.heading,
+            # Participants' ages in the cached rows change from day to day
+            "fragment_version": f"{fragment_version('clinic', clinic.pk)}:{date.today()}",
         },
     )
 
@@ -8,12 +8,33 @@ DATABASE_PASSWORD=changeme
 DATABASE_USER=manage
 DATABASE_SSLMODE=allow
 DATABASE_HOST=localhost
+# Pool connections in each process, replacing each after MAX_LIFETIME seconds
+DATABASE_POOL_ENABLED=0
+DATABASE_POOL_MIN_SIZE=2
+DATABASE_POOL_MAX_SIZE=4
+DATABASE_POOL_MAX_LIFETIME=1800
 LOG_QUERIES=0
+# Leave empty to compile templates in memory only
+JINJA2_BYTECODE_CACHE_DIR=
 PERSONAS_ENABLED=1
 
 # Set to FQDN in deployed environments
 BASE_URL=http://localhost:8000
 
+# Cache shared by the app's processes: locmem, file, database or redis.
+# CACHE_LOCATION is a directory for file, a table for database (create it with
+# `manage.py createcachetable`) and a redis:// URL for redis.
+CACHE_BACKEND=locmem
+CACHE_LOCATION=
+CACHE_TIMEOUT_SECONDS=300
+
+# Seconds a process may serve a provider from memory before reloading it
+PROVIDER_CACHE_SECONDS=300
+
+# Seconds rendered page fragments, such as clinic appointment rows, are cached.
+# Only used when CACHE_BACKEND is shared (file, database or redis).
+FRAGMENT_CACHE_SECONDS=3600
+
 # CIS2 / Authlib
 CIS2_SERVER_METADATA_URL=changeme
 CIS2_CLIENT_ID=changeme
@@ -30,6 +51,20 @@ BASIC_AUTH_PASSWORD=changeme
 
 # Notifications specific env vars
 NOTIFICATIONS_BATCH_RETRY_LIMIT=5
+NOTIFICATIONS_REPORTS_MAX_WORKERS=4
+NOTIFICATIONS_REPORTS_COMPRESSION=""
+NOTIFICATIONS_STATUS_RETENTION_MONTHS=6
+NOTIFICATIONS_WORKER_MAX_WORKERS=4
+NOTIFICATIONS_WORKER_HEALTH_PORT=8001
+NOTIFICATIONS_WORKER_STATUS_POLL_SECONDS=10
+# The worker schedules nothing unless this is set, like the scheduled jobs.
+# Each task also needs a cron expression, or "poll", to run.
+NOTIFICATIONS_JOBS_SCHEDULE_ENABLED=0
+NOTIFICATIONS_WORKER_SCHEDULE_STORE_MESH_MESSAGES=""
+NOTIFICATIONS_WORKER_SCHEDULE_CREATE_APPOINTMENTS=""
+NOTIFICATIONS_WORKER_SCHEDULE_SEND_MESSAGE_BATCH=""
+NOTIFICATIONS_WORKER_SCHEDULE_RETRY_FAILED_MESSAGE_BATCH=""
+NOTIFICATIONS_WORKER_SCHEDULE_SAVE_MESSAGE_STATUS=""
 
 NOTIFICATIONS_SMTP_USERNAME=example@nhs.net
 NOTIFICATIONS_SMTP_PASSWORD=changeme
@@ -56,3 +91,5 @@ APPLICATIONINSIGHTS_CONNECTION_STRING=""
 APPLICATIONINSIGHTS_STATSBEAT_DISABLED_ALL=True
 APPLICATIONINSIGHTS_LOGGER_NAME="manbrs-notifications"
 APPLICATIONINSIGHTS_IS_ENABLED=False
+APPLICATIONINSIGHTS_BUFFER_SIZE=1000
+APPLICATIONINSIGHTS_FLUSH_SECONDS=5
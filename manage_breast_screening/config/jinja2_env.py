@@ -1,8 +1,16 @@
+from pathlib import Path
+
 from django.conf import settings
 from django.templatetags.static import static
 from django.urls import reverse
-from jinja2 import ChoiceLoader, Environment, PackageLoader
+from jinja2 import (
+    ChoiceLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    PackageLoader,
+)
 
+from manage_breast_screening.core.fragment_cache import FragmentCacheExtension
 from manage_breast_screening.core.template_helpers import (
     as_hint,
     get_notification_banner_params,
@@ -14,7 +22,12 @@ from manage_breast_screening.core.template_helpers import (
 
 
 def environment(**options):
-    env = Environment(**options, extensions=["jinja2.ext.do"])
+    if settings.JINJA2_BYTECODE_CACHE_DIR:
+        cache_dir = Path(settings.JINJA2_BYTECODE_CACHE_DIR)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        options.setdefault("bytecode_cache", FileSystemBytecodeCache(cache_dir))
+
+    env = Environment(**options, extensions=["jinja2.ext.do", FragmentCacheExtension])
     if env.loader:
         env.loader = ChoiceLoader(
             [
@@ -1,4 +1,3 @@
-from azure.identity import DefaultAzureCredential
 from django.db.backends.postgresql import base
 
 
@@ -15,18 +14,40 @@ class DatabaseWrapper(base.DatabaseWrapper):
 
     Unless you disable persistent connections, each thread will maintain its own
     connection.
-    Since Django 5.1 it is possible to configure a connection pool
-    instead of using persistent connections, but that would require us to
-    fix the credentials.
-    See https://docs.djangoproject.com/en/5.2/ref/databases/#persistent-connections
+    Alternatively, the "pool" option enables Django's connection pool, which
+    keeps connections open between requests and shares them between threads.
+    The pool normally connects with the parameters it was created with, so we
+    give it a callable instead, which fetches a current token for each new
+    connection. Pooled connections are replaced after the pool's max_lifetime,
+    which should be shorter than a token's lifetime.
+    See https://docs.djangoproject.com/en/5.2/ref/databases/#connection-pool
     for more details of how this works.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.azure_credential = DefaultAzureCredential()
+    azure_credential = None
+
+    @property
+    def pool(self):
+        pool = super().pool
+        if pool is not None and not callable(pool.kwargs):
+            # The pool is created unopened, so no connection has used the
+            # static parameters yet
+            pool.kwargs = self._pool_connection_params
+        return pool
+
+    def _pool_connection_params(self) -> dict:
+        params = self.get_connection_params()
+        # Ensure we run in autocommit, Django properly sets it later on.
+        params["autocommit"] = True
+        return params
 
     def _get_azure_connection_password(self) -> str:
+        # azure.identity is slow to import, and only needed for Azure hosts
+        if self.azure_credential is None:
+            from azure.identity import DefaultAzureCredential
+
+            self.azure_credential = DefaultAzureCredential()
+
         # This makes use of in-memory token caching
         # https://github.com/Azure/azure-sdk-for-python/blob/main/sdk/identity/azure-identity/TOKEN_CACHING.md#in-memory-token-caching
         return self.azure_credential.get_token(
@@ -125,6 +125,9 @@ TEMPLATES = [
         "OPTIONS": {
             "environment": "manage_breast_screening.config.jinja2_env.environment",
             "undefined": ChainableUndefined,
+            # Check templates for changes on each render. Not needed once
+            # templates are baked into an image.
+            "auto_reload": boolean_env("JINJA2_AUTO_RELOAD", default=DEBUG),
         },
     },
     {
@@ -142,9 +145,12 @@ TEMPLATES = [
     },
 ]
 
+# Compiled Jinja templates are kept here, so that new workers load them rather
+# than compiling them again. The compile_templates command fills it in advance.
+JINJA2_BYTECODE_CACHE_DIR = environ.get("JINJA2_BYTECODE_CACHE_DIR", "")
+
 WSGI_APPLICATION = "manage_breast_screening.config.wsgi.application"
 FORM_RENDERER = "django.forms.renderers.TemplatesSetting"
-SESSION_ENGINE = "qsessions.backends.db"
 SESSION_COOKIE_AGE = 43200  # 12 hours
 COMMIT_SHA = environ.get("COMMIT_SHA", "")
 
@@ -164,6 +170,54 @@ DATABASES = {
     }
 }
 
+# Keep connections open in a pool per process, so that requests don't wait for
+# new connections, see config/postgresql/base.py
+if boolean_env("DATABASE_POOL_ENABLED", default=False):
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": int(environ.get("DATABASE_POOL_MIN_SIZE", "2")),
+        "max_size": int(environ.get("DATABASE_POOL_MAX_SIZE", "4")),
+        # Replace connections well before their Azure AD token would expire
+        "max_lifetime": float(environ.get("DATABASE_POOL_MAX_LIFETIME", "1800")),
+    }
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+#
+# CACHE_BACKEND chooses where cached data lives:
+# - "locmem": memory of each process, which is not shared between workers
+# - "file": files in the CACHE_LOCATION directory, for a single node
+# - "database": the CACHE_LOCATION table, created by `manage.py createcachetable`
+# - "redis": a Redis compatible server at the CACHE_LOCATION URL(s)
+CACHE_BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "database": "django.core.cache.backends.db.DatabaseCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+}
+CACHE_BACKEND = environ.get("CACHE_BACKEND", "locmem")
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKENDS[CACHE_BACKEND],
+        "LOCATION": environ.get("CACHE_LOCATION", ""),
+        "KEY_PREFIX": "manbrs",
+        "TIMEOUT": int(environ.get("CACHE_TIMEOUT_SECONDS", "300")),
+    }
+}
+# Whether every process sees the same cache, so that expiring a key in one
+# process expires it in all of them
+CACHE_IS_SHARED = CACHE_BACKEND in ("file", "database", "redis")
+
+# Sessions are read from the cache and written through to the database, when
+# the cache is shared by every process. Deleting sessions, for example on
+# back-channel logout, removes them from the cache too. With a cache per
+# process, other processes would keep serving a deleted session. A database
+# cache would be no quicker than the session table itself.
+SESSION_ENGINE = (
+    "qsessions.backends.cached_db"
+    if CACHE_IS_SHARED and CACHE_BACKEND != "database"
+    else "qsessions.backends.db"
+)
+
 STORAGES = {
     "staticfiles": {
         "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
@@ -287,6 +341,15 @@ CIS2_DEBUG = boolean_env("CIS2_DEBUG", default=False)
 
 BASE_URL = environ.get("BASE_URL")
 
+# How long a process may serve a Provider from memory, see Provider.cached()
+PROVIDER_CACHE_SECONDS = int(environ.get("PROVIDER_CACHE_SECONDS", "300"))
+
+# How long rendered template fragments are cached, see core.fragment_cache.
+# Fragments are expired by changing a version stamp in the cache, so they are
+# only cached when every process sees the new stamp.
+FRAGMENT_CACHE_ENABLED = CACHE_IS_SHARED
+FRAGMENT_CACHE_SECONDS = int(environ.get("FRAGMENT_CACHE_SECONDS", "3600"))
+
 # HTTP Basic Auth (optional; off by default)
 BASIC_AUTH_ENABLED = boolean_env("BASIC_AUTH_ENABLED", default=False)
 BASIC_AUTH_USERNAME = environ.get("BASIC_AUTH_USERNAME")
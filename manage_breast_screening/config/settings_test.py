@@ -9,6 +9,18 @@ from .settings import *
 
 SECRET_KEY = "testing"
 
+# Test databases are created and dropped per run, which a pool would outlive
+DATABASES["default"]["OPTIONS"].pop("pool", None)
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "KEY_PREFIX": "manbrs",
+    }
+}
+# Tests run in one process, which shares its memory cache with itself
+FRAGMENT_CACHE_ENABLED = True
+
 STORAGES = {
     "staticfiles": {
         "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
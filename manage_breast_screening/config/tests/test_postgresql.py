@@ -0,0 +1,56 @@
+from itertools import count
+from unittest.mock import MagicMock
+
+import pytest
+
+from manage_breast_screening.config.postgresql.base import DatabaseWrapper
+
+
+@pytest.fixture
+def azure_wrapper():
+    wrapper = DatabaseWrapper(
+        {
+            "ENGINE": "manage_breast_screening.config.postgresql",
+            "NAME": "manage",
+            "USER": "manage",
+            "PASSWORD": "",
+            "HOST": "example.postgres.database.azure.com",
+            "PORT": "5432",
+            "OPTIONS": {"pool": {"min_size": 1, "max_size": 3, "max_lifetime": 600}},
+            "TIME_ZONE": "Europe/London",
+            "CONN_MAX_AGE": 0,
+            "CONN_HEALTH_CHECKS": False,
+            "AUTOCOMMIT": True,
+            "ATOMIC_REQUESTS": False,
+            "TEST": {},
+        },
+        alias="pool-test",
+    )
+    wrapper.azure_credential = MagicMock()
+    wrapper.azure_credential.get_token.side_effect = (
+        MagicMock(token=f"token-{i}") for i in count()
+    )
+    yield wrapper
+    DatabaseWrapper._connection_pools.pop("pool-test", None)
+
+
+class TestPool:
+    def test_new_connections_fetch_a_current_token(self, azure_wrapper):
+        pool = azure_wrapper.pool
+
+        assert callable(pool.kwargs)
+        first, second = pool.kwargs(), pool.kwargs()
+        assert first["password"] != second["password"]
+        assert first["autocommit"] is True
+
+    def test_pool_options_are_passed_through(self, azure_wrapper):
+        pool = azure_wrapper.pool
+
+        assert pool.min_size == 1
+        assert pool.max_size == 3
+        assert pool.max_lifetime == 600
+
+    def test_pool_is_shared_between_connections(self, azure_wrapper):
+        pool = azure_wrapper.pool
+
+        assert azure_wrapper.pool is pool
@@ -2,15 +2,31 @@ from types import SimpleNamespace
 from unittest import TestCase
 
 import pytest
+from django.core.cache import cache
 from django.test.client import Client
 
 from manage_breast_screening.auth.tests.factories import UserFactory
+from manage_breast_screening.clinics.models import Provider
 from manage_breast_screening.clinics.tests.factories import UserAssignmentFactory
 
 # Show long diffs in failed test output
 TestCase.maxDiff = None
 
 
+@pytest.fixture(autouse=True)
+def clear_provider_cache():
+    # Providers are rolled back at the end of each test
+    yield
+    Provider.invalidate_cached()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # Cached fragments and their version stamps would outlive the test's data
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def user():
     return UserFactory.create(nhs_uid="user1")
@@ -0,0 +1,160 @@
+import hashlib
+import time
+import uuid
+from logging import getLogger
+
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from opentelemetry import metrics
+
+logger = getLogger(__name__)
+
+_MISSING = object()
+
+# How long one process may spend computing a value while others wait for it
+LOCK_SECONDS = 5
+
+# The longest that keys are stored as-is, rather than hashed
+MAX_KEY_LENGTH = 200
+
+_meter = metrics.get_meter(__name__)
+_lookups = _meter.create_counter(
+    "cache.lookups", description="Shared cache lookups, by namespace and result"
+)
+
+
+class CacheNamespace:
+    """
+    Keys in the shared cache which belong together, such as a user's roles.
+    Keys include the namespace's version, so the whole namespace can be
+    expired at once without knowing its keys:
+
+        roles = CacheNamespace(f"roles:{user.pk}")
+        roles.get_or_set(provider.pk, load_roles)
+        roles.expire()
+
+    Lookups are counted by the cache.lookups metric, which has the
+    namespace's kind (the part of its name before the first colon) and
+    whether it was a hit or a miss as attributes.
+    """
+
+    def __init__(self, name: str, timeout=DEFAULT_TIMEOUT, versioned=True):
+        self.name = name
+        self.kind = name.split(":", 1)[0]
+        self.timeout = timeout
+        # Unversioned namespaces save a lookup per key, for keys which
+        # already include a version of their own
+        self.versioned = versioned
+
+    def version(self) -> str:
+        """
+        The namespace's current version, which is replaced by expire().
+        A missing version is replaced by a new one, which expires anything
+        that was cached under the old one.
+        """
+        return cache.get_or_set(self._version_key(), _new_version, timeout=None)
+
+    def expire(self):
+        cache.set(self._version_key(), _new_version(), timeout=None)
+
+    def key(self, key) -> str:
+        parts = key if isinstance(key, tuple) else (key,)
+        if self.versioned:
+            parts = (self.version(), *parts)
+        full_key = ":".join([self.name, *map(str, parts)])
+        if len(full_key) > MAX_KEY_LENGTH:
+            digest = hashlib.sha256(full_key.encode()).hexdigest()
+            full_key = f"{self.name[:100]}:{digest}"
+        return full_key
+
+    def get(self, key, default=None):
+        value = cache.get(self.key(key), _MISSING)
+        self._count(value is not _MISSING)
+        return default if value is _MISSING else value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT):
+        cache.set(self.key(key), value, self._timeout(timeout))
+
+    def delete(self, key):
+        cache.delete(self.key(key))
+
+    def get_or_set(self, key, compute, timeout=DEFAULT_TIMEOUT):
+        """
+        Get a value, computing and storing it if it is missing.
+        Only one process computes a missing value at a time, while the others
+        wait up to LOCK_SECONDS for it, so that an expired value which is
+        expensive to compute is not computed by every request at once.
+        """
+        full_key = self.key(key)
+        value = cache.get(full_key, _MISSING)
+        self._count(value is not _MISSING)
+        if value is not _MISSING:
+            return value
+
+        lock_key = f"{full_key}:lock"
+        if cache.add(lock_key, 1, LOCK_SECONDS):
+            try:
+                value = compute()
+                cache.set(full_key, value, self._timeout(timeout))
+            finally:
+                cache.delete(lock_key)
+            return value
+
+        deadline = time.monotonic() + LOCK_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            value = cache.get(full_key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+        logger.warning("Timed out waiting for %s to be cached", self.name)
+        return compute()
+
+    def _version_key(self):
+        return f"{self.name}:version"
+
+    def _timeout(self, timeout):
+        return self.timeout if timeout is DEFAULT_TIMEOUT else timeout
+
+    def _count(self, hit: bool):
+        _lookups.add(1, {"namespace": self.kind, "result": "hit" if hit else "miss"})
+
+
+def backend_stats() -> dict[str, int]:
+    """
+    Hits, misses and evictions counted by the cache server, across every
+    process which shares it. Only Redis keeps these counts.
+    """
+    client = getattr(cache, "_cache", None)
+    if client is None or not hasattr(client, "get_client"):
+        return {}
+
+    info = client.get_client().info("stats")
+    return {
+        "hits": info["keyspace_hits"],
+        "misses": info["keyspace_misses"],
+        "evictions": info["evicted_keys"],
+        "expired": info["expired_keys"],
+    }
+
+
+def _new_version():
+    return uuid.uuid4().hex
+
+
+def _observe_evictions(options):
+    try:
+        stats = backend_stats()
+    except Exception:
+        logger.exception("Failed to read the cache server's stats")
+        return []
+    if "evictions" not in stats:
+        return []
+    return [metrics.Observation(stats["evictions"])]
+
+
+_meter.create_observable_counter(
+    "cache.evictions",
+    callbacks=[_observe_evictions],
+    description="Keys evicted by the cache server to free memory",
+)
@@ -0,0 +1,67 @@
+import hashlib
+from datetime import date
+from functools import wraps
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.middleware.csrf import get_token
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+
+
+def conditional_page(fingerprint):
+    """
+    Answer repeat requests for a page with 304 Not Modified, without
+    rendering it, while the data it shows is unchanged.
+
+    The fingerprint function takes the view's arguments and returns
+    something which changes whenever the page's data does, such as the
+    latest updated_at of the rows shown. It should be a single cheap query.
+    Returning None (e.g. when the object is not found) lets the view respond
+    as usual.
+
+    The ETag also depends on who is asking and when their roles last
+    changed, which provider they are working for, their CSRF token, the date
+    (for ages and relative dates) and the deployed commit, as pages show all
+    of these.
+    Pages with flash messages waiting to be shown are always rendered.
+    """
+
+    def etag(request, *args, **kwargs):
+        if len(get_messages(request)):
+            return None
+
+        data_version = fingerprint(request, *args, **kwargs)
+        if data_version is None:
+            return None
+
+        # Make sure the CSRF secret the page's forms use is settled first
+        get_token(request)
+        parts = (
+            data_version,
+            request.user.pk,
+            # Touched when the user's roles change, which changes the header
+            # and which actions are shown
+            getattr(request.user, "updated_at", None),
+            request.session.get("current_provider"),
+            request.META.get("CSRF_COOKIE"),
+            date.today(),
+            settings.COMMIT_SHA,
+        )
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    def decorator(view_func):
+        conditional_view = condition(etag_func=etag)(view_func)
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            response = conditional_view(request, *args, **kwargs)
+            if response.has_header("ETag"):
+                # Browsers must check with us before reusing the page, and
+                # shared caches must not keep patient data at all
+                patch_cache_control(response, private=True, no_cache=True)
+            return response
+
+        return wrapper
+
+    return decorator
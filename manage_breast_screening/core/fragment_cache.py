@@ -0,0 +1,74 @@
+from django.conf import settings
+from django.db import transaction
+from jinja2 import nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+from .caching import CacheNamespace
+
+
+def fragment_version(scope: str, pk) -> str:
+    """
+    The current version stamp of the fragments rendered for an object, such
+    as the rows of a clinic's appointment list
+    """
+    return CacheNamespace(f"fragments:{scope}:{pk}").version()
+
+
+def expire_fragments(scope: str, *pks):
+    """
+    Give objects new version stamps, so that their fragments are rendered
+    afresh. The stamps are changed again once the transaction commits, in
+    case a page was rendered from the old data in the meantime.
+    """
+    if not pks or not settings.FRAGMENT_CACHE_ENABLED:
+        return
+
+    def set_versions():
+        for pk in pks:
+            CacheNamespace(f"fragments:{scope}:{pk}").expire()
+
+    set_versions()
+    transaction.on_commit(set_versions)
+
+
+class FragmentCacheExtension(Extension):
+    """
+    Cache the output of part of a template, keyed by the values given:
+
+        {% cache "appointment-row", clinic_pk, version, appointment.pk %}
+        ...
+        {% endcache %}
+
+    Cached fragments are kept for FRAGMENT_CACHE_SECONDS. Anything that
+    depends on the current user or request, such as forms with a CSRF token,
+    must stay outside the block or be part of the key.
+    Unless FRAGMENT_CACHE_ENABLED is set, the block is rendered every time.
+    """
+
+    tags = {"cache"}
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+
+        key_parts = [parser.parse_expression()]
+        while parser.stream.skip_if("comma"):
+            key_parts.append(parser.parse_expression())
+
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+
+        return nodes.CallBlock(
+            self.call_method("_cache_fragment", [nodes.List(key_parts)]),
+            [],
+            [],
+            body,
+        ).set_lineno(lineno)
+
+    def _cache_fragment(self, key_parts, caller):
+        if not settings.FRAGMENT_CACHE_ENABLED:
+            return caller()
+
+        fragments = CacheNamespace(
+            "fragments", timeout=settings.FRAGMENT_CACHE_SECONDS, versioned=False
+        )
+        return Markup(fragments.get_or_set(tuple(key_parts), lambda: str(caller())))
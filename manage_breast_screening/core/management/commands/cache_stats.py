@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from manage_breast_screening.core.caching import backend_stats
+
+
+class Command(BaseCommand):
+    help = "Report the shared cache's hits, misses and evictions"
+
+    requires_system_checks = []
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"Backend: {settings.CACHES['default']['BACKEND']}")
+
+        stats = backend_stats()
+        if not stats:
+            self.stdout.write(
+                self.style.WARNING("This backend does not keep hit or miss counts.")
+            )
+            return
+
+        lookups = stats["hits"] + stats["misses"]
+        for name, value in stats.items():
+            self.stdout.write(f"{name}: {value}")
+        if lookups:
+            self.stdout.write(f"hit rate: {stats['hits'] / lookups:.1%}")
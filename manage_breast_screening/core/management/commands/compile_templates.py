@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.template import engines
+from django.template.backends.jinja2 import Jinja2
+from jinja2 import TemplateSyntaxError
+
+
+class Command(BaseCommand):
+    help = (
+        "Compile every Jinja template, including the NHS frontend components, "
+        "into JINJA2_BYTECODE_CACHE_DIR"
+    )
+
+    requires_system_checks = []
+
+    def handle(self, *args, **options):
+        if not settings.JINJA2_BYTECODE_CACHE_DIR:
+            self.stdout.write(
+                self.style.WARNING(
+                    "JINJA2_BYTECODE_CACHE_DIR is not set, so templates will "
+                    "only be checked for errors."
+                )
+            )
+
+        compiled = 0
+        errors = []
+        for engine in engines.all():
+            if not isinstance(engine, Jinja2):
+                continue
+
+            for name in engine.env.list_templates():
+                try:
+                    engine.env.get_template(name)
+                except TemplateSyntaxError as e:
+                    errors.append(f"{name}:{e.lineno}: {e.message}")
+                else:
+                    compiled += 1
+
+        self.stdout.write(f"Compiled {compiled} templates")
+        if errors:
+            raise CommandError("\n".join(["Failed to compile:", *errors]))
@@ -4,6 +4,7 @@ from typing import Callable, Optional
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import redirect
 from django.urls import reverse
+from django.utils.functional import SimpleLazyObject
 
 from manage_breast_screening.clinics.models import Provider
 from manage_breast_screening.core.decorators import is_current_provider_exempt
@@ -17,7 +18,8 @@ class CurrentProviderMiddleware:
     Views can be exempted by decorating them with @current_provider_exempt.
 
     Also adds a `current_provider` attribute to the request object that lazily
-    loads the Provider instance from the database.
+    loads the Provider instance, from the process's provider cache or the
+    database, when it is first used.
     """
 
     def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
@@ -45,11 +47,13 @@ class CurrentProviderMiddleware:
     def _add_current_provider_property(self, request: HttpRequest) -> None:
         """Add current_provider attribute to request.user.
 
-        Loads the Provider instance from the database based on the
-        current_provider session value.
+        The Provider instance for the current_provider session value is only
+        loaded if the view uses it, and is usually served from Provider.cached()
         """
         provider_id = request.session.get("current_provider")
         if provider_id:
-            request.user.current_provider = Provider.objects.get(pk=provider_id)
+            request.user.current_provider = SimpleLazyObject(
+                lambda: Provider.cached(provider_id)
+            )
         else:
             request.user.current_provider = None
@@ -4,6 +4,8 @@ from django.utils.html import conditional_escape as django_html_escape
 from django.utils.safestring import SafeData, SafeString, mark_safe
 from markupsafe import Markup, escape
 
+HEADER_IDENTITY_SESSION_KEY = "header_identity"
+
 
 def no_wrap(value: str) -> Markup:
     """
@@ -116,22 +118,33 @@ def get_notification_banner_params(
         }
 
 
-def _user_name_and_role_item(user):
+def _user_name_and_role_item(user, session=None):
     if user.is_authenticated:
+        # The text is cached in the session until the user, or one of their
+        # assignments, changes
+        version = [str(user.pk), user.updated_at.isoformat()]
+        cached = session.get(HEADER_IDENTITY_SESSION_KEY) if session else None
+        if cached and cached["version"] == version:
+            return {"text": cached["text"], "icon": True}
+
         name_and_role_text = f"{user.last_name.upper()}, {user.first_name}"
-        roles = set()
-        for assignment in user.assignments.all():
-            roles.update(assignment.roles)
+        roles = set().union(*user.roles_by_provider.values())
         if roles:
             name_and_role_text += f" ({', '.join(sorted(roles))})"
 
+        if session is not None:
+            session[HEADER_IDENTITY_SESSION_KEY] = {
+                "version": version,
+                "text": name_and_role_text,
+            }
+
         return {"text": name_and_role_text, "icon": True}
 
 
-def header_account_items(user):
+def header_account_items(user, session=None):
     items = []
 
-    user_name_and_role = _user_name_and_role_item(user)
+    user_name_and_role = _user_name_and_role_item(user, session)
     if user_name_and_role:
         items.append(user_name_and_role)
 
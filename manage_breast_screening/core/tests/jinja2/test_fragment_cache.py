@@ -0,0 +1,59 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from ...fragment_cache import expire_fragments, fragment_version
+
+
+def test_fragment_is_rendered_once_per_key(jinja_env):
+    template = jinja_env.from_string(
+        '{% cache "greeting", version %}Hello {{ name() }}{% endcache %}'
+    )
+    name = MagicMock(return_value="world")
+
+    assert template.render(version=1, name=name) == "Hello world"
+    assert template.render(version=1, name=name) == "Hello world"
+    assert name.call_count == 1
+
+    template.render(version=2, name=name)
+    assert name.call_count == 2
+
+
+def test_fragments_are_not_cached_without_a_shared_cache(jinja_env, settings):
+    settings.FRAGMENT_CACHE_ENABLED = False
+    template = jinja_env.from_string(
+        '{% cache "greeting", version %}Hello {{ name() }}{% endcache %}'
+    )
+    name = MagicMock(side_effect=["world", "again"])
+
+    assert template.render(version=1, name=name) == "Hello world"
+    assert template.render(version=1, name=name) == "Hello again"
+
+
+def test_content_outside_the_block_is_not_cached(jinja_env):
+    template = jinja_env.from_string(
+        '{% cache "greeting" %}Hello{% endcache %} {{ name }}'
+    )
+
+    assert template.render(name="Alice") == "Hello Alice"
+    assert template.render(name="Bob") == "Hello Bob"
+
+
+@pytest.mark.django_db
+def test_fragment_version_is_stable_until_expired():
+    version = fragment_version("clinic", 1)
+
+    assert fragment_version("clinic", 1) == version
+    assert fragment_version("clinic", 2) != version
+
+    expire_fragments("clinic", 1)
+    assert fragment_version("clinic", 1) != version
+
+
+@pytest.mark.django_db
+def test_fragments_are_expired_again_on_commit(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        expire_fragments("clinic", 1)
+        version = fragment_version("clinic", 1)
+
+    assert fragment_version("clinic", 1) != version
@@ -0,0 +1,43 @@
+from copy import deepcopy
+from io import StringIO
+
+import pytest
+from django.conf import settings
+from django.core.management import CommandError, call_command
+from django.test import override_settings
+
+
+@pytest.fixture
+def template_dir(tmp_path):
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    (template_dir / "extra.jinja").write_text("{% if true %}hello{% endif %}")
+    return template_dir
+
+
+def jinja_settings(template_dir, cache_dir):
+    templates = deepcopy(settings.TEMPLATES)
+    templates[0]["DIRS"] = [template_dir]
+    return override_settings(
+        TEMPLATES=templates, JINJA2_BYTECODE_CACHE_DIR=str(cache_dir)
+    )
+
+
+class TestCompileTemplates:
+    def test_fills_the_bytecode_cache(self, tmp_path, template_dir):
+        cache_dir = tmp_path / "cache"
+        out = StringIO()
+
+        with jinja_settings(template_dir, cache_dir):
+            call_command("compile_templates", stdout=out)
+
+        compiled = int(out.getvalue().split()[1])
+        assert compiled > 100
+        assert len(list(cache_dir.glob("__jinja2_*.cache"))) == compiled
+
+    def test_reports_templates_which_fail_to_compile(self, tmp_path, template_dir):
+        (template_dir / "broken.jinja").write_text("{% if true %}unclosed")
+
+        with jinja_settings(template_dir, tmp_path / "cache"):
+            with pytest.raises(CommandError, match="broken.jinja:1"):
+                call_command("compile_templates", stdout=StringIO())
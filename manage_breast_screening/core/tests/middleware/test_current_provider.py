@@ -1,3 +1,4 @@
+from types import SimpleNamespace
 from typing import Callable
 from unittest.mock import Mock
 
@@ -81,3 +82,30 @@ class TestCurrentProviderMiddleware:
         mw(request)
 
         assert request.user.current_provider is None
+
+    def test_only_loads_current_provider_when_used(self, django_assert_num_queries):
+        provider = ProviderFactory()
+        request = RequestFactory().get("/")
+        request.session = {"current_provider": str(provider.pk)}
+        request.user = SimpleNamespace(is_authenticated=True)
+
+        with django_assert_num_queries(0):
+            _make_middleware()(request)
+
+        with django_assert_num_queries(1):
+            assert request.user.current_provider.pk == provider.pk
+
+    def test_serves_current_provider_from_cache_on_later_requests(
+        self, django_assert_num_queries
+    ):
+        provider = ProviderFactory()
+        mw = _make_middleware()
+
+        for expected_queries in [1, 0]:
+            request = RequestFactory().get("/")
+            request.session = {"current_provider": str(provider.pk)}
+            request.user = SimpleNamespace(is_authenticated=True)
+            mw(request)
+
+            with django_assert_num_queries(expected_queries):
+                assert request.user.current_provider.name == provider.name
@@ -0,0 +1,144 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+from django.core.management import call_command
+
+from ..caching import MAX_KEY_LENGTH, CacheNamespace, backend_stats
+
+
+class TestCacheNamespace:
+    def test_get_and_set(self):
+        namespace = CacheNamespace("things")
+        assert namespace.get("a") is None
+
+        namespace.set("a", 1)
+        assert namespace.get("a") == 1
+        assert CacheNamespace("other").get("a") is None
+
+    def test_cached_none_is_a_hit(self):
+        namespace = CacheNamespace("things")
+        namespace.set("a", None)
+
+        assert namespace.get("a", default="missing") is None
+
+    def test_expire_drops_every_key(self):
+        namespace = CacheNamespace("things")
+        namespace.set("a", 1)
+        namespace.set(("b", 2), 2)
+
+        namespace.expire()
+
+        assert namespace.get("a") is None
+        assert namespace.get(("b", 2)) is None
+
+    def test_unversioned_keys_do_not_expire(self):
+        namespace = CacheNamespace("things", versioned=False)
+        namespace.set("a", 1)
+
+        namespace.expire()
+
+        assert namespace.get("a") == 1
+
+    def test_long_keys_are_hashed(self):
+        namespace = CacheNamespace("things")
+        key = ("x" * MAX_KEY_LENGTH,)
+
+        assert len(namespace.key(key)) < MAX_KEY_LENGTH
+        namespace.set(key, 1)
+        assert namespace.get(key) == 1
+
+    def test_get_or_set_computes_once(self):
+        namespace = CacheNamespace("things")
+        compute = MagicMock(return_value=1)
+
+        assert namespace.get_or_set("a", compute) == 1
+        assert namespace.get_or_set("a", compute) == 1
+        compute.assert_called_once()
+
+    def test_get_or_set_lets_one_caller_compute_a_missing_value(self):
+        namespace = CacheNamespace("things")
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return "value"
+
+        results = []
+        first = threading.Thread(
+            target=lambda: results.append(namespace.get_or_set("a", compute))
+        )
+        first.start()
+        started.wait(timeout=5)
+
+        waiters = [
+            threading.Thread(
+                target=lambda: results.append(namespace.get_or_set("a", compute))
+            )
+            for _ in range(3)
+        ]
+        for waiter in waiters:
+            waiter.start()
+        release.set()
+        for thread in [first, *waiters]:
+            thread.join(timeout=10)
+
+        assert results == ["value"] * 4
+        assert len(calls) == 1
+
+    def test_lookups_are_counted(self):
+        namespace = CacheNamespace("things:1")
+
+        with patch("manage_breast_screening.core.caching._lookups") as lookups:
+            namespace.get("a")
+            namespace.set("a", 1)
+            namespace.get("a")
+
+        assert [call.args for call in lookups.add.call_args_list] == [
+            (1, {"namespace": "things", "result": "miss"}),
+            (1, {"namespace": "things", "result": "hit"}),
+        ]
+
+
+def test_backend_stats_from_redis():
+    redis_cache = MagicMock()
+    redis_cache._cache.get_client.return_value.info.return_value = {
+        "keyspace_hits": 5,
+        "keyspace_misses": 2,
+        "evicted_keys": 1,
+        "expired_keys": 3,
+    }
+
+    with patch("manage_breast_screening.core.caching.cache", redis_cache):
+        assert backend_stats() == {
+            "hits": 5,
+            "misses": 2,
+            "evictions": 1,
+            "expired": 3,
+        }
+
+
+def test_backend_stats_from_local_memory():
+    assert backend_stats() == {}
+
+
+class TestCacheStatsCommand:
+    def test_reports_backend_stats(self, capsys):
+        stats = {"hits": 3, "misses": 1, "evictions": 0, "expired": 2}
+        with patch(
+            "manage_breast_screening.core.management.commands.cache_stats.backend_stats",
+            return_value=stats,
+        ):
+            call_command("cache_stats")
+
+        output = capsys.readouterr().out
+        assert "evictions: 0" in output
+        assert "hit rate: 75.0%" in output
+
+    def test_local_memory_has_no_stats(self, capsys):
+        call_command("cache_stats")
+
+        assert "does not keep hit or miss counts" in capsys.readouterr().out
@@ -0,0 +1,89 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from django.contrib.messages import INFO
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from manage_breast_screening.core.conditional_get import conditional_page
+
+
+def page(request, pk):
+    return HttpResponse(f"Page {pk}")
+
+
+@pytest.fixture
+def make_request():
+    def make_request(etag=None):
+        headers = {"If-None-Match": etag} if etag else {}
+        request = RequestFactory().get("/page", headers=headers)
+        request.user = MagicMock(pk=1, updated_at=datetime(2025, 1, 1))
+        request.session = {"current_provider": "abc"}
+        request._messages = CookieStorage(request)
+        # As set by CsrfViewMiddleware from the CSRF cookie
+        request.META["CSRF_COOKIE"] = "a" * 32
+        return request
+
+    return make_request
+
+
+class TestConditionalPage:
+    def test_repeat_requests_are_not_modified(self, make_request):
+        view = conditional_page(lambda request, pk: {"updated_at": 1})(page)
+
+        first = view(make_request(), pk=1)
+        second = view(make_request(first["ETag"]), pk=1)
+
+        assert first.status_code == 200
+        assert "private" in first["Cache-Control"]
+        assert "no-cache" in first["Cache-Control"]
+        assert second.status_code == 304
+
+    def test_changed_data_is_rendered_again(self, make_request):
+        versions = iter([1, 2])
+        view = conditional_page(lambda request, pk: next(versions))(page)
+
+        first = view(make_request(), pk=1)
+        second = view(make_request(first["ETag"]), pk=1)
+
+        assert second.status_code == 200
+        assert second["ETag"] != first["ETag"]
+
+    def test_other_users_get_their_own_etag(self, make_request):
+        view = conditional_page(lambda request, pk: 1)(page)
+        first = view(make_request(), pk=1)
+
+        request = make_request(first["ETag"])
+        request.user = MagicMock(pk=2, updated_at=datetime(2025, 1, 1))
+
+        assert view(request, pk=1).status_code == 200
+
+    def test_a_role_change_renders_the_page_again(self, make_request):
+        view = conditional_page(lambda request, pk: 1)(page)
+        first = view(make_request(), pk=1)
+
+        request = make_request(first["ETag"])
+        request.user.updated_at = datetime(2025, 1, 2)
+
+        assert view(request, pk=1).status_code == 200
+
+    def test_pages_with_pending_messages_are_rendered(self, make_request):
+        view = conditional_page(lambda request, pk: 1)(page)
+        first = view(make_request(), pk=1)
+
+        request = make_request(first["ETag"])
+        request._messages.add(INFO, "Saved")
+        response = view(request, pk=1)
+
+        assert response.status_code == 200
+        assert not response.has_header("ETag")
+
+    def test_no_fingerprint_renders_the_page_as_usual(self, make_request):
+        response = conditional_page(lambda request, pk: None)(page)(
+            make_request(), pk=1
+        )
+
+        assert response.status_code == 200
+        assert not response.has_header("ETag")
@@ -7,6 +7,7 @@ from django.utils.safestring import mark_safe
 from markupsafe import Markup
 from pytest_django.asserts import assertHTMLEqual
 
+from manage_breast_screening.auth.models import Permission
 from manage_breast_screening.auth.tests.factories import UserFactory
 from manage_breast_screening.clinics.tests.factories import UserAssignmentFactory
 from manage_breast_screening.core.template_helpers import (
@@ -39,6 +40,41 @@ class TestHeaderAccountItems:
             {"href": "/auth/log-in/", "text": "Log in"},
         ]
 
+    def test_reuses_roles_loaded_for_permission_checks(self, django_assert_num_queries):
+        assignment = UserAssignmentFactory.create(clinical=True)
+        assignment.make_current()
+        user = assignment.user
+        user.has_perm(Permission.VIEW_PARTICIPANT_DATA)
+
+        with django_assert_num_queries(0):
+            header_account_items(user)
+
+    def test_caches_the_text_in_the_session(self, django_assert_num_queries):
+        user = UserFactory.create(first_name="Firstname", last_name="Lastname")
+        UserAssignmentFactory.create(clinical=True, user=user)
+        session = {}
+        header_account_items(user, session)
+        user.invalidate_roles()
+
+        with django_assert_num_queries(0):
+            assert header_account_items(user, session)[0] == {
+                "text": "LASTNAME, Firstname (Clinical)",
+                "icon": True,
+            }
+
+    def test_session_cache_expires_when_assignments_change(self):
+        user = UserFactory.create(first_name="Firstname", last_name="Lastname")
+        session = {}
+        header_account_items(user, session)
+
+        UserAssignmentFactory.create(administrative=True, user=user)
+        user.refresh_from_db()
+
+        assert header_account_items(user, session)[0] == {
+            "text": "LASTNAME, Firstname (Administrative)",
+            "icon": True,
+        }
+
 
 class TestMessageWithHeading:
     def test_message_with_heading(self):
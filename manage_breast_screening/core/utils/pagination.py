@@ -0,0 +1,105 @@
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from django.db.models import F, Field, Func, Value
+from django.db.models.lookups import GreaterThan, LessThan
+
+PAGE_SIZE = 50
+
+
+@dataclass
+class KeysetPage:
+    """
+    One page of a list ordered by a key and primary key, with cursors for the
+    pages either side of it. A cursor is None when there is no such page.
+    """
+
+    items: list
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
+def encode_cursor(key: datetime, pk: UUID) -> str:
+    value = f"{key.isoformat()}|{pk}"
+    return base64.urlsafe_b64encode(value.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None) -> tuple[datetime, UUID] | None:
+    """
+    Decode a cursor from a query string, ignoring one that is missing or has
+    been tampered with, so that the list falls back to its first page
+    """
+    if not cursor:
+        return None
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key, pk = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(key), UUID(pk)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+
+
+def keyset_page(
+    queryset, key: str, after=None, before=None, size=None, desc=False
+) -> KeysetPage:
+    """
+    Fetch the page of the queryset after or before a cursor, ordered by the
+    key field then primary key.
+    Unlike offset pagination, the cursor is compared as a row,
+    (key, pk) > (cursor key, cursor pk), which Postgres can answer with a
+    seek on an index of (key, id), so later pages are as fast as the first.
+    """
+    size = size or PAGE_SIZE
+    queryset = queryset.annotate(page_key=F(key))
+    after = decode_cursor(after)
+    before = None if after else decode_cursor(before)
+
+    # Before a cursor, read backwards from it and put the rows back in order
+    backwards = before is not None
+    descending = desc != backwards
+    if descending:
+        queryset = queryset.order_by("-page_key", "-pk")
+    else:
+        queryset = queryset.order_by("page_key", "pk")
+
+    cursor = before or after
+    if cursor is not None:
+        lookup = LessThan if descending else GreaterThan
+        queryset = queryset.filter(
+            lookup(_row(F("page_key"), F("pk")), _row(*map(Value, cursor)))
+        )
+
+    items = list(queryset[: size + 1])
+    has_more = len(items) > size
+    items = items[:size]
+    if backwards:
+        items.reverse()
+
+    if not items:
+        return KeysetPage(items)
+
+    first = encode_cursor(items[0].page_key, items[0].pk)
+    last = encode_cursor(items[-1].page_key, items[-1].pk)
+    if backwards:
+        return KeysetPage(
+            items, next_cursor=last, previous_cursor=first if has_more else None
+        )
+    return KeysetPage(
+        items,
+        next_cursor=last if has_more else None,
+        previous_cursor=first if after else None,
+    )
+
+
+def _row(*expressions):
+    return Func(*expressions, function="ROW", output_field=Field())
@@ -0,0 +1,18 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from ..pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    key = datetime(2025, 1, 1, 9, 30, tzinfo=timezone.utc)
+    pk = uuid.uuid4()
+
+    assert decode_cursor(encode_cursor(key, pk)) == (key, pk)
+
+
+@pytest.mark.parametrize("cursor", [None, "", "not-a-cursor", "bm90fGF8Y3Vyc29y"])
+def test_invalid_cursors_are_ignored(cursor):
+    assert decode_cursor(cursor) is None
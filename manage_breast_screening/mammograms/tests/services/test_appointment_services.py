@@ -22,7 +22,7 @@ class TestAppointmentStatusUpdater:
             appointment=appointment, current_user=clinical_user
         )
 
-        with pytest.raises(InvalidState):
+        with pytest.raises(InvalidState, match=AppointmentStatus.CANCELLED):
             service.check_in()
 
     def test_valid_check_in(self, clinical_user):
@@ -36,6 +36,23 @@ class TestAppointmentStatusUpdater:
         new_status = service.check_in()
         assert new_status.state == AppointmentStatus.CHECKED_IN
 
+    def test_transition_records_the_current_state_on_the_appointment(
+        self, clinical_user
+    ):
+        appointment = AppointmentFactory.create(
+            current_status=AppointmentStatus.CONFIRMED
+        )
+        service = AppointmentStatusUpdater(
+            appointment=appointment, current_user=clinical_user
+        )
+
+        new_status = service.check_in()
+
+        assert appointment.current_state == AppointmentStatus.CHECKED_IN
+        appointment.refresh_from_db()
+        assert appointment.current_state == AppointmentStatus.CHECKED_IN
+        assert appointment.latest_status == new_status
+
     def test_invalid_start(self, clinical_user):
         appointment = AppointmentFactory.create(
             current_status=AppointmentStatus.CANCELLED
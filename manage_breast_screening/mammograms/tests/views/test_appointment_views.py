@@ -3,6 +3,7 @@ from django.urls import reverse
 from pytest_django.asserts import assertContains, assertRedirects
 
 from manage_breast_screening.core.models import AuditLog
+from manage_breast_screening.participants.models import AppointmentStatus
 from manage_breast_screening.participants.tests.factories import AppointmentFactory
 
 
@@ -20,6 +21,23 @@ class TestShowAppointment:
         )
         assert response.status_code == 200
 
+    def test_repeat_requests_are_not_modified_until_the_status_changes(
+        self, clinical_user_client
+    ):
+        appointment = AppointmentFactory.create(
+            clinic_slot__clinic__setting__provider=clinical_user_client.current_provider
+        )
+        url = reverse("mammograms:show_appointment", kwargs={"pk": appointment.pk})
+        etag = clinical_user_client.http.get(url)["ETag"]
+
+        response = clinical_user_client.http.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        appointment.statuses.create(state=AppointmentStatus.CHECKED_IN)
+
+        response = clinical_user_client.http.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+
 
 @pytest.mark.django_db
 class TestConfirmIdentity:
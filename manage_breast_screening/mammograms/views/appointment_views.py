@@ -1,12 +1,15 @@
 import logging
 
+from django.db.models import Count, Max
 from django.http import Http404
 from django.shortcuts import redirect, render
 from django.urls import reverse, reverse_lazy
+from django.utils.decorators import method_decorator
 from django.views import View
 from django.views.decorators.http import require_http_methods
 from django.views.generic import FormView, TemplateView
 
+from manage_breast_screening.core.conditional_get import conditional_page
 from manage_breast_screening.core.services.auditor import Auditor
 from manage_breast_screening.mammograms.services.appointment_services import (
     AppointmentStatusUpdater,
@@ -36,6 +39,22 @@ APPOINTMENT_CANNOT_PROCEED = "Appointment cannot proceed"
 logger = logging.getLogger(__name__)
 
 
+def appointment_fingerprint(request, pk):
+    participant = "screening_episode__participant"
+    version = request.user.current_provider.appointments.filter(pk=pk).aggregate(
+        latest_appointment=Max("updated_at"),
+        latest_status=Max("latest_status__created_at"),
+        latest_screening_episode=Max("screening_episode__updated_at"),
+        latest_participant=Max(f"{participant}__updated_at"),
+        latest_clinic_slot=Max("clinic_slot__updated_at"),
+        latest_clinic=Max("clinic_slot__clinic__updated_at"),
+        latest_mammograms=Max(f"{participant}__reported_mammograms__updated_at"),
+        mammogram_count=Count(f"{participant}__reported_mammograms", distinct=True),
+    )
+    return version if version["latest_appointment"] else None
+
+
+@method_decorator(conditional_page(appointment_fingerprint), name="get")
 class ShowAppointment(AppointmentMixin, View):
     """
     Show a completed appointment. Redirects to the start screening form
@@ -78,6 +97,7 @@ class ShowAppointment(AppointmentMixin, View):
         )
 
 
+@method_decorator(conditional_page(appointment_fingerprint), name="get")
 class ParticipantDetails(AppointmentMixin, View):
     """
     Show a completed appointment. Redirects to the start screening form
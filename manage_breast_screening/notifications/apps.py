@@ -10,5 +10,5 @@ class NotificationsConfig(AppConfig):
     name = "manage_breast_screening.notifications"
 
     def ready(self) -> None:
-        ApplicationInsightsLogging().configure_azure_monitor()
+        ApplicationInsightsLogging.shared().configure_azure_monitor()
         return super().ready()
@@ -0,0 +1,93 @@
+import os
+from datetime import datetime, timezone
+from logging import getLogger
+from tempfile import SpooledTemporaryFile
+
+from dateutil.relativedelta import relativedelta
+from django.core.management.base import BaseCommand
+
+from manage_breast_screening.notifications.management.commands.helpers.exception_handler import (
+    exception_handler,
+)
+from manage_breast_screening.notifications.management.commands.helpers.status_partitions import (
+    PARTITIONED_TABLES,
+    Partition,
+    StatusPartitions,
+)
+from manage_breast_screening.notifications.services import compression
+from manage_breast_screening.notifications.services.blob_storage import BlobStorage
+
+logger = getLogger(__name__)
+INSIGHTS_ERROR_NAME = "ArchiveStatusPartitionsError"
+# Partitions larger than this are spooled to disk rather than held in memory
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+ENCODING = "gzip"
+MONTHS_AHEAD = 3
+# The aggregate report looks back 3 months from today
+MINIMUM_RETENTION_MONTHS = 4
+
+
+class Command(BaseCommand):
+    """
+    Django Admin command which maintains the monthly partitions of the
+    ChannelStatus and MessageStatus tables.
+    Partitions are created for the current month and the next 3 months.
+    Partitions older than NOTIFICATIONS_STATUS_RETENTION_MONTHS (default 6)
+    are detached, stored in Azure Blob storage as gzipped CSV and dropped.
+    A partition is only dropped once its archive has been uploaded.
+    """
+
+    def handle(self, *args, **options):
+        with exception_handler(INSIGHTS_ERROR_NAME):
+            logger.info("Archive Status Partitions Command started")
+
+            this_month = datetime.now(tz=timezone.utc).date().replace(day=1)
+            cutoff = this_month - relativedelta(months=self.retention_months())
+
+            for table in PARTITIONED_TABLES:
+                partitions = StatusPartitions(table)
+
+                for partition in partitions.ensure(
+                    this_month, this_month + relativedelta(months=MONTHS_AHEAD)
+                ):
+                    logger.info("Created partition %s", partition.name)
+
+                for partition in partitions.older_than(cutoff):
+                    self.archive(partitions, partition)
+                    logger.info("Archived partition %s", partition.name)
+
+    def archive(self, partitions: StatusPartitions, partition: Partition):
+        partitions.detach(partition)
+
+        with (
+            SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as rows,
+            SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as archive,
+        ):
+            partitions.write_csv(partition, rows)
+            rows.seek(0)
+            compression.compress(rows, archive, ENCODING)
+            archive.seek(0)
+
+            BlobStorage().add(
+                self.filename(partition),
+                archive,
+                content_type="text/csv",
+                content_encoding=ENCODING,
+            )
+
+        partitions.drop(partition)
+
+    def filename(self, partition: Partition) -> str:
+        return (
+            f"{partition.table}/{partition.month:%Y-%m}.csv"
+            + compression.ENCODINGS[ENCODING]
+        )
+
+    def retention_months(self) -> int:
+        months = int(os.getenv("NOTIFICATIONS_STATUS_RETENTION_MONTHS", "6"))
+        if months < MINIMUM_RETENTION_MONTHS:
+            raise ValueError(
+                f"NOTIFICATIONS_STATUS_RETENTION_MONTHS must be at least "
+                f"{MINIMUM_RETENTION_MONTHS}"
+            )
+        return months
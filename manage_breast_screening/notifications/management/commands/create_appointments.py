@@ -2,8 +2,8 @@ import io
 import os
 from datetime import datetime
 from logging import getLogger
+from typing import TYPE_CHECKING
 
-import pandas
 from django.core.management.base import BaseCommand
 
 from manage_breast_screening.notifications.management.commands.helpers.exception_handler import (
@@ -17,6 +17,10 @@ from manage_breast_screening.notifications.models import (
 )
 from manage_breast_screening.notifications.services.blob_storage import BlobStorage
 
+# pandas is slow to import, so is imported when there is data to read
+if TYPE_CHECKING:
+    import pandas
+
 DIR_NAME_DATE_FORMAT = "%Y-%m-%d"
 INSIGHTS_ERROR_NAME = "CreateAppointmentsError"
 logger = getLogger(__name__)
@@ -68,7 +72,9 @@ class Command(BaseCommand):
     def is_not_holding_clinic(self, row):
         return row.get("Holding Clinic") != "Y"
 
-    def raw_data_to_data_frame(self, raw_data: str) -> pandas.DataFrame:
+    def raw_data_to_data_frame(self, raw_data: str) -> "pandas.DataFrame":
+        import pandas
+
         return pandas.read_table(
             io.StringIO(raw_data),
             dtype="str",
@@ -80,7 +86,7 @@ class Command(BaseCommand):
             skipfooter=1,
         )
 
-    def find_or_create_clinic(self, row: pandas.Series) -> tuple[Clinic, bool]:
+    def find_or_create_clinic(self, row: "pandas.Series") -> tuple[Clinic, bool]:
         return Clinic.objects.get_or_create(
             bso_code=row["BSO"],
             code=row["Clinic Code"],
@@ -99,7 +105,7 @@ class Command(BaseCommand):
         )
 
     def update_or_create_appointment(
-        self, row: pandas.Series, clinic: Clinic
+        self, row: "pandas.Series", clinic: Clinic
     ) -> tuple[Appointment | None, bool]:
         appointment = Appointment.objects.filter(nbss_id=row["Appointment ID"]).first()
 
@@ -170,11 +176,11 @@ class Command(BaseCommand):
         return dt.replace(tzinfo=ZONE_INFO)
 
     def handle_aliased_column(
-        self, expected_name: str, fallback_name: str, row: pandas.Series
+        self, expected_name: str, fallback_name: str, row: "pandas.Series"
     ) -> object:
         return row.get(expected_name, row.get(fallback_name))
 
-    def appointment_date_and_time(self, row: pandas.Series) -> datetime:
+    def appointment_date_and_time(self, row: "pandas.Series") -> datetime:
         dt = datetime.strptime(
             f"{row['Appt Date']} {row['Appt Time']}",
             "%Y%m%d %H%M",
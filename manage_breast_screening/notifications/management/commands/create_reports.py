@@ -1,8 +1,12 @@
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
 from logging import getLogger
+from tempfile import SpooledTemporaryFile
+from typing import IO
 
-import pandas
 from django.core.management.base import BaseCommand
 from django.db import connection
 
@@ -10,12 +14,18 @@ from manage_breast_screening.notifications.management.commands.helpers.exception
     exception_handler,
 )
 from manage_breast_screening.notifications.models import ZONE_INFO
-from manage_breast_screening.notifications.queries.helper import Helper
+from manage_breast_screening.notifications.queries.helper import (
+    STATUS_LOOKBACK,
+    Helper,
+)
+from manage_breast_screening.notifications.services import compression
 from manage_breast_screening.notifications.services.blob_storage import BlobStorage
 from manage_breast_screening.notifications.services.nhs_mail import NhsMail
 
 logger = getLogger(__name__)
 INSIGHTS_ERROR_NAME = "CreateReportsError"
+# Reports larger than this are spooled to disk rather than held in memory
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
 
 
 class Command(BaseCommand):
@@ -27,16 +37,29 @@ class Command(BaseCommand):
     a 3 month time period and can be resource intensive.
     'failures' covers all failed status updates from NHS Notify and contains
     NHS numbers, Clinic and BSO code and failure dates and reasons for one day.
-    Reports are generated sequentially.
-    Reports are stored in Azure Blob storage.
+    Each (BSO, report) pair is generated independently on a bounded thread
+    pool (NOTIFICATIONS_REPORTS_MAX_WORKERS, default 4), so one report's upload
+    and email can overlap with another's query. A failed report is logged and
+    does not stop the others; the command fails once all have finished.
+    All report emails in a run are sent over a single SMTP session.
+    Query results are streamed from a server-side cursor into a spooled
+    temporary file, so memory use is bounded regardless of report size.
+    Reports are stored in Azure Blob storage, optionally gzip or zstd
+    compressed (NOTIFICATIONS_REPORTS_COMPRESSION). A report whose content
+    matches the last one stored for the same BSO and report type is not
+    uploaded again.
     """
 
     SMOKE_TEST_BSO_CODE = "SM0K3"
     BSO_CODES = ["MBD"]
 
     REPORTS = [
-        ["aggregate", ["3 months"], None],
-        ["failures", [datetime.now(tz=ZONE_INFO).date()], "invites_not_sent"],
+        ["aggregate", ["3 months", STATUS_LOOKBACK], None],
+        [
+            "failures",
+            [datetime.now(tz=ZONE_INFO).date(), STATUS_LOOKBACK],
+            "invites_not_sent",
+        ],
         ["reconciliation", [datetime.now(tz=ZONE_INFO).date()], None],
     ]
 
@@ -47,33 +70,153 @@ class Command(BaseCommand):
         with exception_handler(INSIGHTS_ERROR_NAME):
             logger.info("Create Report Command started")
 
-            bso_codes, report_configs = self.configuration(options)
-
-            for bso_code in bso_codes:
-                for filename, params, report_type in report_configs:
-                    dataframe = pandas.read_sql(
-                        Helper.sql(filename), connection, params=(params + [bso_code])
-                    )
+            if self.compression():
+                compression.validate(self.compression())
 
-                    csv = dataframe.to_csv(index=False)
-
-                    if not report_type:
-                        report_type = filename
-
-                    BlobStorage().add(
-                        self.filename(bso_code, report_type),
-                        csv,
-                        content_type="text/csv",
-                        container_name=os.getenv("REPORTS_CONTAINER_NAME"),
-                    )
-                    if not self.is_smoke_test(options):
-                        NhsMail().send_report_email(
-                            attachment_data=csv,
-                            attachment_filename=self.filename(bso_code, report_type),
-                            report_type=report_type,
+            bso_codes, report_configs = self.configuration(options)
+            smoke_test = self.is_smoke_test(options)
+            failures = []
+
+            with (
+                NhsMail() as mail,
+                ThreadPoolExecutor(max_workers=self.max_workers()) as executor,
+            ):
+                futures = {
+                    executor.submit(
+                        self.create_report,
+                        mail,
+                        bso_code,
+                        filename,
+                        params,
+                        report_type or filename,
+                        smoke_test,
+                    ): (bso_code, report_type or filename)
+                    for bso_code in bso_codes
+                    for filename, params, report_type in report_configs
+                }
+
+                for future in as_completed(futures):
+                    bso_code, report_type = futures[future]
+                    try:
+                        elapsed = future.result()
+                    except Exception as e:
+                        logger.exception(
+                            "Report %s for %s failed", report_type, bso_code
+                        )
+                        failures.append(f"{bso_code} {report_type}: {e}")
+                    else:
+                        logger.info(
+                            "Report %s for %s created in %.2fs",
+                            report_type,
+                            bso_code,
+                            elapsed,
                         )
 
-                    logger.info("Report %s created", report_type)
+            if failures:
+                raise Exception(
+                    f"{len(failures)} of {len(futures)} reports failed: "
+                    + "; ".join(failures)
+                )
+
+    def create_report(
+        self,
+        mail: NhsMail,
+        bso_code: str,
+        filename: str,
+        params: list,
+        report_type: str,
+        smoke_test: bool,
+    ) -> float:
+        """
+        Generate, store and email a single report. Runs on a worker thread, so
+        it uses (and then closes) a database connection of its own.
+        Returns the time taken in seconds.
+        """
+        started_at = time.monotonic()
+        report_filename = self.filename(bso_code, report_type)
+
+        try:
+            with SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as report:
+                Helper.write_csv(filename, params + [bso_code], report)
+
+                self.store(report, bso_code, report_type, report_filename, smoke_test)
+
+                if not smoke_test:
+                    report.seek(0)
+                    mail.send_report_email(
+                        attachment_data=report.read(),
+                        attachment_filename=report_filename,
+                        report_type=report_type,
+                    )
+        finally:
+            connection.close()
+
+        return time.monotonic() - started_at
+
+    def store(
+        self,
+        report: IO[bytes],
+        bso_code: str,
+        report_type: str,
+        report_filename: str,
+        smoke_test: bool,
+    ):
+        """
+        Upload a report, compressed if configured, unless its content is the
+        same as the last report uploaded for this BSO and report type.
+        A small 'latest' marker blob per BSO and report type records the
+        content hash of the last upload.
+        """
+        storage = BlobStorage()
+        container_name = os.getenv("REPORTS_CONTAINER_NAME")
+        digest = compression.sha256(report)
+        marker_filename = self.latest_filename(bso_code, report_type)
+
+        if not smoke_test:
+            previous = storage.metadata(marker_filename, container_name) or {}
+            if previous.get("sha256") == digest:
+                logger.info(
+                    "Report %s for %s is unchanged since %s, skipping upload",
+                    report_type,
+                    bso_code,
+                    previous.get("artefact"),
+                )
+                return
+
+        encoding = self.compression()
+        content_settings = {"content_type": "text/csv"}
+        if encoding:
+            content_settings["content_encoding"] = encoding
+        artefact_filename = report_filename + compression.ENCODINGS.get(encoding, "")
+
+        report.seek(0)
+        with self.encoded(report, encoding) as artefact:
+            storage.add(
+                artefact_filename,
+                artefact,
+                container_name=container_name,
+                metadata={"sha256": digest},
+                **content_settings,
+            )
+
+        storage.add(
+            marker_filename,
+            b"",
+            content_type="text/plain",
+            container_name=container_name,
+            metadata={"sha256": digest, "artefact": artefact_filename},
+        )
+
+    @contextmanager
+    def encoded(self, report: IO[bytes], encoding: str):
+        if not encoding:
+            yield report
+            return
+
+        with SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as compressed:
+            compression.compress(report, compressed, encoding)
+            compressed.seek(0)
+            yield compressed
 
     def configuration(self, options: dict) -> list[list]:
         if self.is_smoke_test(options):
@@ -92,5 +235,14 @@ class Command(BaseCommand):
             name = f"{datetime.today().strftime('%Y-%m-%dT%H:%M:%S')}-{name}"
         return name
 
+    def latest_filename(self, bso_code: str, report_type: str) -> str:
+        return f"latest/{bso_code}-{report_type.replace('_', '-')}-report"
+
+    def compression(self) -> str:
+        return os.getenv("NOTIFICATIONS_REPORTS_COMPRESSION", "")
+
+    def max_workers(self) -> int:
+        return int(os.getenv("NOTIFICATIONS_REPORTS_MAX_WORKERS", "4"))
+
     def is_smoke_test(self, options):
         return options.get("smoke_test", False)
@@ -61,10 +61,14 @@ class MessageBatchHelpers:
             response.status_code,
             response.text,
         )
-        ApplicationInsightsLogging().custom_event(
+        insights_logging = ApplicationInsightsLogging.shared()
+        insights_logging.custom_event(
             message=log_msg,
             event_name="batch_marked_as_failed",
         )
+        insights_logging.metric(
+            "batch_marked_as_failed", 1, status_code=response.status_code
+        )
 
         try:
             message_batch.nhs_notify_errors = response.json()
@@ -0,0 +1,104 @@
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+# Dependencies which are slow to import and must only be imported on the code
+# paths which use them, never when a command starts up
+LAZY_MODULES = (
+    "pandas",
+    "azure.monitor.opentelemetry",
+    "mesh_client",
+    "azure.storage.blob",
+    "azure.storage.queue",
+)
+
+# Run in a fresh interpreter: start Django and load the command as
+# `manage.py <command>` does before calling its handle() method
+STARTUP_SCRIPT = """
+import json, os, sys
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "manage_breast_screening.config.settings")
+import django
+django.setup()
+from django.core.management import get_commands, load_command_class
+command = load_command_class(get_commands()[sys.argv[1]], sys.argv[1])
+if command.requires_system_checks:
+    command.check()
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+@dataclass
+class StartupProfile:
+    command: str
+    startup_ms: float
+    modules: list[str] = field(repr=False)
+    # Top level import -> cumulative import time in ms
+    import_ms: dict[str, float] = field(repr=False)
+
+    def slowest_imports(self, count: int = 10) -> list[tuple[str, float]]:
+        return sorted(self.import_ms.items(), key=lambda item: -item[1])[:count]
+
+    def lazy_modules_loaded(self) -> list[str]:
+        return [module for module in LAZY_MODULES if module in self.modules]
+
+    def as_dict(self) -> dict:
+        return {
+            "command": self.command,
+            "startup_ms": round(self.startup_ms, 1),
+            "slowest_imports": [
+                {"package": package, "cumulative_ms": round(ms, 1)}
+                for package, ms in self.slowest_imports()
+            ],
+            "lazy_modules_loaded": self.lazy_modules_loaded(),
+        }
+
+
+def profile_command(command: str) -> StartupProfile:
+    """
+    Time a cold start of `command` in a new Python process, with import
+    times recorded by `python -X importtime`
+    """
+    started_at = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_SCRIPT, command],
+        capture_output=True,
+        text=True,
+        env=os.environ.copy(),
+        check=False,
+    )
+    startup_ms = (time.perf_counter() - started_at) * 1000
+
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"Starting {command} failed: {result.stderr.strip().splitlines()[-1:]}"
+        )
+
+    return StartupProfile(
+        command=command,
+        startup_ms=startup_ms,
+        modules=json.loads(result.stdout.strip().splitlines()[-1]),
+        import_ms=parse_importtime(result.stderr),
+    )
+
+
+def parse_importtime(output: str) -> dict[str, float]:
+    """
+    Total cumulative import time in ms per top level package, from the
+    unindented (directly imported) entries of `-X importtime` output, e.g.
+    'import time:       512 |      40210 | pandas'
+    """
+    totals = defaultdict(float)
+
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if name.startswith("  ") or not cumulative.strip().isdigit():
+            continue
+        totals[name.strip().split(".")[0]] += int(cumulative) / 1000
+
+    return dict(totals)
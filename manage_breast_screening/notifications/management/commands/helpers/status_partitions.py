@@ -0,0 +1,129 @@
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import IO
+
+from dateutil.relativedelta import relativedelta
+from django.db import connection, transaction
+
+# Tables range partitioned by status_updated_at month,
+# see migration 0024_partition_status_tables
+PARTITIONED_TABLES = ("notifications_channelstatus", "notifications_messagestatus")
+
+
+@dataclass(frozen=True, order=True)
+class Partition:
+    """One calendar month (UTC) of a partitioned status table"""
+
+    table: str
+    month: date
+
+    @property
+    def name(self) -> str:
+        return f"{self.table}_p{self.month:%Y_%m}"
+
+    @property
+    def starts_at(self) -> datetime:
+        return datetime(self.month.year, self.month.month, 1, tzinfo=timezone.utc)
+
+    @property
+    def ends_at(self) -> datetime:
+        return self.starts_at + relativedelta(months=1)
+
+
+class StatusPartitions:
+    """
+    Creates, lists, detaches and drops the monthly partitions of a status table.
+    Partitions which have been detached but not yet dropped are still listed,
+    so an interrupted archive can be picked up by the next run.
+    """
+
+    def __init__(self, table: str):
+        if table not in PARTITIONED_TABLES:
+            raise ValueError(f"{table} is not a partitioned status table")
+        self.table = table
+        self.pattern = re.compile(rf"^{table}_p(\d{{4}})_(\d{{2}})$")
+
+    def partitions(self) -> list[Partition]:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT relname FROM pg_class WHERE relkind = 'r' AND relname LIKE %s",
+                [f"{self.table}_p%"],
+            )
+            names = [row[0] for row in cursor.fetchall()]
+
+        return sorted(
+            Partition(self.table, date(int(match[1]), int(match[2]), 1))
+            for name in names
+            if (match := self.pattern.match(name))
+        )
+
+    def ensure(self, first_month: date, last_month: date) -> list[Partition]:
+        """Create any missing partitions from `first_month` to `last_month` inclusive"""
+        existing = self.partitions()
+        created = []
+        month = first_month.replace(day=1)
+
+        while month <= last_month:
+            partition = Partition(self.table, month)
+            if partition not in existing:
+                self.create(partition)
+                created.append(partition)
+            month += relativedelta(months=1)
+
+        return created
+
+    def older_than(self, month: date) -> list[Partition]:
+        return [partition for partition in self.partitions() if partition.month < month]
+
+    def create(self, partition: Partition):
+        """
+        Create the partition and attach it. Any rows for its month which landed
+        in the default partition are moved into it first, as Postgres will not
+        attach a partition whose range overlaps rows in the default partition.
+        """
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE {partition.name} (LIKE {self.table} INCLUDING DEFAULTS)"
+            )
+            cursor.execute(
+                f"WITH moved AS ("
+                f"DELETE FROM {self.table}_default "
+                f"WHERE status_updated_at >= %s AND status_updated_at < %s "
+                f"RETURNING *"
+                f") INSERT INTO {partition.name} SELECT * FROM moved",
+                [partition.starts_at, partition.ends_at],
+            )
+            cursor.execute(
+                f"ALTER TABLE {self.table} ATTACH PARTITION {partition.name} "
+                f"FOR VALUES FROM ('{partition.starts_at.isoformat()}') "
+                f"TO ('{partition.ends_at.isoformat()}')"
+            )
+
+    def is_attached(self, partition: Partition) -> bool:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT EXISTS (SELECT 1 FROM pg_inherits WHERE inhrelid = %s::regclass)",
+                [partition.name],
+            )
+            return cursor.fetchone()[0]
+
+    def detach(self, partition: Partition):
+        if self.is_attached(partition):
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"ALTER TABLE {self.table} DETACH PARTITION {partition.name}"
+                )
+
+    def write_csv(self, partition: Partition, file: IO[bytes]):
+        """Stream every row of the partition to `file` as UTF-8 CSV with a header"""
+        with connection.cursor() as cursor:
+            with cursor.copy(
+                f"COPY {partition.name} TO STDOUT WITH (FORMAT csv, HEADER, ENCODING 'UTF8')"
+            ) as copy:
+                for chunk in copy:
+                    file.write(chunk)
+
+    def drop(self, partition: Partition):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE {partition.name}")
@@ -0,0 +1,266 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from logging import getLogger
+
+from django.core.management import call_command
+from django.db import close_old_connections
+
+logger = getLogger(__name__)
+
+# The scheduler loop is considered stalled if it has not ticked for this long
+HEARTBEAT_TIMEOUT_SECONDS = 60
+
+
+class CronSchedule:
+    """
+    A five field cron expression (minute, hour, day of month, month, day of
+    week) evaluated in UTC, as used by the Container Apps jobs in jobs.tf.
+    Supports '*', ranges, lists and steps, e.g. '0,30 9-12 * * 1-5'.
+    """
+
+    RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 6)]
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Invalid cron expression '{expression}'")
+
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, self.weekdays = (
+            self.parse(value, *bounds) for value, bounds in zip(fields, self.RANGES)
+        )
+        self.any_day = fields[2] == "*"
+        self.any_weekday = fields[4] == "*"
+
+    @staticmethod
+    def parse(value: str, low: int, high: int) -> set[int]:
+        values = set()
+        for part in value.split(","):
+            part, _, step = part.partition("/")
+            if part == "*":
+                start, end = low, high
+            elif "-" in part:
+                start, end = (int(bound) for bound in part.split("-"))
+            else:
+                start = end = int(part)
+
+            if start < low or end > high or start > end:
+                raise ValueError(f"Invalid cron field '{value}'")
+            values.update(range(start, end + 1, int(step or 1)))
+
+        return values
+
+    def matches(self, moment: datetime) -> bool:
+        day = moment.day in self.days
+        weekday = moment.isoweekday() % 7 in self.weekdays
+        # As in cron, a restricted day of month or day of week matches either
+        if self.any_day or self.any_weekday:
+            day_matches = day and weekday
+        else:
+            day_matches = day or weekday
+
+        return (
+            moment.minute in self.minutes
+            and moment.hour in self.hours
+            and moment.month in self.months
+            and day_matches
+        )
+
+
+@dataclass
+class Task:
+    """
+    A management command run by the worker, either on a cron schedule or
+    every `interval` seconds. At most `max_concurrency` runs of a task are in
+    progress at once; a run which falls due while the task is at its limit
+    is skipped.
+    """
+
+    command: str
+    schedule: CronSchedule | None = None
+    interval: float | None = None
+    max_concurrency: int = 1
+
+    running: int = 0
+    runs: int = 0
+    failures: int = 0
+    last_started_at: datetime | None = None
+    last_succeeded_at: datetime | None = None
+    last_error: str | None = None
+    next_run_at: float = 0.0
+    last_scheduled_minute: datetime | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __post_init__(self):
+        if (self.schedule is None) == (self.interval is None):
+            raise ValueError(f"{self.command} needs either a schedule or an interval")
+
+    def due(self, now: datetime, monotonic: float) -> bool:
+        if self.interval is not None:
+            if monotonic < self.next_run_at:
+                return False
+            self.next_run_at = monotonic + self.interval
+            return True
+
+        minute = now.replace(second=0, microsecond=0)
+        if minute == self.last_scheduled_minute or not self.schedule.matches(now):
+            return False
+        self.last_scheduled_minute = minute
+        return True
+
+    def status(self) -> dict:
+        return {
+            "schedule": self.schedule.expression
+            if self.schedule
+            else f"every {self.interval:g}s",
+            "running": self.running,
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_started_at": _isoformat(self.last_started_at),
+            "last_succeeded_at": _isoformat(self.last_succeeded_at),
+            "last_error": self.last_error,
+        }
+
+
+class Worker:
+    """
+    Runs tasks on a bounded thread pool from a single scheduler loop.
+    Worker threads keep their database connection between runs, subject to
+    CONN_MAX_AGE, in the same way as a request cycle.
+    stop() lets tasks which are in progress finish before run() returns.
+    """
+
+    def __init__(
+        self,
+        tasks: list[Task],
+        max_workers: int,
+        tick_seconds: float = 1.0,
+        health_port: int | None = None,
+    ):
+        self.tasks = tasks
+        self.tick_seconds = tick_seconds
+        self.health_port = health_port
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="notifications-worker"
+        )
+        self.stopping = threading.Event()
+        self.heartbeat = time.monotonic()
+        self.health_server = None
+
+    def run(self):
+        if self.health_port is not None:
+            self.start_health_server()
+
+        logger.info(
+            "Notifications worker started with tasks: %s",
+            ", ".join(task.command for task in self.tasks),
+        )
+
+        try:
+            while not self.stopping.is_set():
+                self.heartbeat = time.monotonic()
+                now = datetime.now(tz=timezone.utc)
+
+                for task in self.tasks:
+                    if task.due(now, self.heartbeat):
+                        self.submit(task)
+
+                self.stopping.wait(self.tick_seconds)
+        finally:
+            logger.info("Notifications worker stopping, waiting for running tasks")
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            if self.health_server:
+                self.health_server.shutdown()
+                self.health_server.server_close()
+            logger.info("Notifications worker stopped")
+
+    def stop(self, *args):
+        self.stopping.set()
+
+    def submit(self, task: Task):
+        with task.lock:
+            if task.running >= task.max_concurrency:
+                logger.warning(
+                    "Skipping %s, %d run(s) already in progress",
+                    task.command,
+                    task.running,
+                )
+                return
+            task.running += 1
+
+        self.executor.submit(self.execute, task)
+
+    def execute(self, task: Task):
+        close_old_connections()
+        started_at = datetime.now(tz=timezone.utc)
+        task.last_started_at = started_at
+
+        try:
+            call_command(task.command)
+        except Exception as e:
+            logger.exception("Task %s failed", task.command)
+            with task.lock:
+                task.failures += 1
+                task.last_error = str(e)
+        else:
+            task.last_succeeded_at = datetime.now(tz=timezone.utc)
+            logger.info(
+                "Task %s completed in %.2fs",
+                task.command,
+                (task.last_succeeded_at - started_at).total_seconds(),
+            )
+        finally:
+            close_old_connections()
+            with task.lock:
+                task.running -= 1
+                task.runs += 1
+
+    def healthy(self) -> bool:
+        return (
+            not self.stopping.is_set()
+            and time.monotonic() - self.heartbeat < HEARTBEAT_TIMEOUT_SECONDS
+        )
+
+    def health(self) -> dict:
+        return {
+            "status": "ok" if self.healthy() else "unavailable",
+            "tasks": {task.command: task.status() for task in self.tasks},
+        }
+
+    def start_health_server(self):
+        worker = self
+
+        class HealthHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip("/") != "/health":
+                    self.send_error(404)
+                    return
+
+                body = json.dumps(worker.health()).encode()
+                self.send_response(200 if worker.healthy() else 503)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(format, *args)
+
+        self.health_server = ThreadingHTTPServer(
+            ("0.0.0.0", self.health_port), HealthHandler
+        )
+        threading.Thread(
+            target=self.health_server.serve_forever,
+            name="notifications-worker-health",
+            daemon=True,
+        ).start()
+        logger.info("Health endpoint listening on port %d", self.health_port)
+
+
+def _isoformat(moment: datetime | None) -> str | None:
+    return moment.isoformat() if moment else None
@@ -0,0 +1,94 @@
+import os
+import signal
+from logging import getLogger
+
+from django.core.management.base import BaseCommand
+
+from manage_breast_screening.config.settings import boolean_env
+from manage_breast_screening.notifications.management.commands.helpers.exception_handler import (
+    exception_handler,
+)
+from manage_breast_screening.notifications.management.commands.helpers.worker import (
+    CronSchedule,
+    Task,
+    Worker,
+)
+from manage_breast_screening.notifications.services.blob_storage import BlobStorage
+from manage_breast_screening.notifications.services.queue import Queue
+
+logger = getLogger(__name__)
+INSIGHTS_ERROR_NAME = "NotificationsWorkerError"
+
+
+class Command(BaseCommand):
+    """
+    Django Admin command which runs the notifications commands in one
+    long-running process instead of as separate scheduled jobs.
+    Like the Container Apps jobs, nothing is scheduled unless
+    NOTIFICATIONS_JOBS_SCHEDULE_ENABLED is set, and each task is disabled
+    unless its own schedule is set, e.g.
+    NOTIFICATIONS_WORKER_SCHEDULE_SEND_MESSAGE_BATCH="0,30 9 * * 1-5".
+    A schedule is a cron expression (UTC), or "poll" to run the task every
+    NOTIFICATIONS_WORKER_STATUS_POLL_SECONDS (default 10), which suits
+    save_message_status.
+    Tasks run on a pool of NOTIFICATIONS_WORKER_MAX_WORKERS threads
+    (default 4) and a task never overlaps with itself. Queue and blob storage
+    clients, and their connection pools, are shared between runs.
+    SIGTERM or SIGINT stops scheduling and waits for running tasks to finish.
+    Health is served as JSON on GET /health on
+    NOTIFICATIONS_WORKER_HEALTH_PORT (default 8001).
+    """
+
+    TASKS = (
+        "store_mesh_messages",
+        "create_appointments",
+        "send_message_batch",
+        "retry_failed_message_batch",
+        "save_message_status",
+    )
+    POLL = "poll"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--task",
+            action="append",
+            choices=self.TASKS,
+            dest="tasks",
+            help="Run only this task. Can be repeated. Defaults to all tasks.",
+        )
+
+    def handle(self, *args, **options):
+        with exception_handler(INSIGHTS_ERROR_NAME):
+            logger.info("Notifications Worker Command started")
+
+            worker = Worker(
+                self.tasks(options.get("tasks") or self.TASKS),
+                max_workers=int(os.getenv("NOTIFICATIONS_WORKER_MAX_WORKERS", "4")),
+                health_port=int(os.getenv("NOTIFICATIONS_WORKER_HEALTH_PORT", "8001")),
+            )
+            signal.signal(signal.SIGTERM, worker.stop)
+            signal.signal(signal.SIGINT, worker.stop)
+
+            with Queue.shared_clients(), BlobStorage.shared_clients():
+                worker.run()
+
+    def tasks(self, names) -> list[Task]:
+        tasks = []
+        for name in names:
+            schedule = self.schedule(name)
+            if not schedule:
+                logger.info("Not scheduling %s, as it has no schedule", name)
+            elif schedule == self.POLL:
+                tasks.append(Task(name, interval=self.status_poll_seconds()))
+            else:
+                tasks.append(Task(name, schedule=CronSchedule(schedule)))
+        return tasks
+
+    def schedule(self, name) -> str:
+        """The task's schedule, or an empty string if it is disabled"""
+        if not boolean_env("NOTIFICATIONS_JOBS_SCHEDULE_ENABLED", False):
+            return ""
+        return os.getenv(f"NOTIFICATIONS_WORKER_SCHEDULE_{name.upper()}", "").strip()
+
+    def status_poll_seconds(self) -> float:
+        return float(os.getenv("NOTIFICATIONS_WORKER_STATUS_POLL_SECONDS", "10"))
@@ -1,14 +1,18 @@
 import json
+from datetime import datetime
 from logging import getLogger
 
 from dateutil import parser
 from django.core.exceptions import ValidationError
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
 
 from manage_breast_screening.notifications.management.commands.helpers.exception_handler import (
     exception_handler,
 )
 from manage_breast_screening.notifications.models import (
+    MESSAGE_CHANNELS,
     ChannelStatus,
     Message,
     MessageStatus,
@@ -23,6 +27,9 @@ class Command(BaseCommand):
     """
     Django Admin command which reads message status updates from an Azure Storage Queue
     and creates MessageStatus and ChannelStatus records in the database.
+    Each status saved also moves the message's latest status fields forward,
+    unless a later status has already been recorded; updates can arrive out
+    of order.
     """
 
     def handle(self, *args, **options):
@@ -67,7 +74,13 @@ class Command(BaseCommand):
         )
         try:
             status_record.full_clean()
-            status_record.save()
+            with transaction.atomic():
+                status_record.save()
+                self.advance_latest_status(
+                    "latest_status",
+                    status_record.status,
+                    status_record.status_updated_at,
+                )
         except ValidationError as e:
             logger.error(e, exc_info=True)
             pass
@@ -86,7 +99,28 @@ class Command(BaseCommand):
         )
         try:
             status_record.full_clean()
-            status_record.save()
+            with transaction.atomic():
+                status_record.save()
+                if status_record.channel in MESSAGE_CHANNELS:
+                    self.advance_latest_status(
+                        f"latest_{status_record.channel}_status",
+                        status_record.status,
+                        status_record.status_updated_at,
+                    )
         except ValidationError as e:
             logger.error(e, exc_info=True)
             pass
+
+    def advance_latest_status(
+        self, field: str, status: str, status_updated_at: datetime
+    ):
+        """
+        Set a latest status field on the message, in a single conditional
+        update so that a concurrent or older status can never overwrite a
+        newer one.
+        """
+        Message.objects.filter(
+            Q(**{f"{field}_updated_at__isnull": True})
+            | Q(**{f"{field}_updated_at__lt": status_updated_at}),
+            pk=self.message.pk,
+        ).update(**{field: status, f"{field}_updated_at": status_updated_at})
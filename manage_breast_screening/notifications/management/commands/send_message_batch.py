@@ -1,8 +1,9 @@
-from datetime import datetime, timedelta
+from datetime import datetime
 from logging import getLogger
 
 from business.calendar import Calendar
 from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
 
 from manage_breast_screening.notifications.management.commands.helpers.message_batch_helpers import (
     MessageBatchHelpers,
@@ -11,6 +12,7 @@ from manage_breast_screening.notifications.management.commands.helpers.routing_p
     RoutingPlan,
 )
 from manage_breast_screening.notifications.models import (
+    INVITATION_LEAD_TIME,
     ZONE_INFO,
     Appointment,
     Message,
@@ -36,7 +38,7 @@ class Command(BaseCommand):
         try:
             return self.send_message_batch()
         except Exception as e:
-            ApplicationInsightsLogging().exception(f"{INSIGHTS_ERROR_NAME}: {e}")
+            ApplicationInsightsLogging.shared().exception(f"{INSIGHTS_ERROR_NAME}: {e}")
             raise CommandError(e)
 
     def send_message_batch(self):
@@ -50,33 +52,33 @@ class Command(BaseCommand):
                 f"Finding appointments of episode type {routing_plan.episode_types} to include in batch."
             )
 
-            appointments = Appointment.objects.filter(
-                episode_type__in=routing_plan.episode_types,
-                starts_at__lte=self.schedule_date(),
-                message__isnull=True,
-                status="B",
-                number="1",
-            )
+            with transaction.atomic():
+                appointments = self.claim_appointments(routing_plan.episode_types)
 
-            if not appointments:
-                logger.info(
-                    f"No appointments found to batch for episode types {routing_plan.episode_types}"
-                )
-                continue
+                if not appointments:
+                    logger.info(
+                        f"No appointments found to batch for episode types {routing_plan.episode_types}"
+                    )
+                    continue
 
-            logger.info(f"Found {appointments.count()} appointments to batch.")
+                logger.info(f"Found {len(appointments)} appointments to batch.")
 
-            message_batch = MessageBatch.objects.create(
-                routing_plan_id=routing_plan.id,
-                scheduled_at=datetime.now(tz=ZONE_INFO),
-                status=MessageBatchStatusChoices.SCHEDULED.value,
-            )
+                message_batch = MessageBatch.objects.create(
+                    routing_plan_id=routing_plan.id,
+                    scheduled_at=datetime.now(tz=ZONE_INFO),
+                    status=MessageBatchStatusChoices.SCHEDULED.value,
+                )
 
-            for appointment in appointments:
-                Message.objects.create(appointment=appointment, batch=message_batch)
+                Message.objects.bulk_create(
+                    Message(appointment=appointment, batch=message_batch)
+                    for appointment in appointments
+                )
+                Appointment.objects.filter(
+                    pk__in=[appointment.pk for appointment in appointments]
+                ).update(invitation_batched_at=message_batch.scheduled_at)
 
             logger.info(
-                f"Created MessageBatch with ID {message_batch.id} containing {appointments.count()} messages."
+                f"Created MessageBatch with ID {message_batch.id} containing {len(appointments)} messages."
             )
 
             response = ApiClient().send_message_batch(message_batch)
@@ -90,6 +92,23 @@ class Command(BaseCommand):
                     message_batch, response, retry_count=0
                 )
 
+    def claim_appointments(self, episode_types: list[str]) -> list[Appointment]:
+        """
+        Lock the appointments still awaiting an invitation. This is served by
+        the partial notifications_awaiting_idx index, so its cost follows the
+        number of appointments due rather than the size of the table.
+        Rows locked by a concurrent run are skipped.
+        """
+        return list(
+            Appointment.objects.select_for_update(skip_locked=True).filter(
+                episode_type__in=episode_types,
+                starts_at__lte=self.schedule_date(),
+                invitation_batched_at__isnull=True,
+                status="B",
+                number="1",
+            )
+        )
+
     def bso_working_day(self):
         return Calendar().is_business_day(datetime.now(tz=ZONE_INFO))
 
@@ -97,4 +116,4 @@ class Command(BaseCommand):
         today = datetime.now(tz=ZONE_INFO)
         today_end = today.replace(hour=23, minute=59, second=59, microsecond=999999)
 
-        return today_end + timedelta(weeks=4)
+        return today_end + INVITATION_LEAD_TIME
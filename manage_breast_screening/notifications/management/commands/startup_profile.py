@@ -0,0 +1,67 @@
+import json
+from logging import getLogger
+
+from django.core.management import get_commands
+from django.core.management.base import BaseCommand
+
+from manage_breast_screening.notifications.management.commands.helpers.startup_profiler import (
+    profile_command,
+)
+
+logger = getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Django Admin command which reports how long the notifications commands
+    take to start, from a cold Python process up to the point where handle()
+    would be called, and which imports account for the time.
+    Startup is paid on every run of a scheduled Container Apps job, so slow
+    dependencies should be imported where they are used, not at module level.
+    """
+
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "commands",
+            nargs="*",
+            help="Commands to profile. Defaults to every notifications command.",
+        )
+        parser.add_argument(
+            "--top", type=int, default=10, help="Number of imports to list."
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Output the profiles as JSON."
+        )
+
+    def handle(self, *args, **options):
+        profiles = [
+            profile_command(command)
+            for command in options["commands"] or self.notifications_commands()
+        ]
+
+        if options["json"]:
+            self.stdout.write(
+                json.dumps([profile.as_dict() for profile in profiles], indent=2)
+            )
+            return
+
+        for profile in profiles:
+            self.stdout.write(f"{profile.command}: {profile.startup_ms:.0f}ms")
+            for package, ms in profile.slowest_imports(options["top"]):
+                self.stdout.write(f"  {ms:8.1f}ms  {package}")
+            if lazy_modules := profile.lazy_modules_loaded():
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"  Imported at startup: {', '.join(lazy_modules)}"
+                    )
+                )
+
+    def notifications_commands(self) -> list[str]:
+        return sorted(
+            name
+            for name, app in get_commands().items()
+            if app == "manage_breast_screening.notifications"
+            and name != "startup_profile"
+        )
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.7 on 2026-10-19 11:01
+
+from django.db import migrations, models
+from django.db.models import Min, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Now
+
+
+def backfill_invitation_batched_at(apps, schema_editor):
+    Appointment = apps.get_model("notifications", "Appointment")
+    Message = apps.get_model("notifications", "Message")
+
+    first_message = (
+        Message.objects.filter(appointment=OuterRef("pk"))
+        .values("appointment")
+        .annotate(batched_at=Min(Coalesce("created_at", "batch__created_at", Now())))
+        .values("batched_at")
+    )
+    Appointment.objects.filter(message__isnull=False).update(
+        invitation_batched_at=Subquery(first_message)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0022_appointment_notificatio_starts__29949f_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='appointment',
+            name='invitation_batched_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(
+            backfill_invitation_batched_at, migrations.RunPython.noop
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(condition=models.Q(('invitation_batched_at__isnull', True), ('number', '1'), ('status', 'B')), fields=['episode_type', 'starts_at'], name='notifications_awaiting_idx'),
+        ),
+    ]
@@ -0,0 +1,87 @@
+# ChannelStatus and MessageStatus become range partitioned by status_updated_at
+# month, with a default partition for anything outside the monthly partitions.
+# Postgres requires the partition key in every unique constraint, so in the
+# database the primary key is (id, status_updated_at) and idempotency keys are
+# unique per status_updated_at. The Django model state is unchanged.
+
+from django.db import migrations
+
+TABLES = ("notifications_channelstatus", "notifications_messagestatus")
+
+# Monthly partitions are created up to this many months ahead. The
+# archive_status_partitions command keeps them topped up after this.
+MONTHS_AHEAD = 3
+
+PARTITION_SQL = """
+ALTER TABLE {table} RENAME TO {table}_unpartitioned;
+
+CREATE TABLE {table} (LIKE {table}_unpartitioned INCLUDING DEFAULTS)
+PARTITION BY RANGE (status_updated_at);
+
+DO $$
+DECLARE
+    month timestamp;
+BEGIN
+    FOR month IN SELECT generate_series(
+        date_trunc('month', LEAST(
+            (SELECT min(status_updated_at) FROM {table}_unpartitioned), now()
+        ) AT TIME ZONE 'UTC'),
+        date_trunc('month', now() AT TIME ZONE 'UTC') + INTERVAL '{months_ahead} months',
+        INTERVAL '1 month'
+    )
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF {table} FOR VALUES FROM (%L) TO (%L)',
+            '{table}_p' || to_char(month, 'YYYY_MM'),
+            month AT TIME ZONE 'UTC',
+            (month + INTERVAL '1 month') AT TIME ZONE 'UTC'
+        );
+    END LOOP;
+END $$;
+
+CREATE TABLE {table}_default PARTITION OF {table} DEFAULT;
+
+INSERT INTO {table} SELECT * FROM {table}_unpartitioned;
+DROP TABLE {table}_unpartitioned;
+
+ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id, status_updated_at);
+ALTER TABLE {table} ADD CONSTRAINT {table}_idempotency_key_uniq
+    UNIQUE (idempotency_key, status_updated_at);
+ALTER TABLE {table} ADD CONSTRAINT {table}_message_id_fk
+    FOREIGN KEY (message_id) REFERENCES notifications_message (id)
+    DEFERRABLE INITIALLY DEFERRED;
+CREATE INDEX {table}_message_id_idx ON {table} (message_id);
+"""
+
+UNPARTITION_SQL = """
+ALTER TABLE {table} RENAME TO {table}_partitioned;
+
+CREATE TABLE {table} (LIKE {table}_partitioned INCLUDING DEFAULTS);
+INSERT INTO {table} SELECT * FROM {table}_partitioned;
+DROP TABLE {table}_partitioned;
+
+ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id);
+ALTER TABLE {table} ADD CONSTRAINT {table}_idempotency_key_uniq UNIQUE (idempotency_key);
+ALTER TABLE {table} ADD CONSTRAINT {table}_message_id_fk
+    FOREIGN KEY (message_id) REFERENCES notifications_message (id)
+    DEFERRABLE INITIALLY DEFERRED;
+CREATE INDEX {table}_message_id_idx ON {table} (message_id);
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("notifications", "0023_appointment_invitation_batched_at"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql=PARTITION_SQL.format(table=table, months_ahead=MONTHS_AHEAD),
+                    reverse_sql=UNPARTITION_SQL.format(table=table),
+                )
+                for table in TABLES
+            ],
+        ),
+    ]
@@ -0,0 +1,95 @@
+# Generated by Django 5.2.7 on 2026-10-19 11:14
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+CHANNELS = ("nhsapp", "sms", "email", "letter")
+
+
+def backfill_latest_status(apps, schema_editor):
+    ChannelStatus = apps.get_model("notifications", "ChannelStatus")
+    Message = apps.get_model("notifications", "Message")
+    MessageStatus = apps.get_model("notifications", "MessageStatus")
+
+    # The earliest received status wins a tie, as it does in save_message_status
+    latest = MessageStatus.objects.filter(message=OuterRef("pk")).order_by(
+        "-status_updated_at", "created_at"
+    )
+    Message.objects.filter(messagestatus__isnull=False).update(
+        latest_status=Subquery(latest.values("status")[:1]),
+        latest_status_updated_at=Subquery(latest.values("status_updated_at")[:1]),
+    )
+
+    for channel in CHANNELS:
+        latest = ChannelStatus.objects.filter(
+            message=OuterRef("pk"), channel=channel
+        ).order_by("-status_updated_at", "created_at")
+        Message.objects.filter(channelstatus__channel=channel).update(
+            **{
+                f"latest_{channel}_status": Subquery(latest.values("status")[:1]),
+                f"latest_{channel}_status_updated_at": Subquery(
+                    latest.values("status_updated_at")[:1]
+                ),
+            }
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0024_partition_status_tables'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='message',
+            name='latest_email_status',
+            field=models.CharField(blank=True, choices=[('accepted', 'Accepted'), ('cancelled', 'Cancelled'), ('delivered', 'Delivered'), ('notification_attempted', 'Notification Attempted'), ('notified', 'Notified'), ('pending_virus_check', 'Pending Virus Check'), ('read', 'Read'), ('received', 'Received'), ('rejected', 'Rejected'), ('permanent_failure', 'Permanent Failure'), ('technical_failure', 'Technical Failure'), ('temporary_failure', 'Temporary Failure'), ('unknown', 'Unknown'), ('unnotified', 'Unnotified'), ('validation_failed', 'Validation Failed')], max_length=50, null=True),
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='latest_email_status_updated_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='latest_letter_status',
+            field=models.CharField(blank=True, choices=[('accepted', 'Accepted'), ('cancelled', 'Cancelled'), ('delivered', 'Delivered'), ('notification_attempted', 'Notification Attempted'), ('notified', 'Notified'), ('pending_virus_check', 'Pending Virus Check'), ('read', 'Read'), ('received', 'Received'), ('rejected', 'Rejected'), ('permanent_failure', 'Permanent Failure'), ('technical_failure', 'Technical Failure'), ('temporary_failure', 'Temporary Failure'), ('unknown', 'Unknown'), ('unnotified', 'Unnotified'), ('validation_failed', 'Validation Failed')], max_length=50, null=True),
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='latest_letter_status_updated_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='latest_nhsapp_status',
+            field=models.CharField(blank=True, choices=[('accepted', 'Accepted'), ('cancelled', 'Cancelled'), ('delivered', 'Delivered'), ('notification_attempted', 'Notification Attempted'), ('notified', 'Notified'), ('pending_virus_check', 'Pending Virus Check'), ('read', 'Read'), ('received', 'Received'), ('rejected', 'Rejected'), ('permanent_failure', 'Permanent Failure'), ('technical_failure', 'Technical Failure'), ('temporary_failure', 'Temporary Failure'), ('unknown', 'Unknown'), ('unnotified', 'Unnotified'), ('validation_failed', 'Validation Failed')], max_length=50, null=True),
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='latest_nhsapp_status_updated_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='latest_sms_status',
+            field=models.CharField(blank=True, choices=[('accepted', 'Accepted'), ('cancelled', 'Cancelled'), ('delivered', 'Delivered'), ('notification_attempted', 'Notification Attempted'), ('notified', 'Notified'), ('pending_virus_check', 'Pending Virus Check'), ('read', 'Read'), ('received', 'Received'), ('rejected', 'Rejected'), ('permanent_failure', 'Permanent Failure'), ('technical_failure', 'Technical Failure'), ('temporary_failure', 'Temporary Failure'), ('unknown', 'Unknown'), ('unnotified', 'Unnotified'), ('validation_failed', 'Validation Failed')], max_length=50, null=True),
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='latest_sms_status_updated_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='latest_status',
+            field=models.CharField(blank=True, choices=[('delivered', 'Delivered'), ('enriched', 'Endriched'), ('failed', 'Failed'), ('pending_enrichment', 'Pending Enrichment'), ('sending', 'Sending')], max_length=50, null=True),
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='latest_status_updated_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_latest_status, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,5 @@
 import uuid
+from datetime import timedelta
 from zoneinfo import ZoneInfo
 
 from django.db import models
@@ -7,6 +8,11 @@ from ..core.models import BaseModel
 
 ZONE_INFO = ZoneInfo("Europe/London")
 
+# How far ahead of an appointment send_message_batch sends its invitation.
+# The reports only read statuses this far back from their window, see
+# queries.helper.STATUS_LOOKBACK.
+INVITATION_LEAD_TIME = timedelta(weeks=4)
+
 
 class MessageBatchStatusChoices(models.Choices):
     FAILED_RECOVERABLE = "failed_recoverable"
@@ -42,6 +48,10 @@ class ChannelStatusChoices(models.Choices):
     VALIDATION_FAILED = "validation_failed"
 
 
+# Channels NHS Notify reports a ChannelStatus for
+MESSAGE_CHANNELS = ("nhsapp", "sms", "email", "letter")
+
+
 class AppointmentStatusChoices(models.Choices):
     BOOKED = "B"
     CANCELLED = "C"
@@ -104,6 +114,30 @@ class Message(models.Model):
     )
     nhs_notify_errors = models.JSONField(blank=True, null=True)
 
+    # The latest MessageStatus and ChannelStatus for each channel, kept up to
+    # date by the save_message_status command so that reports can read the
+    # current state of a message without joining the status tables.
+    latest_status = models.CharField(
+        max_length=50, choices=MessageStatusChoices, null=True, blank=True
+    )
+    latest_status_updated_at = models.DateTimeField(null=True, blank=True)
+    latest_nhsapp_status = models.CharField(
+        max_length=50, choices=ChannelStatusChoices, null=True, blank=True
+    )
+    latest_nhsapp_status_updated_at = models.DateTimeField(null=True, blank=True)
+    latest_sms_status = models.CharField(
+        max_length=50, choices=ChannelStatusChoices, null=True, blank=True
+    )
+    latest_sms_status_updated_at = models.DateTimeField(null=True, blank=True)
+    latest_email_status = models.CharField(
+        max_length=50, choices=ChannelStatusChoices, null=True, blank=True
+    )
+    latest_email_status_updated_at = models.DateTimeField(null=True, blank=True)
+    latest_letter_status = models.CharField(
+        max_length=50, choices=ChannelStatusChoices, null=True, blank=True
+    )
+    latest_letter_status_updated_at = models.DateTimeField(null=True, blank=True)
+
     appointment = models.ForeignKey(
         "notifications.Appointment", on_delete=models.PROTECT
     )
@@ -121,7 +155,20 @@ class Appointment(models.Model):
     """
 
     class Meta:
-        indexes = [models.Index(fields=["nbss_id"])]
+        indexes = [
+            models.Index(fields=["nbss_id"]),
+            models.Index(fields=["starts_at"]),
+            models.Index(fields=["created_at"]),
+            # Access path for send_message_batch: only appointments still
+            # waiting for an invitation are indexed.
+            models.Index(
+                fields=["episode_type", "starts_at"],
+                condition=models.Q(
+                    status="B", number="1", invitation_batched_at__isnull=True
+                ),
+                name="notifications_awaiting_idx",
+            ),
+        ]
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     batch_id = models.CharField(max_length=30, default="")
@@ -143,6 +190,8 @@ class Appointment(models.Model):
     completed_at = models.DateTimeField(null=True)
     attended_not_screened = models.CharField(max_length=30, default="")
     assessment = models.BooleanField(default=False)
+    # Set when a Message is first created for this appointment
+    invitation_batched_at = models.DateTimeField(null=True, blank=True)
 
     clinic = models.ForeignKey("notifications.Clinic", on_delete=models.PROTECT)
 
@@ -16,25 +16,30 @@ SELECT  TO_CHAR(appt.starts_at, 'yyyy-mm-dd') AS "Appointment date",
         COUNT(sms_dlv.id)     AS "SMS messages delivered",
         COUNT(ltr_sent.id)    AS "Letters sent",
         COUNT(msg_fld.id)     AS "Notifications failed"
-FROM   notifications_appointment appt
+FROM   (SELECT CURRENT_DATE - INTERVAL %s AS starts_from,
+               %s::interval AS status_lookback) report
+JOIN   notifications_appointment appt ON appt.starts_at > report.starts_from
 JOIN   notifications_clinic cl ON appt.clinic_id = cl.id
 LEFT OUTER JOIN notifications_message msg_snt ON msg_snt.appointment_id = appt.id
 AND    msg_snt.status IN ('sending', 'delivered', 'failed')
 JOIN   notifications_message msg ON msg.appointment_id = appt.id
 LEFT OUTER JOIN notifications_messagestatus msg_fld ON msg_fld.message_id = msg.id
 AND    msg_fld.status = 'failed'
+AND    msg_fld.status_updated_at >= report.starts_from - report.status_lookback
 LEFT OUTER JOIN notifications_channelstatus nhsapp_read ON nhsapp_read.message_id = msg_snt.id
 AND    nhsapp_read.channel = 'nhsapp'
 AND    nhsapp_read.status = 'read'
-AND    (nhsapp_read.status_updated_at::date - msg_snt.sent_at::date) <= 1
+AND    nhsapp_read.status_updated_at < msg_snt.sent_at::date + 2
+AND    nhsapp_read.status_updated_at >= report.starts_from - report.status_lookback
 LEFT OUTER JOIN notifications_channelstatus sms_dlv ON sms_dlv.message_id = msg_snt.id
 AND    sms_dlv.channel = 'sms'
 AND    sms_dlv.status = 'delivered'
-AND    (sms_dlv.status_updated_at::date - msg_snt.sent_at::date) <= 4
+AND    sms_dlv.status_updated_at < msg_snt.sent_at::date + 5
+AND    sms_dlv.status_updated_at >= report.starts_from - report.status_lookback
 LEFT OUTER JOIN notifications_channelstatus ltr_sent ON ltr_sent.message_id = msg_snt.id
 AND    ltr_sent.channel = 'letter'
 AND    ltr_sent.status = 'received'
-WHERE  appt.starts_at > CURRENT_DATE - INTERVAL %s
-AND    cl.bso_code = %s
+AND    ltr_sent.status_updated_at >= report.starts_from - report.status_lookback
+WHERE  cl.bso_code = %s
 GROUP BY appt.starts_at, cl.bso_code, cl.code, cl.name, appt.episode_type
 ORDER BY appt.starts_at DESC
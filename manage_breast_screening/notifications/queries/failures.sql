@@ -28,7 +28,9 @@ SELECT  appt.nhs_number AS "NHS number",
           )
           WHEN msg_sts.description IS NOT NULL THEN msg_sts.description
         END AS "Reason"
-FROM    notifications_appointment appt
+FROM    (SELECT %s::date AS day, %s::interval AS status_lookback) report
+JOIN    notifications_appointment appt ON appt.starts_at >= report.day
+AND     appt.starts_at < report.day + 1
 JOIN    notifications_clinic cl ON appt.clinic_id = cl.id
 JOIN    notifications_message msg ON msg.appointment_id = appt.id
 AND     msg.status IN ('sending', 'delivered', 'failed')
@@ -36,8 +38,8 @@ LEFT OUTER JOIN notifications_message msg_fld ON msg_fld.appointment_id = appt.i
 AND     msg_fld.status = 'failed'
 LEFT OUTER JOIN notifications_messagestatus msg_sts ON msg_sts.message_id = msg.id
 AND     msg_sts.status = 'failed'
-WHERE   appt.starts_at::date = %s
-AND     cl.bso_code = %s
+AND     msg_sts.status_updated_at >= report.day - report.status_lookback
+WHERE   cl.bso_code = %s
 AND   (
   msg_fld.nhs_notify_errors @> ANY(ARRAY[
     '[{"code":"CM_INVALID_NHS_NUMBER"}]',
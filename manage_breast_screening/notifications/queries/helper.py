@@ -1,7 +1,21 @@
+import csv
+import io
 import os
+from datetime import timedelta
+from typing import IO
 
 from django.db import connection
 
+from manage_breast_screening.notifications.models import INVITATION_LEAD_TIME
+
+FETCH_SIZE = 2000
+
+# How far before a report's window the aggregate and failures reports read
+# statuses, so that Postgres can skip older status partitions. A message is
+# sent at most INVITATION_LEAD_TIME before its appointment, so none of its
+# statuses are older than this.
+STATUS_LOOKBACK = INVITATION_LEAD_TIME + timedelta(days=1)
+
 
 class Helper:
     @staticmethod
@@ -19,3 +33,28 @@ class Helper:
             results = cursor.fetchall()
 
         return results
+
+    @staticmethod
+    def write_csv(report_name: str, params, file: IO[bytes]) -> int:
+        """
+        Run a report query through a server-side cursor and write the results
+        to `file` as UTF-8 CSV, one batch of rows at a time, so that memory use
+        does not grow with the size of the result set.
+        Returns the number of data rows written.
+        """
+        row_count = 0
+        text = io.TextIOWrapper(file, encoding="utf-8", newline="")
+        writer = csv.writer(text, lineterminator="\n")
+
+        with connection.chunked_cursor() as cursor:
+            cursor.execute(Helper.sql(report_name), params)
+            writer.writerow([column.name for column in cursor.description])
+
+            while rows := cursor.fetchmany(FETCH_SIZE):
+                writer.writerows(rows)
+                row_count += len(rows)
+
+        text.flush()
+        text.detach()
+
+        return row_count
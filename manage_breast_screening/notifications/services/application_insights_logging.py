@@ -1,22 +1,61 @@
+import atexit
 import logging
 import os
-
-from azure.monitor.opentelemetry import configure_azure_monitor
+import queue
+import threading
+import time
 
 from manage_breast_screening.config.settings import boolean_env
 
+logger = logging.getLogger(__name__)
+
 
 class ApplicationInsightsLogging:
+    """
+    Exceptions are logged synchronously, so that they keep the active
+    exception and caller's stack. Custom events and metrics are buffered and
+    emitted in batches from a background thread every
+    APPLICATIONINSIGHTS_FLUSH_SECONDS (default 5), so a burst of failures
+    does not slow down the request or job which hit them. The buffer holds at
+    most APPLICATIONINSIGHTS_BUFFER_SIZE (default 1000) items; further items
+    are dropped and counted until it has been flushed.
+    Use ApplicationInsightsLogging.shared() for the process wide instance.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
     def __init__(self) -> None:
         self.logger_name = os.getenv(
             "APPLICATIONINSIGHTS_LOGGER_NAME", "manbrs-notifications"
         )
         self.logger = self.getLogger()
+        self.buffer = queue.Queue(
+            maxsize=int(os.getenv("APPLICATIONINSIGHTS_BUFFER_SIZE", "1000"))
+        )
+        self.flush_seconds = float(os.getenv("APPLICATIONINSIGHTS_FLUSH_SECONDS", "5"))
+        self.dropped = 0
+        self.histograms = {}
+        self.flusher = None
+        # Guards starting the flusher and the dropped count, which are
+        # updated from request and task threads
+        self.lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "ApplicationInsightsLogging":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
 
     def configure_azure_monitor(self):
         if boolean_env("APPLICATIONINSIGHTS_IS_ENABLED", False) and os.getenv(
             "APPLICATIONINSIGHTS_CONNECTION_STRING", ""
         ):
+            # Imported here rather than at module level as it is slow to import
+            # and only needed when Application Insights is enabled.
+            from azure.monitor.opentelemetry import configure_azure_monitor
+
             # Configure OpenTelemetry to use Azure Monitor with the
             # APPLICATIONINSIGHTS_CONNECTION_STRING environment variable.
             configure_azure_monitor(
@@ -34,10 +73,81 @@ class ApplicationInsightsLogging:
         self.logger.exception(exception_name, stack_info=True)
 
     def custom_event(self, message: str, event_name: str):
-        self.logger.warning(
-            message,
-            extra={
-                "microsoft.custom_event.name": event_name,
-                "additional_attrs": message,
-            },
-        )
+        self.enqueue(("event", message, event_name))
+
+    def metric(self, name: str, value: float, **attributes):
+        self.enqueue(("metric", name, value, attributes))
+
+    def enqueue(self, item: tuple):
+        try:
+            self.buffer.put_nowait(item)
+        except queue.Full:
+            with self.lock:
+                self.dropped += 1
+        self.start_flusher()
+
+    def start_flusher(self):
+        if self.flusher is not None:
+            return
+
+        with self.lock:
+            if self.flusher is None:
+                # Registered on first use, after Azure Monitor has been
+                # configured, so that buffered items are flushed at exit
+                # before the OpenTelemetry exporters are shut down.
+                atexit.register(self.flush)
+                self.flusher = threading.Thread(
+                    target=self.flush_periodically,
+                    name="application-insights-flusher",
+                    daemon=True,
+                )
+                self.flusher.start()
+
+    def flush_periodically(self):
+        while True:
+            time.sleep(self.flush_seconds)
+            self.flush()
+
+    def flush(self):
+        while True:
+            try:
+                item = self.buffer.get_nowait()
+            except queue.Empty:
+                break
+
+            try:
+                self.emit(*item)
+            except Exception:
+                logger.exception("Failed to emit Application Insights %s", item[0])
+
+        with self.lock:
+            dropped, self.dropped = self.dropped, 0
+        if dropped:
+            logger.warning(
+                "Dropped %d Application Insights events and metrics, buffer full",
+                dropped,
+            )
+
+    def emit(self, kind: str, *args):
+        if kind == "event":
+            message, event_name = args
+            self.logger.warning(
+                message,
+                extra={
+                    "microsoft.custom_event.name": event_name,
+                    "additional_attrs": message,
+                },
+            )
+        else:
+            name, value, attributes = args
+            self.histogram(name).record(value, attributes=attributes)
+
+    def histogram(self, name: str):
+        if name not in self.histograms:
+            # A no-op meter unless Azure Monitor has been configured
+            from opentelemetry import metrics
+
+            self.histograms[name] = metrics.get_meter(
+                self.logger_name
+            ).create_histogram(name)
+        return self.histograms[name]
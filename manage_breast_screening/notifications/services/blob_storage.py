@@ -1,13 +1,25 @@
 import os
-from typing import Any
+from contextlib import contextmanager
+from typing import IO, TYPE_CHECKING, Any
 
-from azure.core.exceptions import ResourceExistsError
-from azure.identity import ManagedIdentityCredential
-from azure.storage.blob import BlobServiceClient, ContainerClient, ContentSettings
+# The Azure SDKs are slow to import, so are imported when storage is first used
+if TYPE_CHECKING:
+    from azure.storage.blob import BlobServiceClient, ContainerClient
 
 
 class BlobStorage:
+    # Client reused while shared_clients() is active
+    _shared_client: "BlobServiceClient | None" = None
+    _sharing = False
+
     def __init__(self):
+        if BlobStorage._shared_client is not None:
+            self.client = BlobStorage._shared_client
+            return
+
+        from azure.identity import ManagedIdentityCredential
+        from azure.storage.blob import BlobServiceClient
+
         blob_mi_client_id = os.getenv("BLOB_MI_CLIENT_ID")
         storage_account_name = os.getenv("STORAGE_ACCOUNT_NAME")
         connection_string = os.getenv("BLOB_STORAGE_CONNECTION_STRING")
@@ -22,8 +34,29 @@ class BlobStorage:
         if connection_string:
             self.client = BlobServiceClient.from_connection_string(connection_string)
 
-    def find_or_create_container(self, container_name: str) -> ContainerClient:
+        if BlobStorage._sharing and hasattr(self, "client"):
+            BlobStorage._shared_client = self.client
+
+    @classmethod
+    @contextmanager
+    def shared_clients(cls):
+        """
+        Reuse one client, and so one connection pool, for every BlobStorage
+        created in this block. For long-running processes.
+        """
+        cls._sharing = True
+        try:
+            yield
+        finally:
+            if cls._shared_client is not None:
+                cls._shared_client.close()
+            cls._shared_client = None
+            cls._sharing = False
+
+    def find_or_create_container(self, container_name: str) -> "ContainerClient":
         """Find or create an Azure Storage Blob container"""
+        from azure.core.exceptions import ResourceExistsError
+
         try:
             return self.client.create_container(container_name)
         except ResourceExistsError:
@@ -32,15 +65,21 @@ class BlobStorage:
     def add(
         self,
         filename: str,
-        content: str,
+        content: str | bytes | IO[bytes],
         container_name: str | None = None,
         content_encoding="ASCII",
         content_type="application/dat",
+        metadata: dict[str, str] | None = None,
     ) -> dict[str, Any]:
-        """Write a file to the configured blob container"""
+        """
+        Write a file to the configured blob container.
+        File-like content is read and uploaded in blocks rather than all at once.
+        """
 
         if not container_name:
             container_name = os.getenv("BLOB_CONTAINER_NAME")
+        from azure.storage.blob import ContentSettings
+
         container = self.find_or_create_container(container_name)
         blob_client = container.get_blob_client(filename)
         return blob_client.upload_blob(
@@ -49,5 +88,21 @@ class BlobStorage:
             content_settings=ContentSettings(
                 content_type=content_type, content_encoding=content_encoding
             ),
+            metadata=metadata,
             overwrite=True,
         )
+
+    def metadata(
+        self, filename: str, container_name: str | None = None
+    ) -> dict[str, str] | None:
+        """Read a blob's metadata, or None if the blob does not exist"""
+
+        if not container_name:
+            container_name = os.getenv("BLOB_CONTAINER_NAME")
+        from azure.core.exceptions import ResourceNotFoundError
+
+        container = self.find_or_create_container(container_name)
+        try:
+            return container.get_blob_client(filename).get_blob_properties().metadata
+        except ResourceNotFoundError:
+            return None
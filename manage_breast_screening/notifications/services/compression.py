@@ -0,0 +1,45 @@
+import gzip
+import hashlib
+import shutil
+from typing import IO
+
+import zstandard
+
+CHUNK_SIZE = 1024 * 1024
+
+# Content-Encoding value -> filename extension
+ENCODINGS = {"gzip": ".gz", "zstd": ".zst"}
+
+
+class CompressionConfigurationError(Exception):
+    """Raised when an unsupported compression is configured"""
+
+    pass
+
+
+def validate(encoding: str):
+    if encoding not in ENCODINGS:
+        raise CompressionConfigurationError(
+            f"Unsupported compression '{encoding}', expected one of "
+            + ", ".join(ENCODINGS)
+        )
+
+
+def compress(source: IO[bytes], destination: IO[bytes], encoding: str):
+    """Compress `source` into `destination` a chunk at a time"""
+    validate(encoding)
+
+    if encoding == "zstd":
+        zstandard.ZstdCompressor().copy_stream(
+            source, destination, read_size=CHUNK_SIZE
+        )
+    else:
+        # A fixed mtime keeps the output identical for identical input
+        with gzip.GzipFile(fileobj=destination, mode="wb", mtime=0) as compressed:
+            shutil.copyfileobj(source, compressed, CHUNK_SIZE)
+
+
+def sha256(source: IO[bytes]) -> str:
+    """Hex digest of the whole of `source`, read a chunk at a time"""
+    source.seek(0)
+    return hashlib.file_digest(source, "sha256").hexdigest()
@@ -1,11 +1,16 @@
 import os
 from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING
 
-from mesh_client import INT_ENDPOINT, LIVE_ENDPOINT, Endpoint, MeshClient, Message
+# mesh_client is slow to import, so is imported when an inbox is opened
+if TYPE_CHECKING:
+    from mesh_client import Endpoint, Message
 
 
 class MeshInbox:
     def __init__(self):
+        from mesh_client import MeshClient
+
         cert_file, private_key_file = self.ssl_credentials()
         self.client = MeshClient(
             self.endpoint_for_env(),
@@ -18,13 +23,15 @@ class MeshInbox:
     def fetch_message_ids(self) -> list[str]:
         return self.client.list_messages()
 
-    def fetch_message(self, message_id: str) -> Message:
+    def fetch_message(self, message_id: str) -> "Message":
         return self.client.retrieve_message(message_id)
 
     def acknowledge(self, message_id: str):
         self.client.acknowledge_message(message_id)
 
-    def endpoint_for_env(self) -> Endpoint:
+    def endpoint_for_env(self) -> "Endpoint":
+        from mesh_client import INT_ENDPOINT, LIVE_ENDPOINT, Endpoint
+
         current_environment = os.getenv("DJANGO_ENV", "dev")
         if current_environment == "prod":
             return LIVE_ENDPOINT
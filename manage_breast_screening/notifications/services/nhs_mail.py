@@ -4,7 +4,8 @@ from email.mime.application import MIMEApplication
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from logging import getLogger
-from smtplib import SMTP
+from smtplib import SMTP, SMTPException, SMTPServerDisconnected
+from threading import Lock
 
 from django.template.loader import render_to_string
 
@@ -17,16 +18,37 @@ SMTP_PORT = 587
 
 
 class NhsMail:
+    """
+    Send report emails via NHSmail.
+
+    Used as a context manager, one authenticated SMTP session is opened on the
+    first send and reused for every email until the block exits. If the server
+    drops the session it is reopened and the email resent. Outside a context
+    manager each email opens and closes its own session.
+    """
+
     def __init__(self) -> None:
         self._recipient_emails = os.getenv("NOTIFICATIONS_SMTP_RECIPIENTS", "").split(
             ","
         )
         self._sender_email = os.getenv("NOTIFICATIONS_SMTP_USERNAME", "")
         self._sender_password = os.getenv("NOTIFICATIONS_SMTP_PASSWORD", "")
+        self._server: SMTP | None = None
+        self._in_session = False
+        self._lock = Lock()
+
+    def __enter__(self):
+        self._in_session = True
+        return self
+
+    def __exit__(self, *args):
+        self._in_session = False
+        with self._lock:
+            self._disconnect()
 
     def send_report_email(
         self,
-        attachment_data: str,
+        attachment_data: str | bytes,
         attachment_filename: str,
         report_type="invites_not_sent",
     ):
@@ -45,7 +67,33 @@ class NhsMail:
 
     def _send_via_smtp(self, email):
         try:
-            with SMTP(SMTP_SERVER, SMTP_PORT) as server:
+            with self._lock:
+                try:
+                    self._sendmail(email)
+                except SMTPServerDisconnected:
+                    logger.info("SMTP connection was closed, reconnecting")
+                    self._disconnect()
+                    self._sendmail(email)
+                finally:
+                    if not self._in_session:
+                        self._disconnect()
+        except Exception as e:
+            logger.warning(
+                f"Error sending email: {e}",
+            )
+            raise e
+        else:
+            logger.info("Email sent")
+
+    def _sendmail(self, email):
+        self._connect().sendmail(
+            email["from"], self._recipient_emails, email.as_string()
+        )
+
+    def _connect(self) -> SMTP:
+        if self._server is None:
+            server = SMTP(SMTP_SERVER, SMTP_PORT)
+            try:
                 server.ehlo()
                 server.starttls()
                 server.ehlo()
@@ -54,17 +102,22 @@ class NhsMail:
                     self._sender_email,
                     self._sender_password,
                 )
+            except Exception:
+                server.close()
+                raise
+            self._server = server
 
-                server.sendmail(
-                    email["from"], self._recipient_emails, email.as_string()
-                )
-        except Exception as e:
-            logger.warning(
-                f"Error sending email: {e}",
-            )
-            raise e
-        else:
-            logger.info("Email sent")
+        return self._server
+
+    def _disconnect(self):
+        if self._server is None:
+            return
+
+        server, self._server = self._server, None
+        try:
+            server.quit()
+        except SMTPException:
+            server.close()
 
     def _get_email_content(self, attachment_data, attachment_filename, report_type):
         todays_date = datetime.today().strftime("%d-%m-%Y")
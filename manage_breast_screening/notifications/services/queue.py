@@ -1,8 +1,10 @@
 import os
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
 
-from azure.core.exceptions import ResourceExistsError
-from azure.identity import ManagedIdentityCredential
-from azure.storage.queue import QueueClient, QueueMessage
+# The Azure SDKs are slow to import, so are imported when a queue is first used
+if TYPE_CHECKING:
+    from azure.storage.queue import QueueClient, QueueMessage
 
 
 class QueueConfigurationError(Exception):
@@ -12,7 +14,19 @@ class QueueConfigurationError(Exception):
 
 
 class Queue:
+    # Clients by queue name while shared_clients() is active
+    _shared_clients: dict[str, "QueueClient"] | None = None
+
     def __init__(self, queue_name):
+        shared = Queue._shared_clients
+        if shared is not None and queue_name in shared:
+            self.client = shared[queue_name]
+            return
+
+        from azure.core.exceptions import ResourceExistsError
+        from azure.identity import ManagedIdentityCredential
+        from azure.storage.queue import QueueClient
+
         storage_account_name = os.getenv("STORAGE_ACCOUNT_NAME")
         queue_mi_client_id = os.getenv("QUEUE_MI_CLIENT_ID")
         connection_string = os.getenv("QUEUE_STORAGE_CONNECTION_STRING")
@@ -38,12 +52,30 @@ class Queue:
                 "(STORAGE_ACCOUNT_NAME and QUEUE_MI_CLIENT_ID) must be set"
             )
 
+        if shared is not None:
+            shared[queue_name] = self.client
+
+    @classmethod
+    @contextmanager
+    def shared_clients(cls):
+        """
+        Reuse one client, and so one connection pool, per queue for every
+        Queue created in this block. For long-running processes.
+        """
+        cls._shared_clients = {}
+        try:
+            yield
+        finally:
+            for client in cls._shared_clients.values():
+                client.close()
+            cls._shared_clients = None
+
     def add(self, message: str):
         if not hasattr(self, "client") or self.client is None:
             raise QueueConfigurationError("Queue client not initialized")
         self.client.send_message(message)
 
-    def delete(self, message: str | QueueMessage):
+    def delete(self, message: "str | QueueMessage"):
         self.client.delete_message(message)
 
     def items(self, limit=50):
@@ -0,0 +1,109 @@
+-- Seed a notifications dataset shaped like a long-running service.
+-- Parameters: number of appointments, number of days of history.
+-- Appointments are spread evenly across 50 clinics in 5 BSOs and across the
+-- history window, with roughly one message, one message status and two
+-- channel statuses per appointment.
+
+INSERT INTO notifications_clinic (
+  id, code, bso_code, name, alt_name, holding_clinic, location_code,
+  address_line_1, address_line_2, address_line_3, address_line_4,
+  address_line_5, postcode, created_at, updated_at
+)
+SELECT  gen_random_uuid(),
+        'BU' || LPAD(n::text, 3, '0'),
+        (ARRAY['MBD', 'KMK', 'LEE', 'NWL', 'SWB'])[n %% 5 + 1],
+        'BREAST CARE UNIT ' || n, '', FALSE, 'LOC' || n,
+        '', '', '', '', '', 'AB1 2CD', NOW(), NOW()
+FROM    generate_series(1, 50) AS n;
+
+WITH clinics AS (
+  SELECT id, ROW_NUMBER() OVER (ORDER BY code) - 1 AS idx
+  FROM   notifications_clinic
+),
+params AS (
+  SELECT %(appointments)s::int AS appointments, %(days)s::int AS days
+)
+INSERT INTO notifications_appointment (
+  id, batch_id, nbss_id, nhs_number, episode_type, episode_started_at, status,
+  booked_by, booked_at, cancelled_by, cancelled_at, number, starts_at,
+  created_at, updated_at, completed_at, attended_not_screened, assessment,
+  clinic_id
+)
+SELECT  gen_random_uuid(),
+        'BATCH' || (n / 1000),
+        'NBSS' || n,
+        9000000000 + n,
+        (ARRAY['F', 'G', 'H', 'N', 'R', 'S', 'T', 'R', 'R', 'F'])[n %% 10 + 1],
+        starts_at - INTERVAL '60 days',
+        (ARRAY['B', 'B', 'B', 'B', 'B', 'B', 'C', 'A', 'A', 'D'])[n %% 10 + 1],
+        'H', starts_at - INTERVAL '40 days', '', NULL,
+        CASE WHEN n %% 20 = 0 THEN '2' ELSE '1' END,
+        starts_at,
+        starts_at - INTERVAL '40 days',
+        starts_at - INTERVAL '40 days',
+        NULL, '', FALSE,
+        clinics.id
+FROM    params,
+        generate_series(1, params.appointments) AS n,
+        LATERAL (
+          SELECT DATE_TRUNC('day', NOW())
+                 - (params.days - 60) * INTERVAL '1 day'
+                 + (n::float / params.appointments) * params.days * INTERVAL '1 day'
+                 + (n %% 8) * INTERVAL '1 hour' AS starts_at
+        ) AS times,
+        clinics
+WHERE   clinics.idx = n %% 50;
+
+INSERT INTO notifications_message (
+  id, notify_id, batch_id, created_at, sent_at, status, nhs_notify_errors,
+  appointment_id
+)
+SELECT  gen_random_uuid(),
+        '',
+        NULL,
+        appt.starts_at - INTERVAL '28 days',
+        appt.starts_at - INTERVAL '27 days',
+        CASE WHEN appt.nhs_number %% 25 = 0 THEN 'failed' ELSE 'delivered' END,
+        CASE
+          WHEN appt.nhs_number %% 50 = 0
+          THEN '[{"code": "CM_INVALID_NHS_NUMBER", "title": "Invalid NHS number"}]'::jsonb
+        END,
+        appt.id
+FROM    notifications_appointment appt
+WHERE   appt.episode_type NOT IN ('H', 'N', 'T')
+AND     appt.number = '1';
+
+INSERT INTO notifications_messagestatus (
+  id, message_id, status, description, idempotency_key, status_updated_at,
+  created_at, updated_at
+)
+SELECT  gen_random_uuid(),
+        msg.id,
+        msg.status,
+        CASE WHEN msg.status = 'failed' THEN 'Unable to deliver' END,
+        gen_random_uuid()::text,
+        msg.sent_at + INTERVAL '2 hours',
+        msg.sent_at + INTERVAL '2 hours',
+        msg.sent_at + INTERVAL '2 hours'
+FROM    notifications_message msg;
+
+INSERT INTO notifications_channelstatus (
+  id, message_id, channel, status, description, idempotency_key,
+  status_updated_at, created_at, updated_at
+)
+SELECT  gen_random_uuid(),
+        msg.id,
+        channel.name,
+        channel.status,
+        NULL,
+        gen_random_uuid()::text,
+        msg.sent_at + INTERVAL '1 hour',
+        msg.sent_at + INTERVAL '1 hour',
+        msg.sent_at + INTERVAL '1 hour'
+FROM    notifications_message msg
+CROSS JOIN (
+  VALUES ('nhsapp', 'read'), ('sms', 'delivered')
+) AS channel (name, status);
+
+ANALYZE notifications_clinic, notifications_appointment, notifications_message,
+        notifications_messagestatus, notifications_channelstatus;
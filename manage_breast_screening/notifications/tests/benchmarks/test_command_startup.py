@@ -0,0 +1,41 @@
+"""
+Startup regression suite for the notifications management commands.
+
+Starts each command in a fresh Python process, as a scheduled job does, and
+fails if it imports a dependency which should only be imported where it is
+used, or takes longer than NOTIFICATIONS_STARTUP_BUDGET_MS (default 5000) to
+reach handle(). The budget is scaled with
+NOTIFICATIONS_BENCHMARK_LATENCY_FACTOR on slower machines.
+"""
+
+import os
+
+import pytest
+
+from manage_breast_screening.notifications.management.commands.helpers.startup_profiler import (
+    profile_command,
+)
+
+BUDGET_MS = float(os.getenv("NOTIFICATIONS_STARTUP_BUDGET_MS", "5000"))
+LATENCY_FACTOR = float(os.getenv("NOTIFICATIONS_BENCHMARK_LATENCY_FACTOR", "1"))
+
+COMMANDS = [
+    "archive_status_partitions",
+    "create_appointments",
+    "create_reports",
+    "notifications_worker",
+    "retry_failed_message_batch",
+    "save_message_status",
+    "send_message_batch",
+    "store_mesh_messages",
+]
+
+
+@pytest.mark.parametrize("command", COMMANDS)
+def test_command_starts_within_budget(command):
+    profile = profile_command(command)
+
+    assert profile.lazy_modules_loaded() == []
+    assert profile.startup_ms < BUDGET_MS * LATENCY_FACTOR, "\n".join(
+        f"{package}: {ms:.0f}ms" for package, ms in profile.slowest_imports()
+    )
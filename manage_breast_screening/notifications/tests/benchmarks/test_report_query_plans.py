@@ -0,0 +1,186 @@
+"""
+Query plan regression suite for the notifications reports.
+
+Seeds a notifications dataset covering several years of appointments, runs
+each report query under EXPLAIN (ANALYZE, BUFFERS) and fails if the plan
+sequentially scans a large table, reads status partitions from outside the
+report's window or the query exceeds its latency budget.
+
+Run with `make test-benchmark`. The dataset size can be tuned with
+NOTIFICATIONS_BENCHMARK_APPOINTMENTS and NOTIFICATIONS_BENCHMARK_DAYS, and
+every budget scaled with NOTIFICATIONS_BENCHMARK_LATENCY_FACTOR on slower
+machines. Set NOTIFICATIONS_BENCHMARK_OUTPUT to a file path to record
+timings and plan shapes as JSON.
+"""
+
+import json
+import os
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from dateutil.relativedelta import relativedelta
+from django.db import connection
+
+from manage_breast_screening.notifications.management.commands.helpers.status_partitions import (
+    PARTITIONED_TABLES,
+    StatusPartitions,
+)
+from manage_breast_screening.notifications.models import ZONE_INFO
+from manage_breast_screening.notifications.queries.helper import (
+    STATUS_LOOKBACK,
+    Helper,
+)
+
+APPOINTMENTS = int(os.getenv("NOTIFICATIONS_BENCHMARK_APPOINTMENTS", "300000"))
+DAYS = int(os.getenv("NOTIFICATIONS_BENCHMARK_DAYS", "1825"))
+LATENCY_FACTOR = float(os.getenv("NOTIFICATIONS_BENCHMARK_LATENCY_FACTOR", "1"))
+OUTPUT = os.getenv("NOTIFICATIONS_BENCHMARK_OUTPUT")
+
+# Tables that grow with appointment history and must never be scanned in full.
+# The status tables are partitioned by month, and only partitions within a
+# report's window may be read.
+LARGE_TABLES = {
+    "notifications_appointment",
+    "notifications_message",
+}
+
+TODAY = datetime.now(tz=ZONE_INFO).date()
+# Report name -> (query params, latency budget in ms, oldest status read)
+REPORTS = {
+    "aggregate": (
+        ["3 months", STATUS_LOOKBACK, "MBD"],
+        500,
+        TODAY - relativedelta(months=3) - STATUS_LOOKBACK,
+    ),
+    "failures": ([TODAY, STATUS_LOOKBACK, "MBD"], 50, TODAY - STATUS_LOOKBACK),
+    "reconciliation": ([TODAY, "MBD"], 50, None),
+}
+
+results = {}
+
+
+@pytest.fixture(scope="module")
+def seeded_database(django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        # Monthly status partitions for the whole seeded history, as the
+        # archive_status_partitions command would have created over time
+        created = [
+            (StatusPartitions(table), partition)
+            for table in PARTITIONED_TABLES
+            for partition in StatusPartitions(table).ensure(
+                TODAY - timedelta(days=DAYS + 60), TODAY + timedelta(days=90)
+            )
+        ]
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                (Path(__file__).parent / "seed.sql").read_text(),
+                {"appointments": APPOINTMENTS, "days": DAYS},
+            )
+
+        yield
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "TRUNCATE notifications_channelstatus, notifications_messagestatus, "
+                "notifications_message, notifications_appointment, "
+                "notifications_clinic CASCADE"
+            )
+
+        # The partitions were committed outside any test's transaction, so
+        # leave the partition layout as we found it for the other tests
+        for partitions, partition in created:
+            partitions.drop(partition)
+
+        if OUTPUT:
+            Path(OUTPUT).write_text(json.dumps(results, indent=2))
+
+
+def partition_month(relation_name: str) -> date | None:
+    """The month of a status table partition, e.g. 'notifications_channelstatus_p2025_10'"""
+    for table in PARTITIONED_TABLES:
+        if match := StatusPartitions(table).pattern.match(relation_name):
+            return date(int(match[1]), int(match[2]), 1)
+    return None
+
+
+def explain(report_name: str, params: list) -> dict:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + Helper.sql(report_name),
+            params,
+        )
+        return cursor.fetchone()[0][0]
+
+
+def plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def plan_shape(plan: dict, depth: int = 0) -> list[str]:
+    """One line per plan node, e.g. '  Index Scan on notifications_message'"""
+    line = "  " * depth + plan["Node Type"]
+    if "Relation Name" in plan:
+        line += f" on {plan['Relation Name']}"
+    if "Index Name" in plan:
+        line += f" using {plan['Index Name']}"
+
+    return [line] + [
+        shape
+        for child in plan.get("Plans", [])
+        for shape in plan_shape(child, depth + 1)
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("report_name", REPORTS.keys())
+class TestReportQueryPlans:
+    @pytest.fixture
+    def explained(self, seeded_database, report_name):
+        params, _, _ = REPORTS[report_name]
+        explained = explain(report_name, params)
+        plan = explained["Plan"]
+        results[report_name] = {
+            "execution_time_ms": explained["Execution Time"],
+            "planning_time_ms": explained["Planning Time"],
+            "shared_buffers_hit": plan.get("Shared Hit Blocks"),
+            "shared_buffers_read": plan.get("Shared Read Blocks"),
+            "plan": plan_shape(plan),
+        }
+        return explained
+
+    def test_does_not_sequentially_scan_large_tables(self, explained):
+        seq_scans = [
+            node["Relation Name"]
+            for node in plan_nodes(explained["Plan"])
+            if node["Node Type"] == "Seq Scan" and node["Relation Name"] in LARGE_TABLES
+        ]
+
+        assert seq_scans == [], "\n".join(plan_shape(explained["Plan"]))
+
+    def test_only_reads_status_partitions_within_the_report_window(
+        self, explained, report_name
+    ):
+        _, _, oldest_status = REPORTS[report_name]
+        months = {
+            partition_month(node["Relation Name"])
+            for node in plan_nodes(explained["Plan"])
+            if "Relation Name" in node
+        } - {None}
+
+        if oldest_status is None:
+            assert months == set()
+        else:
+            assert min(months) == oldest_status.replace(day=1), "\n".join(
+                plan_shape(explained["Plan"])
+            )
+
+    def test_runs_within_latency_budget(self, explained, report_name):
+        _, budget_ms, _ = REPORTS[report_name]
+
+        assert explained["Execution Time"] < budget_ms * LATENCY_FACTOR, "\n".join(
+            plan_shape(explained["Plan"])
+        )
@@ -26,4 +26,5 @@ def mock_insights_logger(request, monkeypatch):
     monkeypatch.setattr(
         ApplicationInsightsLogging, "custom_event", mock_insights_logger
     )
+    monkeypatch.setattr(ApplicationInsightsLogging, "metric", MagicMock())
     return mock_insights_logger
@@ -39,6 +39,12 @@ class TestMessageBatchHelpers:
         )
         return mock_insights_logger
 
+    @pytest.fixture(autouse=True)
+    def mock_insights_metric(self, monkeypatch):
+        mock_insights_metric = MagicMock()
+        monkeypatch.setattr(ApplicationInsightsLogging, "metric", mock_insights_metric)
+        return mock_insights_metric
+
     @pytest.mark.django_db
     def test_mark_messages_as_sent(self):
         message_1 = MessageFactory(status="scheduled")
@@ -81,7 +87,7 @@ class TestMessageBatchHelpers:
     @pytest.mark.parametrize("status_code", [401, 403, 404, 405, 406, 413, 415, 422])
     @pytest.mark.django_db
     def test_mark_batch_as_failed_with_unrecoverable_failures(
-        self, status_code, routing_plan_id
+        self, status_code, routing_plan_id, mock_insights_metric
     ):
         """Test that message batches which fail to send are marked correctly"""
         mock_response = MagicMock()
@@ -107,6 +113,9 @@ class TestMessageBatchHelpers:
         assert message_batch.messages.count() == 1
         assert message_batch.messages.all()[0].status == "failed"
         assert message_batch.messages.all()[0].sent_at == mock_now
+        mock_insights_metric.assert_called_once_with(
+            "batch_marked_as_failed", 1, status_code=status_code
+        )
 
     @pytest.mark.parametrize("status_code", [408, 425, 429, 500, 503, 504])
     @pytest.mark.django_db
@@ -0,0 +1,32 @@
+from manage_breast_screening.notifications.management.commands.helpers.startup_profiler import (
+    StartupProfile,
+    parse_importtime,
+)
+
+IMPORTTIME = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |       2500 | django
+import time:       100 |        100 |   django.utils
+import time:       200 |       1500 | django.urls
+import time:       512 |      40210 | pandas
+Traceback lines are ignored
+"""
+
+
+class TestParseImporttime:
+    def test_totals_top_level_imports_by_package(self):
+        assert parse_importtime(IMPORTTIME) == {"django": 4.0, "pandas": 40.21}
+
+
+class TestStartupProfile:
+    def test_lists_slowest_imports_and_lazy_modules_loaded(self):
+        profile = StartupProfile(
+            command="create_appointments",
+            startup_ms=1200.0,
+            modules=["django", "pandas", "pandas.core"],
+            import_ms={"django": 4.0, "pandas": 40.21},
+        )
+
+        assert profile.slowest_imports(1) == [("pandas", 40.21)]
+        assert profile.lazy_modules_loaded() == ["pandas"]
+        assert profile.as_dict()["lazy_modules_loaded"] == ["pandas"]
@@ -0,0 +1,166 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from manage_breast_screening.notifications.management.commands.helpers.worker import (
+    CronSchedule,
+    Task,
+    Worker,
+)
+
+
+@pytest.fixture
+def mock_call_command():
+    with patch(
+        "manage_breast_screening.notifications.management.commands.helpers.worker.call_command"
+    ) as mock_call_command:
+        yield mock_call_command
+
+
+def at(*args) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class TestCronSchedule:
+    def test_matches_lists_ranges_and_weekdays(self):
+        schedule = CronSchedule("0,30 9-12 * * 1-5")
+
+        # Monday
+        assert schedule.matches(at(2025, 10, 6, 9, 30))
+        assert schedule.matches(at(2025, 10, 6, 12, 0))
+        assert not schedule.matches(at(2025, 10, 6, 13, 0))
+        assert not schedule.matches(at(2025, 10, 6, 9, 15))
+        # Sunday
+        assert not schedule.matches(at(2025, 10, 5, 9, 30))
+
+    def test_matches_steps(self):
+        schedule = CronSchedule("*/15 * * * *")
+
+        assert schedule.matches(at(2025, 10, 6, 3, 45))
+        assert not schedule.matches(at(2025, 10, 6, 3, 50))
+
+    def test_restricted_day_of_month_or_week_matches_either(self):
+        schedule = CronSchedule("0 0 1 * 0")
+
+        # The 1st, a Wednesday
+        assert schedule.matches(at(2025, 10, 1, 0, 0))
+        # A Sunday
+        assert schedule.matches(at(2025, 10, 5, 0, 0))
+        assert not schedule.matches(at(2025, 10, 6, 0, 0))
+
+    @pytest.mark.parametrize("expression", ["* * * *", "60 * * * *", "5-1 * * * *"])
+    def test_rejects_invalid_expressions(self, expression):
+        with pytest.raises(ValueError):
+            CronSchedule(expression)
+
+
+class TestTask:
+    def test_scheduled_task_is_due_once_per_matching_minute(self):
+        task = Task("a_command", schedule=CronSchedule("30 * * * *"))
+
+        assert task.due(at(2025, 10, 6, 9, 30, 0), 0)
+        assert not task.due(at(2025, 10, 6, 9, 30, 1), 1)
+        assert not task.due(at(2025, 10, 6, 9, 31, 0), 60)
+        assert task.due(at(2025, 10, 6, 10, 30, 0), 3600)
+
+    def test_interval_task_is_due_every_interval(self):
+        task = Task("a_command", interval=10)
+        now = at(2025, 10, 6, 9, 30)
+
+        assert task.due(now, 100)
+        assert not task.due(now, 105)
+        assert task.due(now, 110)
+
+    def test_needs_a_schedule_or_an_interval(self):
+        with pytest.raises(ValueError):
+            Task("a_command")
+
+
+class TestWorker:
+    def test_runs_a_submitted_task_and_records_the_run(self, mock_call_command):
+        task = Task("a_command", interval=10)
+        worker = Worker([task], max_workers=1)
+
+        worker.submit(task)
+        worker.executor.shutdown(wait=True)
+
+        mock_call_command.assert_called_once_with("a_command")
+        assert task.runs == 1
+        assert task.failures == 0
+        assert task.last_succeeded_at is not None
+        assert task.running == 0
+
+    def test_records_a_failed_task_without_raising(self, mock_call_command):
+        mock_call_command.side_effect = Exception("MESH unavailable")
+        task = Task("a_command", interval=10)
+        worker = Worker([task], max_workers=1)
+
+        worker.submit(task)
+        worker.executor.shutdown(wait=True)
+
+        assert task.runs == 1
+        assert task.failures == 1
+        assert task.last_error == "MESH unavailable"
+        assert task.running == 0
+
+    def test_skips_a_task_at_its_concurrency_limit(self, mock_call_command):
+        release = threading.Event()
+        mock_call_command.side_effect = lambda *args: release.wait(5)
+        task = Task("a_command", interval=10)
+        worker = Worker([task], max_workers=2)
+
+        worker.submit(task)
+        worker.submit(task)
+        release.set()
+        worker.executor.shutdown(wait=True)
+
+        assert mock_call_command.call_count == 1
+        assert task.runs == 1
+
+    def test_runs_due_tasks_until_stopped_and_waits_for_them(self, mock_call_command):
+        task = Task("a_command", interval=60)
+        worker = Worker([task], max_workers=1, tick_seconds=0.01)
+        mock_call_command.side_effect = lambda *args: worker.stop()
+
+        worker.run()
+
+        mock_call_command.assert_called_once_with("a_command")
+        assert task.runs == 1
+
+    def test_serves_health(self, mock_call_command):
+        task = Task("a_command", schedule=CronSchedule("0 6 * * *"))
+        worker = Worker([task], max_workers=1, health_port=0)
+        worker.start_health_server()
+        url = f"http://127.0.0.1:{worker.health_server.server_address[1]}/health"
+
+        try:
+            with urllib.request.urlopen(url) as response:
+                assert response.status == 200
+                assert json.loads(response.read()) == {
+                    "status": "ok",
+                    "tasks": {
+                        "a_command": {
+                            "schedule": "0 6 * * *",
+                            "running": 0,
+                            "runs": 0,
+                            "failures": 0,
+                            "last_started_at": None,
+                            "last_succeeded_at": None,
+                            "last_error": None,
+                        }
+                    },
+                }
+
+            worker.stop()
+
+            with pytest.raises(urllib.error.HTTPError) as error:
+                urllib.request.urlopen(url)
+            assert error.value.code == 503
+        finally:
+            worker.health_server.shutdown()
+            worker.health_server.server_close()
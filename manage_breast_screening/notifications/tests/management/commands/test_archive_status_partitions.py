@@ -0,0 +1,152 @@
+import gzip
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from dateutil.relativedelta import relativedelta
+from django.core.management.base import CommandError
+from django.db import connection
+
+from manage_breast_screening.notifications.management.commands.archive_status_partitions import (
+    Command,
+)
+from manage_breast_screening.notifications.management.commands.helpers.status_partitions import (
+    Partition,
+    StatusPartitions,
+)
+from manage_breast_screening.notifications.models import ChannelStatus, MessageStatus
+from manage_breast_screening.notifications.tests.factories import (
+    ChannelStatusFactory,
+    MessageStatusFactory,
+)
+
+THIS_MONTH = datetime.now(tz=timezone.utc).date().replace(day=1)
+LAST_YEAR = THIS_MONTH - relativedelta(months=12)
+
+
+def in_month(month: date) -> datetime:
+    return datetime(month.year, month.month, 15, tzinfo=timezone.utc)
+
+
+def check_constraints():
+    """
+    Run the deferred foreign key checks for rows created in the test
+    transaction, which would otherwise stop their partition being dropped
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+
+
+@pytest.fixture
+def mock_blob_storage():
+    with patch(
+        "manage_breast_screening.notifications.management.commands.archive_status_partitions.BlobStorage"
+    ) as mock_blob_storage:
+        uploads = {}
+        mock_blob_storage.return_value.add.side_effect = (
+            lambda filename, content, **kwargs: uploads.update(
+                {filename: gzip.decompress(content.read()).decode()}
+            )
+        )
+        mock_blob_storage.uploads = uploads
+        yield mock_blob_storage
+
+
+@pytest.mark.django_db
+class TestStatusPartitions:
+    def test_ensure_creates_missing_monthly_partitions(self):
+        partitions = StatusPartitions("notifications_channelstatus")
+
+        created = partitions.ensure(date(2040, 1, 1), date(2040, 3, 1))
+
+        assert [partition.name for partition in created] == [
+            "notifications_channelstatus_p2040_01",
+            "notifications_channelstatus_p2040_02",
+            "notifications_channelstatus_p2040_03",
+        ]
+        assert partitions.ensure(date(2040, 1, 1), date(2040, 3, 1)) == []
+
+    def test_ensure_moves_rows_out_of_the_default_partition(self):
+        status = ChannelStatusFactory(status_updated_at=in_month(date(2040, 5, 1)))
+        partitions = StatusPartitions("notifications_channelstatus")
+
+        partitions.ensure(date(2040, 5, 1), date(2040, 5, 1))
+
+        partitions.detach(Partition("notifications_channelstatus", date(2040, 5, 1)))
+        assert not ChannelStatus.objects.filter(pk=status.pk).exists()
+
+    def test_rejects_tables_which_are_not_partitioned(self):
+        with pytest.raises(ValueError):
+            StatusPartitions("notifications_message")
+
+
+@pytest.mark.django_db
+class TestArchiveStatusPartitions:
+    def test_archives_and_drops_partitions_older_than_retention(
+        self, mock_blob_storage
+    ):
+        StatusPartitions("notifications_channelstatus").ensure(LAST_YEAR, LAST_YEAR)
+        StatusPartitions("notifications_messagestatus").ensure(LAST_YEAR, LAST_YEAR)
+        old_channel_status = ChannelStatusFactory(status_updated_at=in_month(LAST_YEAR))
+        old_message_status = MessageStatusFactory(status_updated_at=in_month(LAST_YEAR))
+        current_status = ChannelStatusFactory()
+        check_constraints()
+
+        Command().handle()
+
+        channel_archive = mock_blob_storage.uploads[
+            f"notifications_channelstatus/{LAST_YEAR:%Y-%m}.csv.gz"
+        ]
+        message_archive = mock_blob_storage.uploads[
+            f"notifications_messagestatus/{LAST_YEAR:%Y-%m}.csv.gz"
+        ]
+        assert channel_archive.startswith("id,channel,status,")
+        assert old_channel_status.idempotency_key in channel_archive
+        assert old_message_status.idempotency_key in message_archive
+        assert mock_blob_storage.return_value.add.call_args.kwargs == {
+            "content_type": "text/csv",
+            "content_encoding": "gzip",
+        }
+
+        assert not ChannelStatus.objects.filter(pk=old_channel_status.pk).exists()
+        assert not MessageStatus.objects.filter(pk=old_message_status.pk).exists()
+        assert ChannelStatus.objects.filter(pk=current_status.pk).exists()
+        assert (
+            Partition("notifications_channelstatus", LAST_YEAR)
+            not in StatusPartitions("notifications_channelstatus").partitions()
+        )
+
+    def test_creates_partitions_for_the_coming_months(self, mock_blob_storage):
+        Command().handle()
+
+        months = [
+            partition.month
+            for partition in StatusPartitions(
+                "notifications_messagestatus"
+            ).partitions()
+        ]
+        assert [THIS_MONTH + relativedelta(months=n) for n in range(4)] == months[-4:]
+
+    def test_keeps_detached_partition_when_upload_fails(self, mock_blob_storage):
+        partitions = StatusPartitions("notifications_channelstatus")
+        partitions.ensure(LAST_YEAR, LAST_YEAR)
+        ChannelStatusFactory(status_updated_at=in_month(LAST_YEAR))
+        check_constraints()
+        mock_blob_storage.return_value.add.side_effect = Exception("unavailable")
+
+        with pytest.raises(CommandError):
+            Command().handle()
+
+        partition = Partition("notifications_channelstatus", LAST_YEAR)
+        assert partition in partitions.partitions()
+        assert not partitions.is_attached(partition)
+
+    def test_rejects_a_retention_shorter_than_the_reporting_window(
+        self, monkeypatch, mock_blob_storage
+    ):
+        monkeypatch.setenv("NOTIFICATIONS_STATUS_RETENTION_MONTHS", "2")
+
+        with pytest.raises(CommandError):
+            Command().handle()
+
+        mock_blob_storage.return_value.add.assert_not_called()
@@ -1,15 +1,18 @@
+import gzip
+import hashlib
+import threading
 from contextlib import contextmanager
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
+import zstandard
 from django.core.management.base import CommandError
-from django.db import connection
 
 from manage_breast_screening.notifications.management.commands.create_reports import (
     Command,
 )
-from manage_breast_screening.notifications.queries.helper import Helper
+from manage_breast_screening.notifications.queries.helper import STATUS_LOOKBACK
 
 
 class TestCreateReports:
@@ -26,52 +29,58 @@ class TestCreateReports:
         return datetime.today()
 
     @contextmanager
-    def mocked_dependencies(self, dataframe, csv_data, now):
+    def mocked_dependencies(self, csv_data, now):
         module = (
             "manage_breast_screening.notifications.management.commands.create_reports"
         )
 
         with patch(f"{module}.BlobStorage") as mock_storage:
             mock_blob_storage = MagicMock()
+            mock_blob_storage.metadata.return_value = None
+            mock_blob_storage.uploads = {}
+
+            def add(filename, content, **kwargs):
+                mock_blob_storage.uploads[filename] = (
+                    content if isinstance(content, bytes) else content.read()
+                )
+
+            mock_blob_storage.add.side_effect = add
             mock_storage.return_value = mock_blob_storage
 
-            with patch(f"{module}.pandas.read_sql") as mock_read_sql:
-                mock_read_sql.return_value = dataframe
+            with patch(f"{module}.Helper.write_csv") as mock_write_csv:
+                mock_write_csv.side_effect = lambda name, params, file: file.write(
+                    csv_data.encode()
+                )
 
                 with patch(f"{module}.datetime") as mock_datetime:
                     mock_datetime.today.return_value = now
 
                     with patch(f"{module}.NhsMail") as mock_email:
                         mock_email_service = MagicMock()
+                        mock_email_service.__enter__.return_value = mock_email_service
                         mock_email.return_value = mock_email_service
 
-                        yield (mock_read_sql, mock_blob_storage, mock_email_service)
+                        yield (mock_write_csv, mock_blob_storage, mock_email_service)
 
-    @pytest.fixture
-    def dataframe(self, csv_data):
-        df = MagicMock()
-        df.to_csv.return_value = csv_data
-        return df
-
-    def test_handle_creates_all_reports(self, dataframe, csv_data, now):
-        with self.mocked_dependencies(dataframe, csv_data, now) as md:
+    def test_handle_creates_all_reports(self, csv_data, now):
+        with self.mocked_dependencies(csv_data, now) as md:
             Command().handle()
 
-        mock_read_sql, mock_blob_storage, mock_email_service = md
+        mock_write_csv, mock_blob_storage, mock_email_service = md
 
-        assert mock_read_sql.call_count == 3
-        assert mock_blob_storage.add.call_count == 3
+        assert mock_write_csv.call_count == 3
+        assert mock_blob_storage.add.call_count == 6
         assert mock_email_service.send_report_email.call_count == 3
 
         for bso_code in Command.BSO_CODES:
-            mock_read_sql.assert_any_call(
-                Helper.sql("aggregate"), connection, params=["3 months", bso_code]
+            mock_write_csv.assert_any_call(
+                "aggregate", ["3 months", STATUS_LOOKBACK, bso_code], ANY
             )
-            mock_read_sql.assert_any_call(
-                Helper.sql("failures"), connection, params=[now.date(), bso_code]
+            mock_write_csv.assert_any_call(
+                "failures", [now.date(), STATUS_LOOKBACK, bso_code], ANY
             )
-            mock_read_sql.assert_any_call(
-                Helper.sql("reconciliation"), connection, params=[now.date(), bso_code]
+            mock_write_csv.assert_any_call(
+                "reconciliation", [now.date(), bso_code], ANY
             )
 
             aggregate_filename = (
@@ -79,38 +88,55 @@ class TestCreateReports:
             )
             failures_filename = f"{now.strftime('%Y-%m-%dT%H:%M:%S')}-{bso_code}-invites-not-sent-report.csv"
             reconciliation_filename = f"{now.strftime('%Y-%m-%dT%H:%M:%S')}-{bso_code}-reconciliation-report.csv"
+            digest = hashlib.sha256(csv_data.encode()).hexdigest()
 
             mock_blob_storage.add.assert_any_call(
                 aggregate_filename,
-                csv_data,
+                ANY,
                 content_type="text/csv",
                 container_name="reports",
+                metadata={"sha256": digest},
             )
+            assert mock_blob_storage.uploads[aggregate_filename] == csv_data.encode()
             mock_blob_storage.add.assert_any_call(
                 failures_filename,
-                csv_data,
+                ANY,
                 content_type="text/csv",
                 container_name="reports",
+                metadata={"sha256": digest},
             )
+            assert mock_blob_storage.uploads[failures_filename] == csv_data.encode()
             mock_blob_storage.add.assert_any_call(
                 reconciliation_filename,
-                csv_data,
+                ANY,
                 content_type="text/csv",
                 container_name="reports",
+                metadata={"sha256": digest},
+            )
+            assert (
+                mock_blob_storage.uploads[reconciliation_filename] == csv_data.encode()
+            )
+
+            mock_blob_storage.add.assert_any_call(
+                f"latest/{bso_code}-aggregate-report",
+                b"",
+                content_type="text/plain",
+                container_name="reports",
+                metadata={"sha256": digest, "artefact": aggregate_filename},
             )
 
             mock_email_service.send_report_email.assert_any_call(
-                attachment_data=csv_data,
+                attachment_data=csv_data.encode(),
                 attachment_filename=aggregate_filename,
                 report_type="aggregate",
             )
             mock_email_service.send_report_email.assert_any_call(
-                attachment_data=csv_data,
+                attachment_data=csv_data.encode(),
                 attachment_filename=failures_filename,
                 report_type="invites_not_sent",
             )
             mock_email_service.send_report_email.assert_any_call(
-                attachment_data=csv_data,
+                attachment_data=csv_data.encode(),
                 attachment_filename=reconciliation_filename,
                 report_type="reconciliation",
             )
@@ -141,21 +167,155 @@ class TestCreateReports:
                 )
 
     @pytest.mark.django_db
-    def test_smoke_test_argument_uses_correct_configuration(
-        self, dataframe, csv_data, now
-    ):
-        with self.mocked_dependencies(dataframe, csv_data, now) as md:
+    def test_smoke_test_argument_uses_correct_configuration(self, csv_data, now):
+        with self.mocked_dependencies(csv_data, now) as md:
             Command().handle(**{"smoke_test": True})
 
-        mock_read_sql, mock_blob_storage, mock_email_service = md
+        mock_write_csv, mock_blob_storage, mock_email_service = md
 
-        mock_read_sql.assert_called_once_with(
-            Helper.sql("reconciliation"), connection, params=[now.date(), "SM0K3"]
+        mock_write_csv.assert_called_once_with(
+            "reconciliation", [now.date(), "SM0K3"], ANY
         )
-        mock_blob_storage.add.assert_called_once_with(
+        mock_blob_storage.add.assert_any_call(
             "SM0K3-reconciliation-report.csv",
-            csv_data,
+            ANY,
             content_type="text/csv",
             container_name="reports",
+            metadata={"sha256": hashlib.sha256(csv_data.encode()).hexdigest()},
+        )
+        assert mock_blob_storage.uploads["SM0K3-reconciliation-report.csv"] == (
+            csv_data.encode()
         )
+        mock_blob_storage.metadata.assert_not_called()
         mock_email_service.assert_not_called()
+
+    def test_one_failed_report_does_not_stop_the_others(
+        self, csv_data, now, mock_insights_logger
+    ):
+        with self.mocked_dependencies(csv_data, now) as md:
+            mock_write_csv, mock_blob_storage, mock_email_service = md
+            write_csv = mock_write_csv.side_effect
+
+            def fail_failures_report(name, params, file):
+                if name == "failures":
+                    raise Exception("query timed out")
+                return write_csv(name, params, file)
+
+            mock_write_csv.side_effect = fail_failures_report
+
+            with pytest.raises(CommandError, match="1 of 3 reports failed"):
+                Command().handle()
+
+        assert mock_write_csv.call_count == 3
+        assert mock_blob_storage.add.call_count == 4
+        assert mock_email_service.send_report_email.call_count == 2
+        mock_insights_logger.assert_called_once_with(
+            "CreateReportsError: 1 of 3 reports failed: "
+            "MBD invites_not_sent: query timed out"
+        )
+
+    def test_reports_run_on_a_bounded_pool(self, csv_data, now, monkeypatch):
+        monkeypatch.setenv("NOTIFICATIONS_REPORTS_MAX_WORKERS", "2")
+        module = (
+            "manage_breast_screening.notifications.management.commands.create_reports"
+        )
+        lock = threading.Lock()
+        pool_full = threading.Event()
+        running = 0
+        peak = 0
+
+        def write_csv(name, params, file):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+                if running == 2:
+                    pool_full.set()
+            # Hold each report open until the pool is full, so a third report
+            # would be seen running alongside them if the pool allowed it
+            pool_full.wait(timeout=5)
+            file.write(csv_data.encode())
+            with lock:
+                running -= 1
+
+        with self.mocked_dependencies(csv_data, now) as md:
+            mock_write_csv = md[0]
+            mock_write_csv.side_effect = write_csv
+
+            with patch(f"{module}.connection") as mock_connection:
+                Command().handle()
+
+        assert mock_write_csv.call_count == 3
+        assert peak == 2
+        assert mock_connection.close.call_count == 3
+
+    def test_unchanged_reports_are_not_uploaded_again(self, csv_data, now):
+        with self.mocked_dependencies(csv_data, now) as md:
+            mock_write_csv, mock_blob_storage, mock_email_service = md
+            mock_blob_storage.metadata.return_value = {
+                "sha256": hashlib.sha256(csv_data.encode()).hexdigest(),
+                "artefact": "2025-01-01T02:00:00-MBD-aggregate-report.csv",
+            }
+
+            Command().handle()
+
+        mock_blob_storage.metadata.assert_any_call(
+            "latest/MBD-aggregate-report", "reports"
+        )
+        mock_blob_storage.add.assert_not_called()
+        assert mock_email_service.send_report_email.call_count == 3
+
+    def test_changed_reports_are_uploaded(self, csv_data, now):
+        with self.mocked_dependencies(csv_data, now) as md:
+            mock_write_csv, mock_blob_storage, mock_email_service = md
+            mock_blob_storage.metadata.return_value = {"sha256": "something-else"}
+
+            Command().handle()
+
+        assert mock_blob_storage.add.call_count == 6
+
+    @pytest.mark.parametrize(
+        "encoding,extension,decompress",
+        [
+            ("gzip", ".gz", gzip.decompress),
+            ("zstd", ".zst", zstandard.ZstdDecompressor().decompressobj().decompress),
+        ],
+    )
+    def test_reports_are_compressed_if_configured(
+        self, csv_data, now, monkeypatch, encoding, extension, decompress
+    ):
+        monkeypatch.setenv("NOTIFICATIONS_REPORTS_COMPRESSION", encoding)
+
+        with self.mocked_dependencies(csv_data, now) as md:
+            mock_write_csv, mock_blob_storage, mock_email_service = md
+            Command().handle(**{"smoke_test": True})
+
+        filename = "SM0K3-reconciliation-report.csv" + extension
+        mock_blob_storage.add.assert_any_call(
+            filename,
+            ANY,
+            content_type="text/csv",
+            content_encoding=encoding,
+            container_name="reports",
+            metadata={"sha256": hashlib.sha256(csv_data.encode()).hexdigest()},
+        )
+        assert decompress(mock_blob_storage.uploads[filename]) == csv_data.encode()
+        mock_blob_storage.add.assert_any_call(
+            "latest/SM0K3-reconciliation-report",
+            b"",
+            content_type="text/plain",
+            container_name="reports",
+            metadata={"sha256": ANY, "artefact": filename},
+        )
+
+    def test_unsupported_compression_raises_before_running_reports(
+        self, csv_data, now, monkeypatch
+    ):
+        monkeypatch.setenv("NOTIFICATIONS_REPORTS_COMPRESSION", "brotli")
+
+        with self.mocked_dependencies(csv_data, now) as md:
+            mock_write_csv, mock_blob_storage, mock_email_service = md
+            with pytest.raises(CommandError, match="Unsupported compression 'brotli'"):
+                Command().handle()
+
+        mock_write_csv.assert_not_called()
@@ -0,0 +1,130 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from manage_breast_screening.notifications.management.commands.notifications_worker import (
+    Command,
+)
+from manage_breast_screening.notifications.services.blob_storage import BlobStorage
+from manage_breast_screening.notifications.services.queue import Queue
+
+
+@pytest.fixture
+def mock_worker():
+    with patch(
+        "manage_breast_screening.notifications.management.commands.notifications_worker.Worker"
+    ) as mock_worker:
+        yield mock_worker
+
+
+@pytest.fixture(autouse=True)
+def mock_signal():
+    with patch(
+        "manage_breast_screening.notifications.management.commands.notifications_worker.signal"
+    ) as mock_signal:
+        yield mock_signal
+
+
+SCHEDULES = {
+    "STORE_MESH_MESSAGES": "0 6-20 * * *",
+    "CREATE_APPOINTMENTS": "30 6-20 * * *",
+    "SEND_MESSAGE_BATCH": "0,30 9 * * 1-5",
+    "RETRY_FAILED_MESSAGE_BATCH": "0,30 9-12 * * 1-5",
+    "SAVE_MESSAGE_STATUS": "poll",
+}
+
+
+@pytest.fixture
+def scheduled(monkeypatch):
+    monkeypatch.setenv("NOTIFICATIONS_JOBS_SCHEDULE_ENABLED", "true")
+    for task, schedule in SCHEDULES.items():
+        monkeypatch.setenv(f"NOTIFICATIONS_WORKER_SCHEDULE_{task}", schedule)
+
+
+class TestNotificationsWorker:
+    def test_runs_every_scheduled_task(self, mock_worker, scheduled, monkeypatch):
+        monkeypatch.setenv("NOTIFICATIONS_WORKER_MAX_WORKERS", "2")
+        monkeypatch.setenv("NOTIFICATIONS_WORKER_STATUS_POLL_SECONDS", "5")
+
+        Command().handle()
+
+        tasks = mock_worker.call_args.args[0]
+        assert [task.command for task in tasks] == [
+            "store_mesh_messages",
+            "create_appointments",
+            "send_message_batch",
+            "retry_failed_message_batch",
+            "save_message_status",
+        ]
+        assert tasks[0].schedule.expression == "0 6-20 * * *"
+        assert tasks[-1].interval == 5
+        assert mock_worker.call_args.kwargs == {"max_workers": 2, "health_port": 8001}
+        mock_worker.return_value.run.assert_called_once()
+
+    def test_schedules_nothing_when_jobs_schedule_is_disabled(
+        self, mock_worker, scheduled, monkeypatch
+    ):
+        monkeypatch.setenv("NOTIFICATIONS_JOBS_SCHEDULE_ENABLED", "false")
+
+        Command().handle()
+
+        assert mock_worker.call_args.args[0] == []
+
+    def test_schedules_nothing_by_default(self, mock_worker, monkeypatch):
+        monkeypatch.delenv("NOTIFICATIONS_JOBS_SCHEDULE_ENABLED", raising=False)
+        for task in SCHEDULES:
+            monkeypatch.delenv(f"NOTIFICATIONS_WORKER_SCHEDULE_{task}", raising=False)
+
+        Command().handle()
+
+        assert mock_worker.call_args.args[0] == []
+
+    def test_skips_tasks_without_a_schedule(self, mock_worker, scheduled, monkeypatch):
+        monkeypatch.setenv("NOTIFICATIONS_WORKER_SCHEDULE_SEND_MESSAGE_BATCH", "")
+        monkeypatch.delenv("NOTIFICATIONS_WORKER_SCHEDULE_RETRY_FAILED_MESSAGE_BATCH")
+
+        Command().handle()
+
+        tasks = mock_worker.call_args.args[0]
+        assert [task.command for task in tasks] == [
+            "store_mesh_messages",
+            "create_appointments",
+            "save_message_status",
+        ]
+
+    def test_runs_selected_tasks(self, mock_worker, scheduled):
+        call_command("notifications_worker", "--task", "save_message_status")
+
+        tasks = mock_worker.call_args.args[0]
+        assert [task.command for task in tasks] == ["save_message_status"]
+
+    def test_stops_the_worker_on_sigterm(self, mock_worker, mock_signal):
+        Command().handle()
+
+        mock_signal.signal.assert_any_call(
+            mock_signal.SIGTERM, mock_worker.return_value.stop
+        )
+
+    def test_shares_storage_clients_while_running(self, mock_worker):
+        sharing = {}
+        mock_worker.return_value.run.side_effect = lambda: sharing.update(
+            queue=Queue._shared_clients is not None, blob=BlobStorage._sharing
+        )
+
+        Command().handle()
+
+        assert sharing == {"queue": True, "blob": True}
+        assert Queue._shared_clients is None
+        assert not BlobStorage._sharing
+
+    def test_worker_errors_raise_command_error(self, mock_worker, mock_insights_logger):
+        mock_worker.return_value.run.side_effect = OSError("Address in use")
+
+        with pytest.raises(CommandError):
+            Command().handle()
+
+        mock_insights_logger.assert_called_once_with(
+            "NotificationsWorkerError: Address in use"
+        )
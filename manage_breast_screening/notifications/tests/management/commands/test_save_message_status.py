@@ -211,3 +211,84 @@ class TestSaveMessageStatus:
         mock_insights_logger.assert_called_once_with(
             "SaveMessageStatusError: this is an error"
         )
+
+    @pytest.mark.django_db
+    def test_latest_message_status_is_updated(self, mock_queue):
+        message = MessageFactory.create()
+        mock_queue.return_value.items.return_value = [
+            self.status_update(message, "MessageStatus", "2025-07-17T14:27:51Z")
+        ]
+
+        Command().handle()
+
+        message.refresh_from_db()
+        assert message.latest_status == "delivered"
+        assert message.latest_status_updated_at == datetime.datetime(
+            2025, 7, 17, 14, 27, 51, tzinfo=datetime.timezone.utc
+        )
+
+    @pytest.mark.django_db
+    def test_latest_channel_status_only_moves_forward_in_time(self, mock_queue):
+        message = MessageFactory.create()
+        mock_queue.return_value.items.return_value = [
+            self.status_update(
+                message, "ChannelStatus", "2025-07-17T14:00:00Z", "delivered"
+            ),
+            self.status_update(
+                message, "ChannelStatus", "2025-07-17T12:00:00Z", "notified"
+            ),
+        ]
+
+        Command().handle()
+
+        message.refresh_from_db()
+        assert ChannelStatus.objects.filter(message=message).count() == 2
+        assert message.latest_sms_status == "delivered"
+        assert message.latest_sms_status_updated_at == datetime.datetime(
+            2025, 7, 17, 14, tzinfo=datetime.timezone.utc
+        )
+        assert message.latest_nhsapp_status is None
+
+        mock_queue.return_value.items.return_value = [
+            self.status_update(
+                message, "ChannelStatus", "2025-07-17T15:00:00Z", "permanent_failure"
+            ),
+        ]
+
+        Command().handle()
+
+        message.refresh_from_db()
+        assert message.latest_sms_status == "permanent_failure"
+
+    def status_update(
+        self, message, status_type, timestamp, status="delivered"
+    ) -> QueueMessage:
+        if status_type == "MessageStatus":
+            attributes = {
+                "messageStatus": status,
+                "messageStatusDescription": status,
+            }
+        else:
+            attributes = {
+                "channel": "sms",
+                "channelStatusDescription": status,
+                "supplierStatus": status,
+            }
+
+        return QueueMessage(
+            json.dumps(
+                {
+                    "data": [
+                        {
+                            "type": status_type,
+                            "attributes": {
+                                "messageReference": str(message.id),
+                                "timestamp": timestamp,
+                                **attributes,
+                            },
+                            "meta": {"idempotencyKey": uuid.uuid4().hex},
+                        }
+                    ]
+                }
+            )
+        )
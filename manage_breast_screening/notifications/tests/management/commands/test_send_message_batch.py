@@ -5,6 +5,7 @@ from unittest.mock import ANY, MagicMock, patch
 import pytest
 import requests
 from dateutil import relativedelta
+from django.db import connection
 
 from manage_breast_screening.notifications.management.commands.helpers.message_batch_helpers import (
     MessageBatchHelpers,
@@ -18,9 +19,11 @@ from manage_breast_screening.notifications.management.commands.send_message_batc
 )
 from manage_breast_screening.notifications.models import (
     ZONE_INFO,
+    Appointment,
     Message,
     MessageBatch,
 )
+from manage_breast_screening.notifications.queries.helper import STATUS_LOOKBACK
 from manage_breast_screening.notifications.services.api_client import ApiClient
 from manage_breast_screening.notifications.tests.factories import AppointmentFactory
 
@@ -159,6 +162,64 @@ class TestSendMessageBatch:
         assert messages.count() == 1
         assert messages[0].appointment == valid_appointment
 
+    def test_handle_marks_appointments_as_batched(
+        self, mock_mark_batch_as_sent, mock_send_message_batch
+    ):
+        """Test that batched appointments are not included in a later batch"""
+        mock_send_message_batch.return_value.status_code = 201
+        appointment = AppointmentFactory(starts_at=datetime.now(tz=ZONE_INFO))
+
+        Command().handle()
+
+        appointment.refresh_from_db()
+        message_batch = MessageBatch.objects.get()
+        assert appointment.invitation_batched_at == message_batch.scheduled_at
+
+        Command().handle()
+
+        assert MessageBatch.objects.count() == 1
+        assert Message.objects.filter(appointment=appointment).count() == 1
+
+    def test_handle_with_already_batched_appointments(
+        self, mock_mark_batch_as_sent, mock_send_message_batch
+    ):
+        """Test that appointments already batched are not notified again"""
+        AppointmentFactory(
+            starts_at=datetime.now(tz=ZONE_INFO),
+            invitation_batched_at=datetime.now(tz=ZONE_INFO) - timedelta(days=1),
+        )
+
+        Command().handle()
+
+        assert MessageBatch.objects.count() == 0
+        assert Message.objects.count() == 0
+
+    def test_claim_uses_the_awaiting_invitation_index(
+        self, mock_mark_batch_as_sent, mock_send_message_batch
+    ):
+        AppointmentFactory.create_batch(size=3, starts_at=datetime.now(tz=ZONE_INFO))
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            plan = Appointment.objects.filter(
+                episode_type__in=["F", "G", "S"],
+                starts_at__lte=Command().schedule_date(),
+                invitation_batched_at__isnull=True,
+                status="B",
+                number="1",
+            ).explain()
+
+        assert "notifications_awaiting_idx" in plan
+
+    def test_schedule_window_is_within_the_reports_status_lookback(
+        self, mock_mark_batch_as_sent, mock_send_message_batch
+    ):
+        # The reports skip statuses from more than STATUS_LOOKBACK before
+        # their window, which misses messages sent further ahead than this
+        window = Command().schedule_date() - datetime.now(tz=ZONE_INFO)
+
+        assert window <= STATUS_LOOKBACK
+
     @pytest.mark.parametrize("status_code", [401, 403, 404, 405, 406, 413, 415, 422])
     def test_handle_with_unrecoverable_failures(
         self, mark_batch_as_sent, mock_send_message_batch, status_code
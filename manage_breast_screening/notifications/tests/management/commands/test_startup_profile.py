@@ -0,0 +1,48 @@
+import json
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+
+from manage_breast_screening.notifications.management.commands.helpers.startup_profiler import (
+    StartupProfile,
+)
+
+
+def profile(command):
+    return StartupProfile(
+        command=command,
+        startup_ms=900.0,
+        modules=["django", "mesh_client"],
+        import_ms={"django": 400.0, "mesh_client": 350.0},
+    )
+
+
+@patch(
+    "manage_breast_screening.notifications.management.commands.startup_profile.profile_command",
+    side_effect=profile,
+)
+class TestStartupProfile:
+    def test_profiles_every_notifications_command_by_default(self, mock_profile):
+        call_command("startup_profile", stdout=StringIO())
+
+        commands = [call.args[0] for call in mock_profile.call_args_list]
+        assert "save_message_status" in commands
+        assert "startup_profile" not in commands
+
+    def test_reports_startup_time_and_slowest_imports(self, mock_profile):
+        out = StringIO()
+
+        call_command("startup_profile", "store_mesh_messages", "--top", "1", stdout=out)
+
+        lines = out.getvalue().splitlines()
+        assert lines[0] == "store_mesh_messages: 900ms"
+        assert lines[1].split() == ["400.0ms", "django"]
+        assert "Imported at startup: mesh_client" in lines[2]
+
+    def test_outputs_json(self, mock_profile):
+        out = StringIO()
+
+        call_command("startup_profile", "store_mesh_messages", "--json", stdout=out)
+
+        assert json.loads(out.getvalue())[0]["startup_ms"] == 900.0
@@ -4,7 +4,7 @@ import pytest
 from django.db import connection
 
 from manage_breast_screening.notifications.models import ZONE_INFO, Clinic
-from manage_breast_screening.notifications.queries.helper import Helper
+from manage_breast_screening.notifications.queries.helper import STATUS_LOOKBACK, Helper
 from manage_breast_screening.notifications.tests.factories import (
     AppointmentFactory,
     ChannelStatusFactory,
@@ -118,7 +118,9 @@ class TestAggregateQuery:
             self.create_appointment_set(*d)
 
         for bso_code, expectation in expectations.items():
-            results = Helper.fetchall("aggregate", ["1 month", bso_code])
+            results = Helper.fetchall(
+                "aggregate", ["1 month", STATUS_LOOKBACK, bso_code]
+            )
 
             for idx, res in enumerate(results):
                 assert expectation[idx] == list(res)
@@ -141,7 +143,7 @@ class TestAggregateQuery:
             {"nhsapp": "read"},
         )
 
-        results = Helper.fetchall("aggregate", ["1 week", "BSO1"])
+        results = Helper.fetchall("aggregate", ["1 week", STATUS_LOOKBACK, "BSO1"])
 
         assert len(results) == 1
 
@@ -170,7 +172,7 @@ class TestAggregateQuery:
             status_updated_at=(message_sent_at + timedelta(days=4)),
         )
 
-        results = Helper.fetchall("aggregate", ["1 month", "BSO6"])
+        results = Helper.fetchall("aggregate", ["1 month", STATUS_LOOKBACK, "BSO6"])
 
         assert list(results[0]) == [
             appt_date.strftime("%Y-%m-%d"),
@@ -194,7 +196,7 @@ class TestAggregateQuery:
             status_updated_at=(message_sent_at + timedelta(days=5)),
         )
 
-        results = Helper.fetchall("aggregate", ["1 month", "BSO6"])
+        results = Helper.fetchall("aggregate", ["1 month", STATUS_LOOKBACK, "BSO6"])
 
         assert list(results[0]) == [
             appt_date.strftime("%Y-%m-%d"),
@@ -212,7 +214,10 @@ class TestAggregateQuery:
     @pytest.mark.django_db
     def test_aggregate_columns(self):
         with connection.cursor() as cursor:
-            cursor.execute(Helper.sql("aggregate") + "\nLIMIT 0", ["1 month", "ANY"])
+            cursor.execute(
+                Helper.sql("aggregate") + "\nLIMIT 0",
+                ["1 month", STATUS_LOOKBACK, "ANY"],
+            )
             columns = [col[0] for col in cursor.description]
 
         assert columns == [
@@ -5,7 +5,7 @@ import time_machine
 from django.db import connection
 
 from manage_breast_screening.notifications.models import ZONE_INFO
-from manage_breast_screening.notifications.queries.helper import Helper
+from manage_breast_screening.notifications.queries.helper import STATUS_LOOKBACK, Helper
 from manage_breast_screening.notifications.tests.factories import (
     AppointmentFactory,
     ClinicFactory,
@@ -106,7 +106,7 @@ class TestFailuresQuery:
         today_formatted = datetime.now(tz=ZONE_INFO).strftime("%Y-%m-%d")
 
         results = Helper.fetchall(
-            "failures", [datetime.now(tz=ZONE_INFO).date(), "BSO1"]
+            "failures", [datetime.now(tz=ZONE_INFO).date(), STATUS_LOOKBACK, "BSO1"]
         )
 
         assert len(results) == 7
@@ -207,7 +207,9 @@ class TestFailuresQuery:
             {"status": "failed", "description": "Patient has an exit code"},
         )
 
-        results = Helper.fetchall("failures", [the_date.date(), "BSO1"])
+        results = Helper.fetchall(
+            "failures", [the_date.date(), STATUS_LOOKBACK, "BSO1"]
+        )
 
         assert len(results) == 1
         assert list(results[0])[0] == 9990001111
@@ -249,7 +251,7 @@ class TestFailuresQuery:
         )
 
         results = Helper.fetchall(
-            "failures", [datetime.now(tz=ZONE_INFO).date(), "BSO1"]
+            "failures", [datetime.now(tz=ZONE_INFO).date(), STATUS_LOOKBACK, "BSO1"]
         )
 
         assert len(results) == 2
@@ -259,7 +261,7 @@ class TestFailuresQuery:
         with connection.cursor() as cursor:
             cursor.execute(
                 Helper.sql("failures") + "\nLIMIT 0",
-                [datetime.now(tz=ZONE_INFO).date(), "BSO1"],
+                [datetime.now(tz=ZONE_INFO).date(), STATUS_LOOKBACK, "BSO1"],
             )
             columns = [col[0] for col in cursor.description]
 
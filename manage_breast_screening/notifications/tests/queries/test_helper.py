@@ -0,0 +1,60 @@
+import io
+from datetime import datetime
+
+import pytest
+
+from manage_breast_screening.notifications.models import ZONE_INFO
+from manage_breast_screening.notifications.queries import helper
+from manage_breast_screening.notifications.queries.helper import Helper
+from manage_breast_screening.notifications.tests.factories import (
+    AppointmentFactory,
+    ClinicFactory,
+)
+
+
+@pytest.mark.django_db
+class TestHelper:
+    def test_write_csv_writes_header_and_rows(self):
+        clinic = ClinicFactory(bso_code="MDB", code="BU001")
+        AppointmentFactory.create_batch(size=3, clinic=clinic, episode_type="F")
+
+        file = io.BytesIO()
+        row_count = Helper.write_csv(
+            "reconciliation", [datetime.now(tz=ZONE_INFO).date(), "MDB"], file
+        )
+
+        assert row_count == 1
+        assert file.getvalue() == (
+            b"Clinic code,Episode type,Status,Count\nBU001,F,B,3\n"
+        )
+        assert not file.closed
+
+    def test_write_csv_fetches_rows_in_batches(self, monkeypatch):
+        monkeypatch.setattr(helper, "FETCH_SIZE", 2)
+        for code in ["BU001", "BU002", "BU003", "BU004", "BU005"]:
+            AppointmentFactory(clinic=ClinicFactory(bso_code="MDB", code=code))
+
+        file = io.BytesIO()
+        row_count = Helper.write_csv(
+            "reconciliation", [datetime.now(tz=ZONE_INFO).date(), "MDB"], file
+        )
+
+        header, *rows = file.getvalue().decode().splitlines()
+        assert row_count == 5
+        assert header == "Clinic code,Episode type,Status,Count"
+        assert sorted(rows) == [
+            "BU001,S,B,1",
+            "BU002,S,B,1",
+            "BU003,S,B,1",
+            "BU004,S,B,1",
+            "BU005,S,B,1",
+        ]
+
+    def test_write_csv_writes_header_for_empty_results(self):
+        file = io.BytesIO()
+        row_count = Helper.write_csv(
+            "reconciliation", [datetime.now(tz=ZONE_INFO).date(), "MDB"], file
+        )
+
+        assert row_count == 0
+        assert file.getvalue() == b"Clinic code,Episode type,Status,Count\n"
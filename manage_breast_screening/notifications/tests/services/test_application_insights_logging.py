@@ -1,3 +1,4 @@
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -8,7 +9,7 @@ from manage_breast_screening.notifications.services.application_insights_logging
 
 
 @patch(
-    "manage_breast_screening.notifications.services.application_insights_logging.configure_azure_monitor",
+    "azure.monitor.opentelemetry.configure_azure_monitor",
     return_value=MagicMock(),
 )
 @patch(
@@ -63,10 +64,19 @@ class TestApplicationInsightsLogging:
             "CustomError", stack_info=True
         )
 
-    def test_custom_event(self, mock_logging, mock_configure_azure):
-        ApplicationInsightsLogging().custom_event(
-            "something went wrong", "custom-event"
-        )
+    def test_custom_event_is_emitted_when_flushed(
+        self, mock_logging, mock_configure_azure
+    ):
+        insights_logging = ApplicationInsightsLogging()
+
+        with patch.object(insights_logging, "start_flusher") as mock_start_flusher:
+            insights_logging.custom_event("something went wrong", "custom-event")
+
+        mock_start_flusher.assert_called_once()
+        mock_logging.getLogger.return_value.warning.assert_not_called()
+
+        insights_logging.flush()
+
         mock_logging.getLogger.assert_called_with("insights-logger")
         mock_logging.getLogger.return_value.warning.assert_called_with(
             "something went wrong",
@@ -75,3 +85,83 @@ class TestApplicationInsightsLogging:
                 "additional_attrs": "something went wrong",
             },
         )
+
+    @patch("opentelemetry.metrics.get_meter")
+    def test_metric_is_recorded_when_flushed(
+        self, mock_get_meter, mock_logging, mock_configure_azure
+    ):
+        insights_logging = ApplicationInsightsLogging()
+        histogram = mock_get_meter.return_value.create_histogram.return_value
+
+        with patch.object(insights_logging, "start_flusher"):
+            insights_logging.metric("batch_marked_as_failed", 1, status_code=500)
+            insights_logging.metric("batch_marked_as_failed", 1, status_code=429)
+        insights_logging.flush()
+
+        mock_get_meter.assert_called_once_with("insights-logger")
+        mock_get_meter.return_value.create_histogram.assert_called_once_with(
+            "batch_marked_as_failed"
+        )
+        histogram.record.assert_any_call(1, attributes={"status_code": 500})
+        histogram.record.assert_any_call(1, attributes={"status_code": 429})
+
+    def test_drops_items_when_buffer_is_full(
+        self, mock_logging, mock_configure_azure, monkeypatch
+    ):
+        monkeypatch.setenv("APPLICATIONINSIGHTS_BUFFER_SIZE", "2")
+        insights_logging = ApplicationInsightsLogging()
+
+        with patch.object(insights_logging, "start_flusher"):
+            for i in range(5):
+                insights_logging.custom_event(f"event {i}", "custom-event")
+        insights_logging.flush()
+
+        assert mock_logging.getLogger.return_value.warning.call_count == 2
+        assert insights_logging.dropped == 0
+
+    def test_counts_items_dropped_from_many_threads(
+        self, mock_logging, mock_configure_azure, monkeypatch
+    ):
+        monkeypatch.setenv("APPLICATIONINSIGHTS_BUFFER_SIZE", "1")
+        insights_logging = ApplicationInsightsLogging()
+
+        def send_events():
+            for i in range(500):
+                insights_logging.custom_event(f"event {i}", "custom-event")
+
+        with patch.object(insights_logging, "start_flusher"):
+            threads = [threading.Thread(target=send_events) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert insights_logging.dropped == 8 * 500 - 1
+
+    def test_flushes_in_the_background(
+        self, mock_logging, mock_configure_azure, monkeypatch
+    ):
+        monkeypatch.setenv("APPLICATIONINSIGHTS_FLUSH_SECONDS", "0.01")
+        insights_logging = ApplicationInsightsLogging()
+        warning = mock_logging.getLogger.return_value.warning
+        emitted = threading.Event()
+        warning.side_effect = lambda *args, **kwargs: emitted.set()
+
+        with patch(
+            "manage_breast_screening.notifications.services.application_insights_logging.atexit"
+        ) as mock_atexit:
+            insights_logging.custom_event("something went wrong", "custom-event")
+            insights_logging.custom_event("something else", "custom-event")
+
+        assert emitted.wait(5)
+        mock_atexit.register.assert_called_once_with(insights_logging.flush)
+        assert insights_logging.flusher.daemon
+
+    def test_shared_returns_one_instance(
+        self, mock_logging, mock_configure_azure, monkeypatch
+    ):
+        monkeypatch.setattr(ApplicationInsightsLogging, "_shared", None)
+
+        assert (
+            ApplicationInsightsLogging.shared() is ApplicationInsightsLogging.shared()
+        )
@@ -1,7 +1,7 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
-from azure.core.exceptions import ResourceExistsError
+from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
 from azure.storage.blob import (
     BlobClient,
     ContainerClient,
@@ -12,7 +12,7 @@ from manage_breast_screening.notifications.services.blob_storage import BlobStor
 from manage_breast_screening.notifications.tests.integration.helpers import Helpers
 
 
-@patch("manage_breast_screening.notifications.services.blob_storage.BlobServiceClient")
+@patch("azure.storage.blob.BlobServiceClient")
 class TestBlobStorage:
     @pytest.fixture(autouse=True)
     def setup(self, monkeypatch):
@@ -21,6 +21,15 @@ class TestBlobStorage:
         )
         monkeypatch.setenv("BLOB_CONTAINER_NAME", "test-container")
 
+    def test_shared_clients_reuses_one_client(self, mock_blob_service_client):
+        with BlobStorage.shared_clients():
+            assert BlobStorage().client is BlobStorage().client
+
+        mock_blob_service_client.from_connection_string.assert_called_once()
+        mock_blob_service_client.from_connection_string.return_value.close.assert_called_once()
+        assert BlobStorage().client is not None
+        assert mock_blob_service_client.from_connection_string.call_count == 2
+
     def test_find_or_create_container_can_find_existing_container(
         self, mock_blob_client
     ):
@@ -57,6 +66,7 @@ class TestBlobStorage:
             content_settings=ContentSettings(
                 content_type="application/dat", content_encoding="ASCII"
             ),
+            metadata=None,
             overwrite=True,
         )
 
@@ -84,9 +94,60 @@ class TestBlobStorage:
             content_settings=ContentSettings(
                 content_type="text/csv", content_encoding="ASCII"
             ),
+            metadata=None,
+            overwrite=True,
+        )
+
+    def test_add_blob_to_storage_with_metadata(self, mock_blob_client):
+        mock_container_client = MagicMock(spec=ContainerClient)
+        mock_blob_client = MagicMock(spec=BlobClient)
+        mock_container_client.get_blob_client.return_value = mock_blob_client
+
+        subject = BlobStorage()
+        subject.find_or_create_container = MagicMock(return_value=mock_container_client)
+        subject.add(
+            "test-blob.csv.gz",
+            b"compressed",
+            content_type="text/csv",
+            content_encoding="gzip",
+            metadata={"sha256": "abc123"},
+        )
+
+        mock_blob_client.upload_blob.assert_called_once_with(
+            b"compressed",
+            blob_type="BlockBlob",
+            content_settings=ContentSettings(
+                content_type="text/csv", content_encoding="gzip"
+            ),
+            metadata={"sha256": "abc123"},
             overwrite=True,
         )
 
+    def test_metadata_returns_blob_metadata(self, mock_blob_client):
+        mock_container_client = MagicMock(spec=ContainerClient)
+        mock_blob_client = MagicMock(spec=BlobClient)
+        mock_blob_client.get_blob_properties.return_value.metadata = {"sha256": "abc"}
+        mock_container_client.get_blob_client.return_value = mock_blob_client
+
+        subject = BlobStorage()
+        subject.find_or_create_container = MagicMock(return_value=mock_container_client)
+
+        assert subject.metadata("test-blob", "reports") == {"sha256": "abc"}
+        subject.find_or_create_container.assert_called_once_with("reports")
+        mock_container_client.get_blob_client.assert_called_once_with("test-blob")
+
+    def test_metadata_returns_none_if_blob_does_not_exist(self, mock_blob_client):
+        mock_container_client = MagicMock(spec=ContainerClient)
+        mock_blob_client = MagicMock(spec=BlobClient)
+        mock_blob_client.get_blob_properties.side_effect = ResourceNotFoundError()
+        mock_container_client.get_blob_client.return_value = mock_blob_client
+
+        subject = BlobStorage()
+        subject.find_or_create_container = MagicMock(return_value=mock_container_client)
+
+        assert subject.metadata("test-blob") is None
+        subject.find_or_create_container.assert_called_once_with("test-container")
+
     def test_blob_storage_initialises_using_managed_identity_credentials(
         self, mock_blob_client, monkeypatch
     ):
@@ -94,11 +155,9 @@ class TestBlobStorage:
         monkeypatch.setenv("BLOB_MI_CLIENT_ID", "my-mi-id")
         mock_mi_cred = MagicMock()
 
-        with patch(
-            "manage_breast_screening.notifications.services.blob_storage.BlobServiceClient"
-        ) as blob_client:
+        with patch("azure.storage.blob.BlobServiceClient") as blob_client:
             with patch(
-                "manage_breast_screening.notifications.services.blob_storage.ManagedIdentityCredential"
+                "azure.identity.ManagedIdentityCredential"
             ) as managed_identity_constructor:
                 managed_identity_constructor.return_value = mock_mi_cred
 
@@ -0,0 +1,45 @@
+import gzip
+import hashlib
+import io
+
+import pytest
+import zstandard
+
+from manage_breast_screening.notifications.services import compression
+
+
+class TestCompression:
+    @pytest.fixture
+    def content(self):
+        return b"Clinic code,Episode type,Status,Count\n" * 1000
+
+    def test_compress_gzip(self, content):
+        destination = io.BytesIO()
+        compression.compress(io.BytesIO(content), destination, "gzip")
+
+        assert gzip.decompress(destination.getvalue()) == content
+        assert len(destination.getvalue()) < len(content)
+
+    def test_compress_gzip_is_deterministic(self, content):
+        first, second = io.BytesIO(), io.BytesIO()
+        compression.compress(io.BytesIO(content), first, "gzip")
+        compression.compress(io.BytesIO(content), second, "gzip")
+
+        assert first.getvalue() == second.getvalue()
+
+    def test_compress_zstd(self, content):
+        destination = io.BytesIO()
+        compression.compress(io.BytesIO(content), destination, "zstd")
+
+        decompressor = zstandard.ZstdDecompressor().decompressobj()
+        assert decompressor.decompress(destination.getvalue()) == content
+
+    def test_unsupported_compression(self):
+        with pytest.raises(compression.CompressionConfigurationError):
+            compression.compress(io.BytesIO(b""), io.BytesIO(), "lz4")
+
+    def test_sha256_reads_from_the_start(self, content):
+        source = io.BytesIO(content)
+        source.seek(10)
+
+        assert compression.sha256(source) == hashlib.sha256(content).hexdigest()
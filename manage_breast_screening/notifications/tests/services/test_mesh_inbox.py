@@ -6,7 +6,7 @@ from mesh_client import INT_ENDPOINT, LIVE_ENDPOINT
 from manage_breast_screening.notifications.services.mesh_inbox import MeshInbox
 
 
-@patch("manage_breast_screening.notifications.services.mesh_inbox.MeshClient")
+@patch("mesh_client.MeshClient")
 class TestMeshInbox:
     @pytest.fixture(autouse=True)
     def setup(self, monkeypatch):
@@ -21,13 +21,17 @@ class TestNhsMail:
         monkeypatch.setenv("DJANGO_ENV", "test")
 
     @pytest.fixture()
-    def mock_smtp_server(self):
+    def mock_smtp(self):
         mock_smtp = MagicMock(name="mock_smtp")
         with patch(
             "manage_breast_screening.notifications.services.nhs_mail.SMTP",
             new=mock_smtp,
         ) as smtp:
-            yield smtp.return_value.__enter__.return_value
+            yield smtp
+
+    @pytest.fixture()
+    def mock_smtp_server(self, mock_smtp):
+        return mock_smtp.return_value
 
     @pytest.fixture
     def csv_data(self):
@@ -145,3 +149,53 @@ class TestNhsMail:
             "Breast screening digital comms invites not sent report – 11-10-2025 – Birmingham (MCR)"
             in decoded_subject_line
         )
+
+    def test_closes_the_connection_after_each_email_outside_a_session(
+        self, mock_smtp, mock_smtp_server, csv_data
+    ):
+        subject = NhsMail()
+        subject.send_report_email(csv_data, "filename.csv", "aggregate")
+        subject.send_report_email(csv_data, "filename.csv", "reconciliation")
+
+        assert mock_smtp.call_count == 2
+        assert mock_smtp_server.login.call_count == 2
+        assert mock_smtp_server.quit.call_count == 2
+
+    def test_reuses_one_connection_within_a_session(
+        self, mock_smtp, mock_smtp_server, csv_data
+    ):
+        with NhsMail() as subject:
+            subject.send_report_email(csv_data, "filename.csv", "aggregate")
+            subject.send_report_email(csv_data, "filename.csv", "reconciliation")
+            subject.send_report_email(csv_data, "filename.csv", "invites_not_sent")
+
+            mock_smtp_server.quit.assert_not_called()
+
+        mock_smtp.assert_called_once_with("smtp.office365.com", 587)
+        mock_smtp_server.starttls.assert_called_once()
+        mock_smtp_server.login.assert_called_once_with("sender@nhsmail.net", "password")
+        assert mock_smtp_server.sendmail.call_count == 3
+        mock_smtp_server.quit.assert_called_once()
+
+    def test_session_does_not_connect_if_nothing_is_sent(self, mock_smtp):
+        with NhsMail():
+            pass
+
+        mock_smtp.assert_not_called()
+
+    def test_reconnects_if_the_server_drops_the_connection(self, mock_smtp, csv_data):
+        dropped_server = MagicMock(name="dropped_server")
+        dropped_server.sendmail.side_effect = smtplib.SMTPServerDisconnected
+        dropped_server.quit.side_effect = smtplib.SMTPServerDisconnected
+        new_server = MagicMock(name="new_server")
+        mock_smtp.side_effect = [dropped_server, new_server]
+
+        with NhsMail() as subject:
+            subject.send_report_email(csv_data, "filename.csv", "aggregate")
+
+        assert mock_smtp.call_count == 2
+        dropped_server.close.assert_called_once()
+        new_server.login.assert_called_once_with("sender@nhsmail.net", "password")
+        new_server.sendmail.assert_called_once_with(
+            "sender@nhsmail.net", ["recipient@nhsmail.net"], ANY
+        )
@@ -15,17 +15,13 @@ class TestQueue:
 
     @pytest.fixture
     def mock_queue_client(self):
-        with patch(
-            "manage_breast_screening.notifications.services.queue.QueueClient"
-        ) as queue_client:
+        with patch("azure.storage.queue.QueueClient") as queue_client:
             mock_client = MagicMock()
             queue_client.from_connection_string.return_value = mock_client
             yield mock_client
 
     def test_queue_is_created(self):
-        with patch(
-            "manage_breast_screening.notifications.services.queue.QueueClient"
-        ) as queue_client:
+        with patch("azure.storage.queue.QueueClient") as queue_client:
             mock_client = MagicMock()
             queue_client.from_connection_string.return_value = mock_client
 
@@ -36,15 +32,21 @@ class TestQueue:
             )
             mock_client.create_queue.assert_called_once()
 
+    def test_shared_clients_reuses_one_client_per_queue(self, mock_queue_client):
+        with Queue.shared_clients():
+            assert Queue("a-queue").client is Queue("a-queue").client
+            Queue("another-queue")
+
+        assert mock_queue_client.create_queue.call_count == 2
+        assert mock_queue_client.close.call_count == 2
+
     def test_add_to_queue(self, mock_queue_client):
         Queue("new-queue").add("a message")
 
         mock_queue_client.send_message.assert_called_once_with("a message")
 
     def test_message_status_updates_queue(self):
-        with patch(
-            "manage_breast_screening.notifications.services.queue.QueueClient"
-        ) as queue_client:
+        with patch("azure.storage.queue.QueueClient") as queue_client:
             mock_client = MagicMock()
             queue_client.from_connection_string.return_value = mock_client
 
@@ -57,9 +59,7 @@ class TestQueue:
             mock_client.send_message.assert_called_once_with("some data")
 
     def test_failed_message_batches_queue(self):
-        with patch(
-            "manage_breast_screening.notifications.services.queue.QueueClient"
-        ) as queue_client:
+        with patch("azure.storage.queue.QueueClient") as queue_client:
             mock_client = MagicMock()
             queue_client.from_connection_string.return_value = mock_client
 
@@ -95,11 +95,9 @@ class TestQueue:
         monkeypatch.setenv("QUEUE_MI_CLIENT_ID", "my-mi-id")
         mock_mi_cred = MagicMock()
 
-        with patch(
-            "manage_breast_screening.notifications.services.queue.QueueClient"
-        ) as queue_client:
+        with patch("azure.storage.queue.QueueClient") as queue_client:
             with patch(
-                "manage_breast_screening.notifications.services.queue.ManagedIdentityCredential"
+                "azure.identity.ManagedIdentityCredential"
             ) as managed_identity_constructor:
                 managed_identity_constructor.return_value = mock_mi_cred
 
@@ -116,9 +114,7 @@ class TestQueue:
 
     def test_update_queue_prefers_queue_name_from_env(self, monkeypatch):
         monkeypatch.setenv("STATUS_UPDATES_QUEUE_NAME", "updates")
-        with patch(
-            "manage_breast_screening.notifications.services.queue.QueueClient"
-        ) as queue_client:
+        with patch("azure.storage.queue.QueueClient") as queue_client:
             mock_client = MagicMock()
             queue_client.from_connection_string.return_value = mock_client
 
@@ -130,9 +126,7 @@ class TestQueue:
 
     def test_retry_queue_prefers_queue_name_from_env(self, monkeypatch):
         monkeypatch.setenv("RETRY_QUEUE_NAME", "retries")
-        with patch(
-            "manage_breast_screening.notifications.services.queue.QueueClient"
-        ) as queue_client:
+        with patch("azure.storage.queue.QueueClient") as queue_client:
             Queue.RetryMessageBatches()
 
             queue_client.from_connection_string.assert_called_once_with(
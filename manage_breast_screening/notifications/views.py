@@ -26,7 +26,7 @@ def create_message_status(request):
     valid, message = RequestValidator(request).valid()
 
     if not valid:
-        ApplicationInsightsLogging().exception(
+        ApplicationInsightsLogging.shared().exception(
             (f"Request validation failed: {message}")
         )
         return JsonResponse({"error": {"message": message}}, status=400)
@@ -36,12 +36,12 @@ def create_message_status(request):
 
     except QueueConfigurationError as e:
         error_msg = "Queue service not configured. Check QUEUE_STORAGE_CONNECTION_STRING or STORAGE_ACCOUNT_NAME/QUEUE_MI_CLIENT_ID environment variables."
-        ApplicationInsightsLogging().exception(f"Queue configuration error: {e}")
+        ApplicationInsightsLogging.shared().exception(f"Queue configuration error: {e}")
         return JsonResponse({"error": {"message": error_msg}}, status=500)
 
     except Exception as e:
         error_msg = f"Failed to queue message status update: {str(e)}"
-        ApplicationInsightsLogging().exception(error_msg)
+        ApplicationInsightsLogging.shared().exception(error_msg)
         return JsonResponse(
             {"error": {"message": "Internal server error processing request"}},
             status=500,
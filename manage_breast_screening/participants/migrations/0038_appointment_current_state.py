@@ -0,0 +1,43 @@
+# Generated by Django 5.2.7 on 2026-10-19 11:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clinics', '0018_userassignment_roles'),
+        ('participants', '0037_otherprocedurehistoryitem'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='appointment',
+            name='current_state',
+            field=models.CharField(default='CONFIRMED', editable=False, max_length=50),
+        ),
+        migrations.AddField(
+            model_name='appointment',
+            name='latest_status',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='participants.appointmentstatus'),
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['clinic_slot', 'current_state'], name='participant_clinic__1136e7_idx'),
+        ),
+        # Record each appointment's most recent status
+        migrations.RunSQL(
+            """
+            UPDATE participants_appointment appointment
+            SET latest_status_id = latest.id, current_state = latest.state
+            FROM (
+                SELECT DISTINCT ON (appointment_id) id, appointment_id, state
+                FROM participants_appointmentstatus
+                ORDER BY appointment_id, created_at DESC
+            ) latest
+            WHERE latest.appointment_id = appointment.id
+            """,
+            migrations.RunSQL.noop,
+        ),
+    ]
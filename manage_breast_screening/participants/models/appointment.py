@@ -2,12 +2,14 @@ import uuid
 from datetime import date
 from logging import getLogger
 
-from django.db import models
-from django.db.models import OuterRef, Prefetch, Subquery
+from django.db import models, transaction
+from django.db.models import Count, Q
 
 from manage_breast_screening.users.models import User
 
+from ...core.fragment_cache import expire_fragments
 from ...core.models import BaseModel
+from ...core.utils.pagination import KeysetPage, keyset_page
 from .screening_episode import ScreeningEpisode
 
 logger = getLogger(__name__)
@@ -15,37 +17,30 @@ logger = getLogger(__name__)
 
 class AppointmentQuerySet(models.QuerySet):
     def in_status(self, *statuses):
-        return self.filter(
-            statuses=Subquery(
-                AppointmentStatus.objects.filter(
-                    appointment=OuterRef("pk"),
-                    state__in=statuses,
-                )
-                .values("pk")
-                .order_by("-created_at")[:1]
-            )
-        )
+        return self.filter(current_state__in=statuses)
 
     def remaining(self):
-        return self.in_status(
-            AppointmentStatus.CONFIRMED,
-            AppointmentStatus.CHECKED_IN,
-            AppointmentStatus.IN_PROGRESS,
-        )
+        return self.in_status(*FILTER_STATES["remaining"])
 
     def checked_in(self):
-        return self.in_status(AppointmentStatus.CHECKED_IN)
+        return self.in_status(*FILTER_STATES["checked_in"])
 
     def in_progress(self):
-        return self.in_status(AppointmentStatus.IN_PROGRESS)
+        return self.in_status(*FILTER_STATES["in_progress"])
 
     def complete(self):
-        return self.in_status(
-            AppointmentStatus.CANCELLED,
-            AppointmentStatus.DID_NOT_ATTEND,
-            AppointmentStatus.SCREENED,
-            AppointmentStatus.PARTIALLY_SCREENED,
-            AppointmentStatus.ATTENDED_NOT_SCREENED,
+        return self.in_status(*FILTER_STATES["complete"])
+
+    def filter_counts(self) -> dict[str, int]:
+        """
+        The number of appointments matching each filter, counted in one query
+        """
+        return self.aggregate(
+            all=Count("pk"),
+            **{
+                filter: Count("pk", filter=Q(current_state__in=states))
+                for filter, states in FILTER_STATES.items()
+            },
         )
 
     def upcoming(self):
@@ -74,17 +69,38 @@ class AppointmentQuerySet(models.QuerySet):
             "-clinic_slot__starts_at" if desc else "clinic_slot__starts_at"
         )
 
-    def prefetch_current_status(self):
-        return self.prefetch_related(
-            Prefetch(
-                "statuses",
-                queryset=AppointmentStatus.objects.select_related(
-                    "created_by"
-                ).order_by("-created_at")[:1],  # Limit to most recent
-                to_attr="_prefetched_current_status",  # Store in named attribute
-            )
+    def page(self, after=None, before=None, size=None, desc=False) -> KeysetPage:
+        """
+        A page of appointments ordered by start time, after or before a cursor
+        """
+        return keyset_page(
+            self,
+            "clinic_slot__starts_at",
+            after=after,
+            before=before,
+            size=size,
+            desc=desc,
         )
 
+    def expire_clinic_fragments(self):
+        """
+        Expire the cached appointment rows of these appointments' clinics,
+        see clinics/show.jinja
+        """
+        expire_fragments(
+            "clinic",
+            *self.order_by()
+            .values_list("clinic_slot__clinic_id", flat=True)
+            .distinct(),
+        )
+
+    def prefetch_current_status(self):
+        """
+        Load each appointment's current status, and who created it, in the
+        same query as the appointments
+        """
+        return self.select_related("latest_status__created_by")
+
 
 class Appointment(BaseModel):
     objects = AppointmentQuerySet.as_manager()
@@ -97,12 +113,29 @@ class Appointment(BaseModel):
     reinvite = models.BooleanField(default=False)
     stopped_reasons = models.JSONField(null=True, blank=True)
 
+    # The most recent status and its state, maintained by AppointmentStatus.save()
+    # so that appointments can be filtered by state without a subquery.
+    # Appointments without any statuses are treated as confirmed.
+    latest_status = models.ForeignKey(
+        "participants.AppointmentStatus",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+    )
+    current_state = models.CharField(max_length=50, default="CONFIRMED", editable=False)
+
+    class Meta:
+        indexes = [models.Index(fields=["clinic_slot", "current_state"])]
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        Appointment.objects.filter(pk=self.pk).expire_clinic_fragments()
+
     @classmethod
     def filter_counts_for_clinic(cls, clinic):
-        counts = {}
-        for filter in ["remaining", "checked_in", "in_progress", "complete", "all"]:
-            counts[filter] = clinic.appointments.for_filter(filter).count()
-        return counts
+        return clinic.appointments.filter_counts()
 
     @property
     def provider(self):
@@ -115,23 +148,17 @@ class Appointment(BaseModel):
     @property
     def current_status(self) -> "AppointmentStatus":
         """
-        Fetch the most recent status associated with this appointment.
-        Check if a prefetched status is available, otherwise do a query.
+        The most recent status associated with this appointment, which is
+        loaded with the appointment by prefetch_current_status() and
+        otherwise queried.
         If there are no statuses for any reason, assume the default one.
         """
-        prefetched_current_status = getattr(self, "_prefetched_current_status", None)
-        if prefetched_current_status:
-            return prefetched_current_status[0]
-
-        statuses = list(self.statuses.order_by("-created_at").all())
-        if not statuses:
-            status = AppointmentStatus()
-            logger.info(
-                f"Appointment {self.pk} has no statuses. Assuming {status.state}"
-            )
-            return status
+        if self.latest_status_id:
+            return self.latest_status
 
-        return statuses[0]
+        status = AppointmentStatus()
+        logger.info(f"Appointment {self.pk} has no statuses. Assuming {status.state}")
+        return status
 
     @property
     def active(self):
@@ -195,3 +222,55 @@ class AppointmentStatus(models.Model):
 
     def __str__(self):
         return self.state
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            self.record_latest()
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            self.record_latest()
+        return result
+
+    def record_latest(self):
+        """
+        Record the most recent status of this status's appointment on the
+        appointment. Locking the appointment first serialises concurrent
+        status changes, so the most recent status always wins.
+        """
+        appointments = Appointment.objects.filter(pk=self.appointment_id)
+        appointments.select_for_update().values("pk").first()
+
+        latest = (
+            AppointmentStatus.objects.filter(appointment_id=self.appointment_id)
+            .order_by("-created_at")
+            .first()
+        )
+        current_state = latest.state if latest else AppointmentStatus.CONFIRMED
+        appointments.update(latest_status=latest, current_state=current_state)
+        appointments.expire_clinic_fragments()
+
+        if AppointmentStatus.appointment.is_cached(self):
+            self.appointment.latest_status = latest
+            self.appointment.current_state = current_state
+
+
+# Appointment filter -> the current states of the appointments it includes
+FILTER_STATES = {
+    "remaining": (
+        AppointmentStatus.CONFIRMED,
+        AppointmentStatus.CHECKED_IN,
+        AppointmentStatus.IN_PROGRESS,
+    ),
+    "checked_in": (AppointmentStatus.CHECKED_IN,),
+    "in_progress": (AppointmentStatus.IN_PROGRESS,),
+    "complete": (
+        AppointmentStatus.CANCELLED,
+        AppointmentStatus.DID_NOT_ATTEND,
+        AppointmentStatus.SCREENED,
+        AppointmentStatus.PARTIALLY_SCREENED,
+        AppointmentStatus.ATTENDED_NOT_SCREENED,
+    ),
+}
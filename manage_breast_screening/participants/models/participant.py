@@ -27,6 +27,12 @@ class Participant(BaseModel):
     risk_level = models.TextField()
     extra_needs = models.JSONField(null=False, default=list, blank=True)
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Participants' names, dates of birth and extra needs are shown in
+        # their clinics' appointment lists
+        self.appointments.expire_clinic_fragments()
+
     @property
     def appointments(self):
         return Appointment.objects.filter(screening_episode__participant=self)
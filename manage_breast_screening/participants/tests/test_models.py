@@ -182,7 +182,7 @@ class TestAppointment:
             ordered=False,
         )
 
-    def test_filter_counts_for_clinic(self):
+    def test_filter_counts_for_clinic(self, django_assert_num_queries):
         # Create a clinic and clinic slots
         clinic = ClinicFactory.create()
         clinic_slot1 = ClinicSlotFactory.create(clinic=clinic)
@@ -212,13 +212,35 @@ class TestAppointment:
             clinic_slot=other_slot, current_status=models.AppointmentStatus.CONFIRMED
         )
 
-        counts = models.Appointment.filter_counts_for_clinic(clinic)
+        with django_assert_num_queries(1):
+            counts = models.Appointment.filter_counts_for_clinic(clinic)
 
         assert counts["remaining"] == 3
         assert counts["checked_in"] == 1
         assert counts["complete"] == 2
         assert counts["all"] == 5
 
+    def test_filters_use_the_most_recent_status(self):
+        appointment = AppointmentFactory.create(
+            current_status=models.AppointmentStatus.CONFIRMED
+        )
+        appointment.statuses.create(state=models.AppointmentStatus.CHECKED_IN)
+        appointment.statuses.create(state=models.AppointmentStatus.SCREENED)
+        without_statuses = AppointmentFactory.create()
+
+        assertQuerySetEqual(
+            models.Appointment.objects.remaining(), {without_statuses}, ordered=False
+        )
+        assertQuerySetEqual(models.Appointment.objects.checked_in(), [])
+        assertQuerySetEqual(models.Appointment.objects.complete(), {appointment})
+        assert models.Appointment.objects.filter_counts() == {
+            "remaining": 1,
+            "checked_in": 0,
+            "in_progress": 0,
+            "complete": 1,
+            "all": 2,
+        }
+
     def test_order_by_starts_at(self):
         early = AppointmentFactory.create(
             starts_at=datetime(2025, 1, 1, 9, tzinfo=tz.utc)
@@ -240,6 +262,30 @@ class TestAppointment:
             [late, middle, early],
         )
 
+    def test_page(self):
+        early = AppointmentFactory.create(
+            starts_at=datetime(2025, 1, 1, 9, tzinfo=tz.utc)
+        )
+        middle = AppointmentFactory.create(
+            starts_at=datetime(2025, 1, 2, 10, tzinfo=tz.utc)
+        )
+        late = AppointmentFactory.create(
+            starts_at=datetime(2025, 1, 3, 14, tzinfo=tz.utc)
+        )
+
+        first = models.Appointment.objects.page(size=2)
+        assert list(first) == [early, middle]
+        assert first.previous_cursor is None
+
+        second = models.Appointment.objects.page(after=first.next_cursor, size=2)
+        assert list(second) == [late]
+        assert second.next_cursor is None
+
+        previous = models.Appointment.objects.page(
+            before=second.previous_cursor, size=2
+        )
+        assert list(previous) == [early, middle]
+
     @pytest.mark.django_db
     class TestEagerLoadCurrentStatus:
         def test_eager_loads_most_recent_status_with_created_by(
@@ -271,12 +317,57 @@ class TestAppointment:
                 )
             )
 
-            prefetched_status = appointment_with_status._prefetched_current_status[0]
-            assert prefetched_status == latest_status
-            # Verify no additional queries when accessing created_by
+            # Verify no additional queries when accessing the status or created_by
             with django_assert_num_queries(0):
+                prefetched_status = appointment_with_status.current_status
                 assert prefetched_status.created_by is not None
                 prefetched_status.created_by.nhs_uid
+            assert prefetched_status == latest_status
+
+        def test_loads_every_appointments_current_status_in_one_query(
+            self, django_assert_num_queries
+        ):
+            clinic_slot = ClinicSlotFactory.create()
+            histories = [
+                [models.AppointmentStatus.CONFIRMED],
+                [
+                    models.AppointmentStatus.CONFIRMED,
+                    models.AppointmentStatus.CHECKED_IN,
+                ],
+                [
+                    models.AppointmentStatus.CONFIRMED,
+                    models.AppointmentStatus.CHECKED_IN,
+                    models.AppointmentStatus.IN_PROGRESS,
+                    models.AppointmentStatus.SCREENED,
+                ],
+                [],
+            ]
+            expected = {}
+            for i in range(40):
+                appointment = AppointmentFactory.create(clinic_slot=clinic_slot)
+                history = histories[i % len(histories)]
+                for state in history:
+                    AppointmentStatusFactory.create(
+                        appointment=appointment, state=state
+                    )
+                expected[appointment.pk] = (
+                    history[-1] if history else models.AppointmentStatus.CONFIRMED
+                )
+
+            with django_assert_num_queries(1):
+                appointments = list(
+                    models.Appointment.objects.filter(
+                        clinic_slot=clinic_slot
+                    ).prefetch_current_status()
+                )
+                current_states = {
+                    appointment.pk: appointment.current_status.state
+                    for appointment in appointments
+                }
+                for appointment in appointments:
+                    appointment.current_status.created_by
+
+            assert current_states == expected
 
     @pytest.mark.django_db
     class TestCurrentStatus:
@@ -329,7 +420,35 @@ class TestAppointment:
             )
 
 
+@pytest.mark.django_db
 class TestAppointmentStatus:
+    def test_records_the_most_recent_status_on_the_appointment(self):
+        appointment = AppointmentFactory.create()
+        in_progress = AppointmentStatusFactory.create(
+            appointment=appointment,
+            state=models.AppointmentStatus.IN_PROGRESS,
+            created_at=datetime(2025, 1, 1, 9, tzinfo=tz.utc),
+        )
+        AppointmentStatusFactory.create(
+            appointment=appointment,
+            state=models.AppointmentStatus.CHECKED_IN,
+            created_at=datetime(2025, 1, 1, 8, tzinfo=tz.utc),
+        )
+
+        appointment.refresh_from_db()
+        assert appointment.latest_status == in_progress
+        assert appointment.current_state == models.AppointmentStatus.IN_PROGRESS
+
+    def test_deleting_a_status_records_the_previous_one(self):
+        appointment = AppointmentFactory.create(
+            current_status=models.AppointmentStatus.CONFIRMED
+        )
+        appointment.statuses.create(state=models.AppointmentStatus.CHECKED_IN).delete()
+
+        appointment.refresh_from_db()
+        assert appointment.current_state == models.AppointmentStatus.CONFIRMED
+        assert appointment.latest_status.state == models.AppointmentStatus.CONFIRMED
+
     class TestActive:
         def test_active_states_return_true(self):
             assert AppointmentStatus(state=AppointmentStatus.CONFIRMED).active
@@ -4,6 +4,7 @@ from django.urls import reverse
 from manage_breast_screening.participants.tests.factories import (
     AppointmentFactory,
     ParticipantFactory,
+    ParticipantReportedMammogramFactory,
 )
 
 
@@ -20,3 +21,22 @@ class TestShowParticipant:
             reverse("participants:show", kwargs={"pk": participant.pk}),
         )
         assert response.status_code == 200
+
+    def test_repeat_requests_are_not_modified_until_a_mammogram_is_reported(
+        self, clinical_user_client
+    ):
+        participant = ParticipantFactory.create()
+        AppointmentFactory.create(
+            screening_episode__participant=participant,
+            clinic_slot__clinic__setting__provider=clinical_user_client.current_provider,
+        )
+        url = reverse("participants:show", kwargs={"pk": participant.pk})
+        etag = clinical_user_client.http.get(url)["ETag"]
+
+        response = clinical_user_client.http.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        ParticipantReportedMammogramFactory.create(participant=participant)
+
+        response = clinical_user_client.http.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
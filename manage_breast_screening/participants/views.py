@@ -1,10 +1,12 @@
 from logging import getLogger
 from urllib.parse import urlparse
 
+from django.db.models import Count, Max
 from django.http import Http404
 from django.shortcuts import redirect, render
 from django.urls import reverse
 
+from manage_breast_screening.core.conditional_get import conditional_page
 from manage_breast_screening.mammograms.presenters import LastKnownMammogramPresenter
 from manage_breast_screening.participants.services import fetch_most_recent_provider
 
@@ -32,6 +34,26 @@ def parse_return_url(request, default: str) -> str:
     return return_url
 
 
+def participant_fingerprint(request, pk):
+    appointment = "screeningepisode__appointment"
+    provider = request.user.current_provider
+    version = Participant.objects.filter(
+        pk=pk, pk__in=provider.participants.values("pk")
+    ).aggregate(
+        latest_participant=Max("updated_at"),
+        latest_appointments=Max(f"{appointment}__updated_at"),
+        appointment_count=Count(appointment, distinct=True),
+        latest_appointment_statuses=Max(f"{appointment}__latest_status__created_at"),
+        latest_clinic_slots=Max(f"{appointment}__clinic_slot__updated_at"),
+        latest_clinics=Max(f"{appointment}__clinic_slot__clinic__updated_at"),
+        latest_settings=Max(f"{appointment}__clinic_slot__clinic__setting__updated_at"),
+        latest_mammograms=Max("reported_mammograms__updated_at"),
+        mammogram_count=Count("reported_mammograms", distinct=True),
+    )
+    return version if version["latest_participant"] else None
+
+
+@conditional_page(participant_fingerprint)
 def show(request, pk):
     provider = request.user.current_provider
     try:
@@ -40,9 +62,11 @@ def show(request, pk):
         raise Http404("Participant not found")
     presented_participant = ParticipantPresenter(participant)
 
-    appointments = participant.appointments.order_by_starts_at(
-        desc=True
-    ).select_related("clinic_slot__clinic__setting")
+    appointments = (
+        participant.appointments.order_by_starts_at(desc=True)
+        .select_related("clinic_slot__clinic__setting")
+        .prefetch_current_status()
+    )
 
     presented_appointments = ParticipantAppointmentsPresenter(
         past_appointments=list(appointments.past()),
@@ -44,6 +44,33 @@ class User(AbstractBaseUser):
     def current_provider(self, provider):
         self._current_provider = provider
 
+    @property
+    def roles_by_provider(self) -> dict:
+        """
+        The roles the user has for each provider they are assigned to.
+        These are loaded once per user instance, which means once per request,
+        and shared by permission checks and the page header.
+        """
+        if "_roles_by_provider" not in self.__dict__:
+            self._roles_by_provider = {
+                provider_id: frozenset(roles)
+                for provider_id, roles in self.assignments.values_list(
+                    "provider_id", "roles"
+                )
+            }
+        return self._roles_by_provider
+
+    @property
+    def current_roles(self) -> frozenset[str]:
+        """The roles the user has for the current provider"""
+        provider = self.current_provider
+        if not provider:
+            return frozenset()
+        return self.roles_by_provider.get(provider.pk, frozenset())
+
+    def invalidate_roles(self):
+        self.__dict__.pop("_roles_by_provider", None)
+
     def get_session_auth_hash(self):
         """
         Override this method in AbstractBaseUser. It's purpose is to invalidate